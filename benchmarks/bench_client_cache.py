@@ -0,0 +1,62 @@
+"""Micro-benchmark: fresh boto3 client per call vs cached client.
+
+Measures the per-call cost the old `_get_*_client()` helpers paid on every
+S3/Glue operation, against `aws_clients.get_client()`.
+
+Usage:
+    uv run python benchmarks/bench_client_cache.py
+"""
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src import config
+from src.aws_clients import clear_client_cache, get_client
+
+
+def fresh_client(service: str):
+    """Create a client the way the old helpers did."""
+    import boto3
+    return boto3.client(
+        service,
+        aws_access_key_id=config.AWS_ACCESS_KEY_ID,
+        aws_secret_access_key=config.AWS_SECRET_ACCESS_KEY,
+        region_name=config.AWS_REGION
+    )
+
+
+def time_calls(fn, service: str, iterations: int) -> list[float]:
+    """Return per-call latencies in milliseconds."""
+    latencies = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn(service)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def main() -> None:
+    """Compare client creation latency for S3 and Glue."""
+    iterations = 50
+
+    start = time.perf_counter()
+    import boto3  # noqa: F401
+    print(f"⏱️  boto3 import: {(time.perf_counter() - start) * 1000:.1f} ms (paid once, lazily)\n")
+
+    for service in ['s3', 'glue']:
+        clear_client_cache()
+        fresh = time_calls(fresh_client, service, iterations)
+        cached = time_calls(get_client, service, iterations)
+
+        print(f"📊 {service} ({iterations} calls)")
+        print(f"   fresh client:  median {statistics.median(fresh):8.3f} ms")
+        print(f"   cached client: median {statistics.median(cached):8.3f} ms "
+              f"(first call {cached[0]:.1f} ms)")
+        print(f"   speedup:       {statistics.median(fresh) / statistics.median(cached):,.0f}x\n")
+
+
+if __name__ == '__main__':
+    main()
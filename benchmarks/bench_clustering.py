@@ -0,0 +1,56 @@
+"""Row-group pruning with and without clustering.
+
+Writes an entity twice (CSV order vs sorted on its cluster keys) with
+~20 row groups each, then reports how many row groups a sample
+predicate on the leading sort key can skip via min/max statistics.
+
+Usage:
+    uv run python benchmarks/bench_clustering.py [entity]
+"""
+import dataclasses
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from src import config
+from src.clustering import CLUSTER_KEYS, pruning_report
+from src.parquet_profiles import DEFAULT_PROFILE
+from src.parquet_transformer import csv_to_parquet
+from src.schemas import get_schema
+
+
+def sample_value(parquet_path: Path, column: str):
+    """Pick the 90th-percentile value of column as a selective predicate."""
+    values = pc.drop_null(pq.read_table(parquet_path, columns=[column])[column]).to_pylist()
+    return sorted(values)[int(len(values) * 0.9)]
+
+
+def main() -> None:
+    """Compare pruning for CSV-ordered vs clustered output."""
+    entity = sys.argv[1] if len(sys.argv) > 1 else 'transactions'
+    csv_path = config.RAW_DATA_DIR / f'finanzas_{entity}.csv'
+    keys = CLUSTER_KEYS[entity]
+    rows = sum(1 for _ in open(csv_path)) - 1
+    profile = dataclasses.replace(DEFAULT_PROFILE, row_group_size=max(rows // 20, 1))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        unsorted_path = Path(tmp) / 'unsorted.parquet'
+        clustered_path = Path(tmp) / 'clustered.parquet'
+        csv_to_parquet(csv_path, unsorted_path, schema=get_schema(entity), profile=profile)
+        csv_to_parquet(csv_path, clustered_path, schema=get_schema(entity), profile=profile, cluster_keys=keys)
+
+        value = sample_value(unsorted_path, keys[0])
+        print(f"\n🔎 {entity}: {keys[0]} >= {value!r}  (cluster keys: {keys})\n")
+        for label, path in [('CSV order', unsorted_path), ('clustered', clustered_path)]:
+            report = pruning_report(path, keys[0], '>=', value)
+            print(f"   {label:<10} pruned {report['row_groups_pruned']:>3}/{report['row_groups']} row groups, "
+                  f"scans {report['bytes_scanned']:,}/{report['bytes_total']:,} B")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,279 @@
+"""End-to-end benchmark of the transform and transfer hot paths.
+
+For each data size (10MB … 10GB of fixed-seed synthetic transactions):
+- csv_to_parquet throughput (rows/s, MB/s of CSV) and peak RSS for every
+  writer profile, in-memory and streaming. Each conversion runs in a fresh
+  process so peak RSS is that conversion's alone; in-memory conversion is
+  skipped above --max-in-memory (it would need several times the CSV in RAM).
+- Upload throughput of the CSV and the Parquet output to a local S3
+  stand-in: AWS_ENDPOINT_URL if set (MinIO, LocalStack, moto_server),
+  otherwise an in-process moto server when moto is installed.
+- Local query latency (query_engine) on the Parquet output, median of
+  --repeat runs.
+
+Synthetic CSVs are cached in data/benchmarks/synthetic/ (same seed and
+size → same file), results are saved to data/benchmarks/pipeline_*.json.
+
+Usage:
+    uv run python benchmarks/bench_pipeline.py [--sizes 10MB,100MB,1GB,10GB] [--seed 42]
+        [--no-upload] [--repeat 3] [--max-in-memory 1GB]
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pyarrow as pa
+import pyarrow.csv as pv
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from src import config, query_engine
+from src.data_generator import generate_chunk, row_counts
+from src.parquet_profiles import PROFILES
+from src.parquet_transformer import csv_to_parquet
+from src.schemas import get_schema
+
+MB = 1024 * 1024
+UNITS = {'KB': 1024, 'MB': MB, 'GB': 1024 * MB}
+CHUNK_ROWS = 500_000
+BENCH_DIR = config.DATA_DIR / 'benchmarks'
+BENCH_BUCKET = 'pipeline-benchmark'
+
+
+def parse_size(text: str) -> int:
+    """'10MB' → bytes."""
+    text = text.strip().upper()
+    for unit, factor in UNITS.items():
+        if text.endswith(unit):
+            return int(float(text[:-len(unit)]) * factor)
+    return int(text)
+
+
+# ========================================
+# Synthetic data
+# ========================================
+
+def synthetic_csv(target_bytes: int, seed: int) -> Path:
+    """Write (or reuse) a fixed-seed transactions CSV of about target_bytes."""
+    path = BENCH_DIR / 'synthetic' / f'transactions_{target_bytes // MB}MB_seed{seed}.csv'
+    if path.exists():
+        return path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix('.tmp')
+    counts = row_counts()
+    chunk_rows = min(CHUNK_ROWS, max(target_bytes // 100_000, 1_000))  # ~1000 chunks: overshoot <= 0.1%
+    first_id = 1
+    with pv.CSVWriter(tmp_path, generate_chunk('transactions', 1, 2, counts, seed, False).schema) as writer:
+        while tmp_path.stat().st_size < target_bytes:
+            writer.write_table(generate_chunk('transactions', first_id, first_id + chunk_rows, counts, seed, False))
+            first_id += chunk_rows
+    os.replace(tmp_path, path)
+    return path
+
+
+# ========================================
+# Transform
+# ========================================
+
+def _reset_peak_rss() -> None:
+    """Reset the kernel's RSS high-water mark (Linux >= 4.0; no-op elsewhere).
+
+    A spawned child inherits ru_maxrss from its parent across fork/exec, so
+    without this the peak would include the benchmark driver itself.
+    """
+    try:
+        Path('/proc/self/clear_refs').write_text('5')
+    except OSError:
+        pass
+
+
+def _peak_rss_mb() -> float:
+    """RSS high-water mark of this process in MB."""
+    try:
+        for line in Path('/proc/self/status').read_text().splitlines():
+            if line.startswith('VmHWM:'):
+                return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _convert(csv_path: str, parquet_path: str, profile_name: str, streaming: bool) -> dict:
+    """Child process: convert once, report time and peak RSS."""
+    _reset_peak_rss()
+    start = time.perf_counter()
+    csv_to_parquet(Path(csv_path), Path(parquet_path), streaming=streaming,
+                   schema=get_schema('transactions'), profile=PROFILES[profile_name])
+    return {'seconds': time.perf_counter() - start, 'peak_rss_mb': _peak_rss_mb()}
+
+
+def bench_transform(csv_path: Path, out_dir: Path, profile_name: str, streaming: bool) -> dict:
+    """Convert in a fresh process; returns throughput and size figures."""
+    parquet_path = out_dir / f"{profile_name}{'-streaming' if streaming else ''}" / 'transactions.parquet'
+    with multiprocessing.get_context('spawn').Pool(1) as pool:
+        run = pool.apply(_convert, (str(csv_path), str(parquet_path), profile_name, streaming))
+
+    rows = pq.ParquetFile(parquet_path).metadata.num_rows
+    csv_bytes = csv_path.stat().st_size
+    return {
+        'profile': profile_name,
+        'streaming': streaming,
+        'rows': rows,
+        'csv_bytes': csv_bytes,
+        'parquet_bytes': parquet_path.stat().st_size,
+        'seconds': run['seconds'],
+        'rows_per_s': rows / run['seconds'],
+        'mb_per_s': csv_bytes / MB / run['seconds'],
+        'peak_rss_mb': run['peak_rss_mb'],
+        'path': str(parquet_path),
+    }
+
+
+# ========================================
+# Upload
+# ========================================
+
+def start_s3_stand_in() -> bool:
+    """Point boto3 at a local S3; False if none is configured or available."""
+    if os.getenv('AWS_ENDPOINT_URL'):
+        return True
+    try:
+        from moto.server import ThreadedMotoServer
+    except ImportError:
+        return False
+    server = ThreadedMotoServer(port=0, verbose=False)
+    server.start()
+    host, port = server.get_host_and_port()
+    os.environ['AWS_ENDPOINT_URL'] = f'http://{host}:{port}'
+    return True
+
+
+def bench_upload(files: list[tuple[Path, str]]) -> dict:
+    """Upload files to the stand-in bucket with the production uploader (always transferring)."""
+    from src.s3_client import create_bucket, upload_files
+
+    create_bucket(BENCH_BUCKET, config.AWS_REGION)
+    summary = upload_files(BENCH_BUCKET, files, skip_unchanged=False)
+    return {
+        'files': len(files),
+        'failed': summary.failed,
+        'bytes': summary.total_bytes,
+        'seconds': summary.seconds,
+        'mb_per_s': summary.throughput_mbps,
+    }
+
+
+# ========================================
+# Query
+# ========================================
+
+def _median_seconds(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def bench_queries(parquet_path: Path, repeat: int) -> dict:
+    """Median latency of local queries over one Parquet output."""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        entity_dir = root / 'transactions' / 'date=benchmark'
+        entity_dir.mkdir(parents=True)
+        (entity_dir / parquet_path.name).symlink_to(parquet_path)
+        queries = {
+            'count_since_2024': lambda: query_engine.transactions_since_2024(root),
+            'sum_by_type': lambda: query_engine.aggregate(
+                'transactions', ['transaction_type'], [('amount', 'sum')], root=root),
+            'failed_online': lambda: query_engine.scan(
+                'transactions', ['transaction_id', 'amount'],
+                (ds.field('status') == 'failed') & (ds.field('channel') == 'online'), root=root),
+        }
+        return {name: _median_seconds(fn, repeat) for name, fn in queries.items()}
+
+
+# ========================================
+# Main
+# ========================================
+
+def bench_size(target_bytes: int, args: argparse.Namespace, upload: bool) -> dict:
+    """All measurements for one data size."""
+    csv_path = synthetic_csv(target_bytes, args.seed)
+    print(f"\n📦 {csv_path.name}: {csv_path.stat().st_size / MB:,.0f} MB")
+
+    with tempfile.TemporaryDirectory(dir=BENCH_DIR) as tmp:
+        transforms = []
+        for profile_name in PROFILES:
+            for streaming in (False, True):
+                if not streaming and csv_path.stat().st_size > args.max_in_memory:
+                    continue
+                result = bench_transform(csv_path, Path(tmp), profile_name, streaming)
+                print(f"   🔄 {profile_name:<15}{'streaming' if streaming else 'in-memory':<11}"
+                      f"{result['rows_per_s']:>12,.0f} rows/s {result['mb_per_s']:>7.1f} MB/s "
+                      f"{result['peak_rss_mb']:>8,.0f} MB RSS")
+                transforms.append(result)
+
+        default = next(r for r in transforms if r['profile'] == 'default')
+        queries = bench_queries(Path(default['path']), args.repeat)
+        print(f"   🔎 " + ', '.join(f"{name} {seconds * 1000:.0f} ms" for name, seconds in queries.items()))
+
+        uploads = {}
+        if upload:
+            prefix = f'benchmark/{csv_path.stem}'
+            uploads['csv'] = bench_upload([(csv_path, f'{prefix}/{csv_path.name}')])
+            uploads['parquet'] = bench_upload([(Path(default['path']), f'{prefix}/transactions.parquet')])
+            print(f"   📤 CSV {uploads['csv']['mb_per_s']:.1f} MB/s, Parquet {uploads['parquet']['mb_per_s']:.1f} MB/s")
+
+    for result in transforms:
+        del result['path']
+    return {'target_bytes': target_bytes, 'csv_bytes': csv_path.stat().st_size,
+            'transform': transforms, 'query_seconds': queries, 'upload': uploads}
+
+
+def main() -> None:
+    """Run the benchmark for every requested size and save the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', default='10MB,100MB', help='comma-separated, e.g. 10MB,100MB,1GB,10GB')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--repeat', type=int, default=3, help='query runs per measurement (median)')
+    parser.add_argument('--max-in-memory', type=parse_size, default=parse_size('1GB'))
+    parser.add_argument('--no-upload', action='store_true')
+    args = parser.parse_args()
+
+    upload = not args.no_upload and start_s3_stand_in()
+    if not args.no_upload and not upload:
+        print("⚠️  No AWS_ENDPOINT_URL and moto[server] not installed: skipping upload benchmark")
+
+    BENCH_DIR.mkdir(parents=True, exist_ok=True)
+    sizes = [bench_size(parse_size(size), args, upload) for size in args.sizes.split(',')]
+
+    output = BENCH_DIR / f"pipeline_{datetime.now():%Y%m%d_%H%M%S}.json"
+    output.write_text(json.dumps({
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'seed': args.seed,
+        'environment': {
+            'python': platform.python_version(),
+            'pyarrow': pa.__version__,
+            'cpus': os.cpu_count(),
+            's3_endpoint': os.getenv('AWS_ENDPOINT_URL') if upload else None,
+        },
+        'sizes': sizes,
+    }, indent=2))
+    print(f"\n💾 Results saved to {output}")
+
+
+if __name__ == '__main__':
+    main()
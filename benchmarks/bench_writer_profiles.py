@@ -0,0 +1,85 @@
+"""Benchmark Parquet writer profiles on real finance CSVs.
+
+For every entity CSV in data/raw and every profile in parquet_profiles,
+records file size, write time and read time (full scan and a two-column
+projection). Results are printed and saved as JSON for comparison.
+
+Usage:
+    uv run python benchmarks/bench_writer_profiles.py [entity ...]
+"""
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pyarrow.parquet as pq
+
+from src import config
+from src.parquet_profiles import PROFILES, get_profile
+from src.parquet_transformer import csv_to_parquet
+from src.schemas import get_schema
+
+
+def time_it(fn) -> float:
+    """Run fn once and return elapsed seconds."""
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def bench_profile(csv_path: Path, entity: str, profile_name: str, out_dir: Path) -> dict:
+    """Write and read one CSV with one profile."""
+    config.PARQUET_ENTITY_PROFILES = f'{entity}:{profile_name}'
+    profile = get_profile(entity)
+    schema = get_schema(entity)
+    parquet_path = out_dir / f'{entity}.{profile_name}.parquet'
+
+    write_s = time_it(lambda: csv_to_parquet(csv_path, parquet_path, schema=schema, profile=profile))
+    metadata = pq.ParquetFile(parquet_path).metadata
+    projection = metadata.schema.names[:2]
+
+    return {
+        'entity': entity,
+        'profile': profile_name,
+        'rows': metadata.num_rows,
+        'row_groups': metadata.num_row_groups,
+        'csv_bytes': csv_path.stat().st_size,
+        'parquet_bytes': parquet_path.stat().st_size,
+        'write_s': write_s,
+        'read_s': time_it(lambda: pq.read_table(parquet_path)),
+        'read_2_columns_s': time_it(lambda: pq.read_table(parquet_path, columns=projection)),
+    }
+
+
+def main() -> None:
+    """Benchmark all profiles and save results."""
+    entities = sys.argv[1:] or sorted(
+        p.stem.replace('finanzas_', '') for p in config.RAW_DATA_DIR.glob('finanzas_*.csv')
+    )
+    if not entities:
+        print("❌ No finance CSV files found in data/raw/")
+        sys.exit(1)
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for entity in entities:
+            csv_path = config.RAW_DATA_DIR / f'finanzas_{entity}.csv'
+            for profile_name in PROFILES:
+                results.append(bench_profile(csv_path, entity, profile_name, Path(tmp)))
+
+    print(f"\n{'entity':<16}{'profile':<16}{'size':>12}{'write ms':>10}{'read ms':>10}{'2-col ms':>10}")
+    for r in results:
+        print(f"{r['entity']:<16}{r['profile']:<16}{r['parquet_bytes']:>12,}"
+              f"{r['write_s'] * 1000:>10.1f}{r['read_s'] * 1000:>10.1f}{r['read_2_columns_s'] * 1000:>10.1f}")
+
+    output = config.DATA_DIR / 'benchmarks' / 'writer_profiles.json'
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2))
+    print(f"\n💾 Results saved to {output}")
+
+
+if __name__ == '__main__':
+    main()
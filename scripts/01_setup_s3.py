@@ -3,6 +3,7 @@
 Usage:
     uv run python scripts/01_setup_s3.py
 """
+import asyncio
 import sys
 from pathlib import Path
 
@@ -10,7 +11,8 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src import config
-from src.s3_client import create_bucket, setup_data_lake_structure
+from src.aws_async import setup_data_lake_structure
+from src.s3_client import create_bucket
 
 
 def main() -> None:
@@ -28,7 +30,9 @@ def main() -> None:
 
     # Create folder structure
     print("\n📁 Creating folder structure...")
-    setup_data_lake_structure(bucket)
+    if not asyncio.run(setup_data_lake_structure(bucket)):
+        print("❌ Failed to create some folders")
+        sys.exit(1)
 
     print(f"\n✅ Data Lake ready at s3://{bucket}/")
     print("\nStructure:")
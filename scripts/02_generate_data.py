@@ -1,21 +1,37 @@
-"""Generate fake e-commerce data locally.
+"""Generate synthetic finance data locally.
 
 Usage:
-    uv run python scripts/02_generate_data.py
+    uv run python scripts/02_generate_data.py [--scale 1] [--format csv] [--workers N] [entity=rows ...]
+
+    # 100M transactions for load tests, everything else at scale 1
+    uv run python scripts/02_generate_data.py transactions=100000000
 """
+import argparse
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src import config
-from src.data_generator import generate_all_data
+from src.data_generator import generate_all_data, row_counts
 
 
 def main() -> None:
     """Generate data and save to local raw directory."""
-    output_dir = config.RAW_DATA_DIR / 'ecommerce'
-    generate_all_data(output_dir)
+    parser = argparse.ArgumentParser(description='Generate synthetic finance data')
+    parser.add_argument('--scale', type=float, default=config.DATA_GEN_SCALE)
+    parser.add_argument('--format', choices=['csv', 'parquet'], default=config.DATA_GEN_FORMAT)
+    parser.add_argument('--workers', type=int, default=config.DATA_GEN_WORKERS)
+    parser.add_argument('--seed', type=int, default=config.DATA_GEN_SEED)
+    parser.add_argument('rows', nargs='*', help='exact row counts, e.g. transactions=100000000')
+    args = parser.parse_args()
+
+    overrides = {entity: int(rows) for entity, rows in (item.split('=', 1) for item in args.rows)}
+    total = sum(row_counts(args.scale, overrides).values())
+    print(f"🏭 Generating {total:,} rows with {args.workers} workers (seed {args.seed})...\n")
+
+    output_dir = config.RAW_DATA_DIR
+    generate_all_data(output_dir, args.scale, args.seed, args.format, args.workers, rows=overrides)
     print(f"\n✅ Data generated in {output_dir}")
 
 
@@ -9,8 +9,8 @@ from datetime import datetime
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src import config
-from src.s3_client import upload_file
+from src import config, metrics
+from src.s3_client import upload_files
 
 
 def main() -> None:
@@ -31,17 +31,23 @@ def main() -> None:
         print(f"   Expected files like: finanzas_customers.csv, finanzas_accounts.csv, etc.")
         sys.exit(1)
 
+    uploads = []
     for file_path in csv_files:
         # Extract entity name (e.g., 'customers' from 'finanzas_customers.csv')
         entity = file_path.stem.replace('finanzas_', '')
 
         # Create S3 key with date partitioning
         s3_key = f'raw/finanzas/{entity}/date={today}/{file_path.name}'
+        uploads.append((file_path, s3_key))
 
-        upload_file(bucket, file_path, s3_key)
+    summary = upload_files(bucket, uploads)
 
-    print(f"\n✅ Uploaded {len(csv_files)} files to S3!")
+    unchanged = sum(1 for result in summary.results if result.skipped)
+    print(f"\n✅ Uploaded {summary.succeeded - unchanged}/{len(csv_files)} files to S3!")
+    print(f"⏭️  Already in S3 (unchanged): {unchanged}")
+    print(f"⚡ Throughput: {summary.throughput_mbps:.1f} MB/s ({summary.seconds:.1f}s)")
     print(f"📊 Total entities: {', '.join(sorted([f.stem.replace('finanzas_', '') for f in csv_files]))}")
+    metrics.export(run_id=f'upload_raw-{today}')
 
 
 if __name__ == '__main__':
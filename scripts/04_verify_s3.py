@@ -9,7 +9,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src import config
-from src.s3_client import list_objects
+from src.s3_client import iter_objects_parallel
 
 
 def format_size(bytes: int) -> str:
@@ -21,6 +21,22 @@ def format_size(bytes: int) -> str:
     return f"{bytes:.2f} TB"
 
 
+def collect_stats(bucket: str, zones: list[str]) -> dict[str, dict[str, list[int]]]:
+    """Stream all zone listings into {zone: {entity: [files, bytes]}}."""
+    stats = {zone: {} for zone in zones}
+    for obj in iter_objects_parallel(bucket, [f'{zone}/' for zone in zones]):
+        # Skip folder markers (objects ending with /)
+        if obj.key.endswith('/'):
+            continue
+        parts = obj.key.split('/')
+        zone = '/'.join(parts[:2])
+        entity = parts[2] if len(parts) >= 3 else zone
+        counters = stats[zone].setdefault(entity, [0, 0])
+        counters[0] += 1
+        counters[1] += obj.size
+    return stats
+
+
 def main() -> None:
     """Show Data Lake statistics."""
     bucket = config.S3_BUCKET_NAME
@@ -29,26 +45,18 @@ def main() -> None:
 
     # Count objects by zone
     zones = ['raw/finanzas', 'processed/finanzas', 'analytics/reports']
+    stats = collect_stats(bucket, zones)
 
     for zone in zones:
-        objects = list_objects(bucket, zone)
-        # Filter out folder markers (objects ending with /)
-        files = [obj for obj in objects if not obj.endswith('/')]
+        entities = stats[zone]
+        total_files = sum(files for files, _ in entities.values())
+        total_bytes = sum(size for _, size in entities.values())
 
         print(f"\n📁 {zone}/")
-        print(f"   Files: {len(files)}")
-
-        if files:
-            # Group by entity
-            entities = {}
-            for obj in files:
-                parts = obj.split('/')
-                if len(parts) >= 3:
-                    entity = parts[2]
-                    entities[entity] = entities.get(entity, 0) + 1
-
-            for entity, count in sorted(entities.items()):
-                print(f"   - {entity}: {count} file(s)")
+        print(f"   Files: {total_files} ({format_size(total_bytes)})")
+
+        for entity, (count, size) in sorted(entities.items()):
+            print(f"   - {entity}: {count} file(s), {format_size(size)}")
 
     print(f"\n✅ Verification complete!")
     print(f"\n💡 Next steps:")
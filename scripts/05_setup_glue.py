@@ -5,6 +5,7 @@ Usage:
 """
 import sys
 import time
+from datetime import datetime, timezone
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -15,7 +16,7 @@ from src.glue_client import (
     create_crawler_role,
     create_crawler,
     start_crawler,
-    get_crawler_status
+    wait_for_crawler
 )
 
 
@@ -61,6 +62,7 @@ def main() -> None:
 
     # Step 4: Start crawler
     print(f"\n▶️  Step 4: Starting crawler...")
+    started_at = datetime.now(timezone.utc)
     if not start_crawler(crawler_name):
         print("❌ Failed to start crawler")
         sys.exit(1)
@@ -69,20 +71,12 @@ def main() -> None:
     print(f"\n⏳ Monitoring crawler progress...")
     print(f"   (This may take 1-3 minutes)\n")
 
-    max_wait = 180  # 3 minutes
-    elapsed = 0
-    while elapsed < max_wait:
-        status = get_crawler_status(crawler_name)
-        if status == 'READY':
-            print(f"✅ Crawler completed successfully!")
-            break
-        elif status in ['RUNNING', 'STOPPING']:
-            print(f"   Status: {status}... ({elapsed}s)")
-            time.sleep(10)
-            elapsed += 10
-        else:
-            print(f"⚠️  Unexpected status: {status}")
-            break
+    result = wait_for_crawler(crawler_name, started_after=started_at)
+    if result and result.succeeded:
+        print(f"✅ Crawler completed successfully in {result.duration_seconds:.0f}s!")
+        print(f"   Tables created: {result.tables_created}, updated: {result.tables_updated}")
+    else:
+        print(f"⚠️  Crawler did not complete: {(result.status or result.error) if result else 'not found'}")
 
     print(f"\n✅ Glue setup complete!")
     print(f"\n📊 Next steps:")
@@ -4,13 +4,12 @@ Usage:
     uv run python scripts/06_check_crawler.py
 """
 import sys
-import time
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src import config
-from src.glue_client import get_crawler_status
+from src.glue_client import wait_for_crawler
 
 
 def main() -> None:
@@ -19,28 +18,20 @@ def main() -> None:
 
     print(f"⏳ Monitoring crawler: {crawler_name}\n")
 
-    max_wait = 300  # 5 minutes
-    elapsed = 0
-
-    while elapsed < max_wait:
-        status = get_crawler_status(crawler_name)
-
-        if status == 'READY':
-            print(f"\n✅ Crawler completed!")
-            print(f"\n📊 Check tables created:")
-            print(f"   aws glue get-tables --database-name {config.GLUE_DATABASE_NAME}")
-            break
-        elif status in ['RUNNING', 'STOPPING']:
-            print(f"   [{elapsed:03d}s] Status: {status}...")
-            time.sleep(10)
-            elapsed += 10
-        else:
-            print(f"\n⚠️  Status: {status}")
-            break
-
-    if elapsed >= max_wait:
-        print(f"\n⏱️  Timeout after {max_wait}s. Check manually:")
+    result = wait_for_crawler(crawler_name)
+    if result is None:
+        print(f"\n⚠️  Crawler '{crawler_name}' not found")
+    elif result.timed_out:
+        print(f"\n⏱️  Timeout after {config.CRAWLER_TIMEOUT}s (status: {result.state}). Check manually:")
         print(f"   https://console.aws.amazon.com/glue/")
+    elif result.succeeded:
+        print(f"\n✅ Crawler completed in {result.duration_seconds:.0f}s!")
+        print(f"   Tables created: {result.tables_created}, updated: {result.tables_updated}, "
+              f"deleted: {result.tables_deleted}")
+        print(f"\n📊 Check tables created:")
+        print(f"   aws glue get-tables --database-name {config.GLUE_DATABASE_NAME}")
+    else:
+        print(f"\n⚠️  Last crawl {result.status}: {result.error}")
 
 
 if __name__ == '__main__':
@@ -4,14 +4,24 @@ Usage:
     uv run python scripts/07_transform_to_parquet.py
 """
 import sys
-from pathlib import Path
 from datetime import datetime
+from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src import config
+from src import config, metrics
+from src.catalog import register_uploads
+from src.compaction import compact_local, delete_superseded
+from src.manifest import (
+    filter_unchanged_uploads,
+    load_manifest,
+    log_upload_savings,
+    record_skipped_uploads,
+    record_uploads,
+    save_manifest
+)
 from src.parquet_transformer import transform_all_finance_data
-from src.s3_client import upload_file
+from src.s3_client import upload_files
 
 
 def main() -> None:
@@ -24,8 +34,8 @@ def main() -> None:
 
     print("\n📤 Step 2: Uploading Parquet files to S3...\n")
 
-    # Get current date for partitioning
-    today = datetime.now().strftime('%Y-%m-%d')
+    # Merge small files locally first, so the upload carries the compacted layout
+    compact_local(processed_dir)
 
     # Find all parquet files
     parquet_files = list(processed_dir.rglob('*.parquet'))
@@ -34,22 +44,47 @@ def main() -> None:
         print("❌ No Parquet files found")
         sys.exit(1)
 
-    uploaded = 0
+    uploads = []
     for parquet_file in parquet_files:
-        # Extract entity name from path
-        entity = parquet_file.parent.parent.name
-
-        # Create S3 key
-        s3_key = f'processed/finanzas/{entity}/date={today}/{parquet_file.name}'
-
-        if upload_file(bucket, parquet_file, s3_key):
-            uploaded += 1
+        # Mirror local layout: {entity}/date=YYYY-MM-DD/{entity}.parquet
+        relative_path = parquet_file.relative_to(processed_dir).as_posix()
+        uploads.append((parquet_file, f'processed/finanzas/{relative_path}'))
+
+    all_uploads = uploads
+    manifest = load_manifest() if config.INCREMENTAL else None
+    skipped = []
+    if manifest:
+        uploads, skipped = filter_unchanged_uploads(uploads, manifest)
+
+    summary = upload_files(bucket, uploads)
+    if summary.failed == 0:
+        # Drop remote files the new output replaced (e.g. merged small files)
+        delete_superseded(bucket, all_uploads)
+
+    if manifest:
+        record_uploads(summary.results, manifest)
+        record_skipped_uploads(skipped, manifest)
+        save_manifest(manifest)
+        log_upload_savings(skipped)
+
+    if config.GLUE_REGISTER_TABLES:
+        print("\n📚 Step 3: Registering tables and partitions in Glue...\n")
+        if not register_uploads([(r.local_path, r.s3_key) for r in summary.results if r.success], bucket):
+            print("⚠️  Some tables or partitions were not registered (see errors above)")
+
+    metrics.export(run_id=f"transform-{datetime.now():%Y-%m-%d}")
 
     print(f"\n✅ Transformation complete!")
-    print(f"   Files uploaded: {uploaded}/{len(parquet_files)}")
+    unchanged = sum(1 for result in summary.results if result.skipped)
+    print(f"   Files uploaded: {summary.succeeded - unchanged}/{len(uploads)}")
+    print(f"   Files skipped (unchanged): {len(skipped) + unchanged}")
+    print(f"   Throughput: {summary.throughput_mbps:.1f} MB/s")
     print(f"\n📊 Next steps:")
-    print(f"   1. Run Glue Crawler on processed zone")
-    print(f"   2. Query Parquet tables with Athena (100x faster)")
+    if config.GLUE_REGISTER_TABLES:
+        print(f"   1. Query Parquet tables with Athena (100x faster)")
+    else:
+        print(f"   1. Run Glue Crawler on processed zone")
+        print(f"   2. Query Parquet tables with Athena (100x faster)")
 
 
 if __name__ == '__main__':
@@ -4,7 +4,7 @@ Usage:
     uv run python scripts/08_crawl_processed.py
 """
 import sys
-import time
+from datetime import datetime, timezone
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -14,7 +14,7 @@ from src.glue_client import (
     create_crawler,
     crawler_exists,
     start_crawler,
-    get_crawler_status
+    wait_for_crawler
 )
 
 
@@ -49,6 +49,7 @@ def main() -> None:
 
     # Start crawler
     print(f"\n▶️  Starting crawler...")
+    started_at = datetime.now(timezone.utc)
     if not start_crawler(crawler_name):
         print("❌ Failed to start crawler")
         sys.exit(1)
@@ -56,22 +57,12 @@ def main() -> None:
     # Monitor progress
     print(f"\n⏳ Monitoring crawler progress...\n")
 
-    max_wait = 180
-    elapsed = 0
-
-    while elapsed < max_wait:
-        status = get_crawler_status(crawler_name)
-
-        if status == 'READY':
-            print(f"\n✅ Crawler completed!")
-            break
-        elif status in ['RUNNING', 'STOPPING']:
-            print(f"   [{elapsed:03d}s] Status: {status}...")
-            time.sleep(10)
-            elapsed += 10
-        else:
-            print(f"\n⚠️  Status: {status}")
-            break
+    result = wait_for_crawler(crawler_name, started_after=started_at)
+    if result and result.succeeded:
+        print(f"\n✅ Crawler completed in {result.duration_seconds:.0f}s!")
+        print(f"   Tables created: {result.tables_created}, updated: {result.tables_updated}")
+    else:
+        print(f"\n⚠️  Crawler did not complete: {(result.status or result.error) if result else 'not found'}")
 
     print(f"\n📊 Check new Parquet tables:")
     print(f"   SHOW TABLES IN {database_name};")
@@ -0,0 +1,37 @@
+"""Compact small Parquet files in the processed zone.
+
+Merges partitions' small files into ~COMPACTION_TARGET_SIZE files and
+swaps them in on S3. Run with --dry-run first to see the expected
+file-count and byte savings without touching the bucket.
+
+Usage:
+    uv run python scripts/10_compact_processed.py [--dry-run]
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src import config
+from src.compaction import compact
+
+
+def main() -> None:
+    """Compact processed/finanzas/ in the configured bucket."""
+    dry_run = '--dry-run' in sys.argv[1:]
+    bucket = config.S3_BUCKET_NAME
+    target_mb = config.COMPACTION_TARGET_SIZE / 1024 / 1024
+
+    print(f"🗜️  Compacting s3://{bucket}/{config.S3_PROCESSED_PREFIX}finanzas/ (target {target_mb:.0f} MB)")
+    if dry_run:
+        print("   Dry run: nothing will be written\n")
+
+    report = compact(bucket, dry_run=dry_run)
+
+    print(f"\n✅ {report.partitions} partitions: {report.files_before} → {report.files_after} files")
+    print(f"   Objects removed: {report.files_saved}")
+    print(f"   Bytes: {report.bytes_before:,} → {report.bytes_after:,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Run the reference Athena queries locally over the processed zone.
+
+Reads data/processed/finanzas/ (or an s3:// URI) with pyarrow.dataset,
+prints each result with its latency, then estimates what the typed
+Parquet queries would scan in Athena.
+
+Usage:
+    uv run python scripts/11_query_local.py [root]
+"""
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pyarrow.dataset as ds
+
+from src.query_engine import DEFAULT_ROOT, REFERENCE_QUERIES, date_range_filter, estimate_scan, open_dataset
+
+# (entity, columns, filter) for the scan-size pre-check
+# (entity, columns, filter); a callable filter is built from the opened dataset,
+# so date bounds match the column's type (timestamp, or text in untyped data)
+SCAN_CHECKS = [
+    ('customers', ['city'], None),
+    ('customers', None, None),
+    ('loans', ['loan_type', 'principal_amount', 'status'], ds.field('status') == 'active'),
+    ('transactions', ['transaction_date'],
+     lambda dataset: date_range_filter('transactions', dataset, 'transaction_date', start=datetime(2024, 1, 1))),
+]
+
+
+def main() -> None:
+    """Run reference queries and scan estimates."""
+    root = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_ROOT
+    print(f"🔎 Local queries over {root}\n")
+
+    for name, query in REFERENCE_QUERIES.items():
+        start = time.perf_counter()
+        result = query(root)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        print(f"▶️  {name} ({elapsed_ms:.1f} ms, {result.num_rows} rows)")
+        print(result.slice(0, 5).to_pandas().to_string(index=False), "\n")
+
+    print("📏 Athena scan estimates:")
+    for entity, columns, filter in SCAN_CHECKS:
+        if callable(filter):
+            filter = filter(open_dataset(entity, root))
+        estimate = estimate_scan(entity, columns, filter, root)
+        print(
+            f"  {entity:<13} {str(columns or '*'):<45} "
+            f"{estimate.bytes_scanned:>12,} / {estimate.bytes_total:,} B, "
+            f"{estimate.row_groups_scanned}/{estimate.row_groups_total} row groups, "
+            f"~${estimate.athena_cost:.6f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
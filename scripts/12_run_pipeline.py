@@ -0,0 +1,37 @@
+"""Run the whole pipeline (setup → generate → upload → transform → catalog).
+
+Stages run per entity as a dependency graph, so independent work
+overlaps. Interrupted runs can be resumed from the checkpoint.
+
+Usage:
+    uv run python scripts/12_run_pipeline.py [--resume] [entity ...]
+"""
+import sys
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src import config, metrics
+from src.pipeline import run_pipeline
+
+
+def main() -> None:
+    """Run the pipeline for all (or the given) entities."""
+    args = sys.argv[1:]
+    resume = '--resume' in args
+    entities = [arg for arg in args if not arg.startswith('--')] or None
+
+    print(f"🚀 Running pipeline into s3://{config.S3_BUCKET_NAME}/")
+    print(f"   Workers: {config.PIPELINE_WORKERS}{' (resuming)' if resume else ''}\n")
+
+    ok = run_pipeline(entities=entities, resume=resume)
+    metrics.export(run_id=f"pipeline-{datetime.now():%Y-%m-%d}")
+    if not ok:
+        print(f"\n❌ Pipeline finished with failures; rerun with --resume to retry them")
+        sys.exit(1)
+    print(f"\n✅ Pipeline complete!")
+
+
+if __name__ == '__main__':
+    main()
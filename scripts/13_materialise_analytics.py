@@ -0,0 +1,40 @@
+"""Materialise the analytics/reports/ rollups from the processed zone.
+
+Recomputes only the months whose source rows changed since the last run,
+then uploads them to s3://{bucket}/analytics/reports/ and registers the
+analytics_* tables in Glue. --full rebuilds every month; --local skips
+the upload.
+
+Usage:
+    uv run python scripts/13_materialise_analytics.py [--full] [--local] [rollup ...]
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src import config
+from src.analytics import REPORTS_DIR, ROLLUPS, materialise_all, publish
+
+
+def main() -> None:
+    """Materialise (and publish) the requested rollups."""
+    args = sys.argv[1:]
+    rollups = [arg for arg in args if not arg.startswith('--')] or list(ROLLUPS)
+
+    print(f"📊 Materialising {', '.join(rollups)}{' (full rebuild)' if '--full' in args else ''}...\n")
+    results = materialise_all(rollups, full='--full' in args)
+
+    if '--local' not in args and not publish(results):
+        print("\n❌ Some report partitions failed to upload")
+        sys.exit(1)
+
+    print(f"\n✅ Analytics zone up to date ({REPORTS_DIR})")
+    for result in results:
+        print(f"   {result.rollup:<20} {len(result.written)} partitions written, {len(result.removed)} removed")
+    if '--local' not in args:
+        print(f"   Uploaded to s3://{config.S3_BUCKET_NAME}/{config.S3_ANALYTICS_PREFIX}reports/")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""Bulk-download a prefix (or keys) from the data lake bucket.
+
+Large objects are fetched as concurrent byte ranges into pre-allocated
+files. Rerunning after an interruption resumes partially downloaded files
+and skips files that are already complete.
+
+Usage:
+    uv run python scripts/14_download_from_s3.py <prefix> [local_dir]
+    uv run python scripts/14_download_from_s3.py --keys <key> [<key> ...]
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src import config
+from src.s3_download import download_keys, download_prefix
+
+DOWNLOADS_DIR = config.DATA_DIR / 'downloads'
+
+
+def main() -> None:
+    """Download the requested prefix or keys and report throughput."""
+    args = sys.argv[1:]
+    if not args:
+        print(__doc__)
+        sys.exit(1)
+
+    bucket = config.S3_BUCKET_NAME
+    if args[0] == '--keys':
+        print(f"📥 Downloading {len(args) - 1} keys from s3://{bucket}/ to {DOWNLOADS_DIR}...\n")
+        summary = download_keys(bucket, args[1:], DOWNLOADS_DIR)
+    else:
+        local_dir = Path(args[1]) if len(args) > 1 else DOWNLOADS_DIR / args[0]
+        print(f"📥 Downloading s3://{bucket}/{args[0]} to {local_dir}...\n")
+        summary = download_prefix(bucket, args[0], local_dir)
+
+    print(f"\n{'✅' if summary.failed == 0 else '❌'} {summary.succeeded}/{len(summary.results)} files, "
+          f"{summary.total_bytes / (1024 * 1024):.1f} MB in {summary.seconds:.1f}s ({summary.throughput_mbps:.1f} MB/s)")
+    for result in summary.results:
+        if not result.success:
+            print(f"   ❌ {result.s3_key}: {result.error}")
+    if summary.failed:
+        print("   Rerun the same command to resume the failed files")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
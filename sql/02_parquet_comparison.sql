@@ -48,3 +48,48 @@ LIMIT 10;
 SELECT customer_id, email
 FROM datalake_db.finanzas_customers
 LIMIT 10;
+
+-- ========================================
+-- Parquet tipado (src/schemas.py): sin CASTs
+-- ========================================
+-- balance/amount son DECIMAL(18,2), credit_score es SMALLINT y las fechas
+-- son DATE/TIMESTAMP, así que no hace falta castear en cada query.
+
+-- Top 10 clientes por balance total
+SELECT
+    c.customer_id,
+    c.first_name || ' ' || c.last_name as full_name,
+    SUM(a.balance) as total_balance
+FROM datalake_db.parquet_customers c
+JOIN datalake_db.parquet_accounts a ON c.customer_id = a.customer_id
+GROUP BY c.customer_id, c.first_name, c.last_name
+ORDER BY total_balance DESC
+LIMIT 10;
+
+-- Distribución de credit scores
+SELECT
+    CASE
+        WHEN credit_score >= 750 THEN 'Excellent'
+        WHEN credit_score >= 650 THEN 'Good'
+        WHEN credit_score >= 550 THEN 'Fair'
+        ELSE 'Poor'
+    END as score_category,
+    COUNT(*) as customer_count
+FROM datalake_db.parquet_customers
+GROUP BY 1
+ORDER BY customer_count DESC;
+
+-- Préstamos activos
+SELECT
+    l.loan_type,
+    COUNT(*) as num_loans,
+    SUM(l.principal_amount) as total_amount
+FROM datalake_db.parquet_loans l
+WHERE l.status = 'active'
+GROUP BY l.loan_type
+ORDER BY total_amount DESC;
+
+-- Filtro por fecha sin parsear strings
+SELECT COUNT(*) as transactions_2024
+FROM datalake_db.parquet_transactions
+WHERE transaction_date >= TIMESTAMP '2024-01-01 00:00:00';
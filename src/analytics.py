@@ -0,0 +1,410 @@
+"""Pre-aggregated analytics zone (analytics/reports/).
+
+Dashboards read small rollups instead of re-aggregating transactions in
+Athena:
+- daily_transactions: per day, type, channel and status: count, total
+  and average amount
+- customer_metrics: per customer and month: transactions, inflow,
+  outflow, accounts used, last transaction
+- loan_analysis: per month and loan type: payments, amounts paid
+  (principal, interest, late fees), late and missed payments
+
+Rollups are computed from the processed Parquet (projected reads, Arrow
+joins and group-bys) and Hive-partitioned by year=/month= of the event
+date: ANALYTICS_DATA_DIR/reports/{rollup}/year=2024/month=3/{rollup}.parquet
+
+Updates are incremental, tracked in ANALYTICS_STATE_PATH:
+1. Source files are fingerprinted like the run manifest (size/mtime,
+   SHA-256). Each event file records the months its date column spans
+   (footer statistics), so a new, changed or removed file only touches
+   those months; a changed lookup (accounts, loans) touches all of them.
+2. Only touched months are read (date-range filter pushed into the
+   dataset scan, pruning year=/month= partitions and row groups).
+3. Each month read is digested over every column it loaded, lookups
+   joined in (so accounts moved to another customer count too). Months
+   whose digest moved are re-aggregated and rewritten; months that
+   disappeared from the source are removed.
+full=True rereads and rebuilds everything.
+"""
+import hashlib
+import json
+import logging
+import os
+import shutil
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from pathlib import Path
+from typing import Callable, Optional
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from . import config
+from .catalog import register_uploads
+from .manifest import fingerprint, is_unchanged, refresh_entry
+from .parquet_reader import DEFAULT_ROOT, entity_files, read_entity
+from .query_engine import date_range_filter, open_dataset
+from .s3_client import delete_objects, upload_files
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+REPORTS_DIR = config.ANALYTICS_DATA_DIR / 'reports'
+REPORTS_PREFIX = f'{config.S3_ANALYTICS_PREFIX}reports/'
+PARTITION_KEYS = ['year', 'month']
+
+Partition = tuple[int, int]  # (year, month)
+
+
+@dataclass(frozen=True)
+class Rollup:
+    """A report table: its event source, lookups and aggregation.
+
+    Attributes:
+        source: Event entity, read only for the months being recomputed
+        date_column: Event date in source (gives year/month)
+        columns: Source columns read (every key and measure)
+        lookups: (entity, columns, join key) joined onto the source rows
+        aggregate: Source rows → report rows (keeping year/month)
+    """
+    name: str
+    source: str
+    date_column: str
+    columns: tuple[str, ...]
+    lookups: tuple[tuple[str, tuple[str, ...], str], ...]
+    aggregate: Callable[[pa.Table], pa.Table]
+
+    @property
+    def entities(self) -> list[str]:
+        return [self.source] + [entity for entity, _, _ in self.lookups]
+
+
+@dataclass
+class MaterialiseResult:
+    """Partitions (relative 'year=Y/month=M' paths) rewritten and removed."""
+    rollup: str
+    written: list[Path] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+
+
+# ========================================
+# Sources
+# ========================================
+
+def _with_month(table: pa.Table, date_column: str) -> pa.Table:
+    """Add year/month partition columns derived from date_column (text dates are parsed)."""
+    if pa.types.is_string(table[date_column].type) or pa.types.is_large_string(table[date_column].type):
+        index = table.schema.get_field_index(date_column)
+        table = table.set_column(index, date_column, pc.cast(table[date_column], pa.timestamp('s')))
+    table = table.append_column('year', pc.cast(pc.year(table[date_column]), pa.int32()))
+    return table.append_column('month', pc.cast(pc.month(table[date_column]), pa.int32()))
+
+
+def _decode_dictionaries(table: pa.Table) -> pa.Table:
+    """Dictionary columns → plain values (row groups carry differing dictionaries, which group_by rejects)."""
+    for index, column in enumerate(table.schema):
+        if pa.types.is_dictionary(column.type):
+            table = table.set_column(index, column.name, pc.cast(table[index], column.type.value_type))
+    return table
+
+
+def _month_ranges(partitions: list[Partition]) -> list[tuple[datetime, datetime]]:
+    """[start, end) datetimes covering the months, consecutive months merged."""
+    ranges = []
+    for year, month in sorted(partitions):
+        start, end = datetime(year, month, 1), datetime(year + month // 12, month % 12 + 1, 1)
+        if ranges and ranges[-1][1] == start:
+            ranges[-1] = (ranges[-1][0], end)
+        else:
+            ranges.append((start, end))
+    return ranges
+
+
+def load(rollup: Rollup, root: Path, partitions: Optional[list[Partition]] = None) -> pa.Table:
+    """Source rows of the given months (None = all), lookups joined in, with year/month columns."""
+    dataset = open_dataset(rollup.source, root)
+    filter = None
+    if partitions is not None:
+        filter = pc.scalar(False)
+        for start, end in _month_ranges(partitions):
+            filter |= date_range_filter(rollup.source, dataset, rollup.date_column, start, end)
+    table = _decode_dictionaries(dataset.to_table(columns=list(rollup.columns), filter=filter))
+    for entity, columns, key in rollup.lookups:
+        table = table.join(_decode_dictionaries(read_entity(entity, list(columns), root=root)), key)
+    return _with_month(table, rollup.date_column)
+
+
+# ========================================
+# Aggregations
+# ========================================
+
+def _daily_transactions(table: pa.Table) -> pa.Table:
+    table = table.append_column('day', pc.cast(table['transaction_date'], pa.date32()))
+    keys = PARTITION_KEYS + ['day', 'transaction_type', 'channel', 'status']
+    result = table.group_by(keys).aggregate([
+        ('transaction_id', 'count'), ('amount', 'sum'), ('amount', 'mean'),
+    ])
+    return result.rename_columns({
+        'transaction_id_count': 'transactions', 'amount_sum': 'total_amount', 'amount_mean': 'avg_amount',
+    })
+
+
+def _customer_metrics(table: pa.Table) -> pa.Table:
+    zero = pa.scalar(0, table['amount'].type)
+    table = table.append_column('inflow', pc.if_else(pc.greater(table['amount'], zero), table['amount'], zero))
+    table = table.append_column('outflow', pc.if_else(pc.less(table['amount'], zero), pc.negate(table['amount']), zero))
+    result = table.group_by(PARTITION_KEYS + ['customer_id']).aggregate([
+        ('transaction_id', 'count'), ('inflow', 'sum'), ('outflow', 'sum'),
+        ('account_id', 'count_distinct'), ('transaction_date', 'max'),
+    ])
+    return result.rename_columns({
+        'transaction_id_count': 'transactions', 'inflow_sum': 'inflow', 'outflow_sum': 'outflow',
+        'account_id_count_distinct': 'accounts_used', 'transaction_date_max': 'last_transaction',
+    })
+
+
+def _loan_analysis(table: pa.Table) -> pa.Table:
+    table = table.append_column('late', pc.cast(pc.equal(table['status'], 'late'), pa.int32()))
+    table = table.append_column('missed', pc.cast(pc.equal(table['status'], 'missed'), pa.int32()))
+    result = table.group_by(PARTITION_KEYS + ['loan_type']).aggregate([
+        ('payment_id', 'count'), ('loan_id', 'count_distinct'), ('amount', 'sum'), ('principal_paid', 'sum'),
+        ('interest_paid', 'sum'), ('late_fee', 'sum'), ('late', 'sum'), ('missed', 'sum'),
+    ])
+    return result.rename_columns({
+        'payment_id_count': 'payments', 'loan_id_count_distinct': 'loans', 'amount_sum': 'amount_paid',
+        'principal_paid_sum': 'principal_paid', 'interest_paid_sum': 'interest_paid', 'late_fee_sum': 'late_fees',
+        'late_sum': 'late_payments', 'missed_sum': 'missed_payments',
+    })
+
+
+ROLLUPS: dict[str, Rollup] = {
+    'daily_transactions': Rollup(
+        'daily_transactions', 'transactions', 'transaction_date',
+        ('transaction_id', 'transaction_date', 'transaction_type', 'channel', 'status', 'amount'),
+        (), _daily_transactions),
+    'customer_metrics': Rollup(
+        'customer_metrics', 'transactions', 'transaction_date',
+        ('transaction_id', 'account_id', 'transaction_date', 'amount'),
+        (('accounts', ('account_id', 'customer_id'), 'account_id'),), _customer_metrics),
+    'loan_analysis': Rollup(
+        'loan_analysis', 'loan_payments', 'payment_date',
+        ('payment_id', 'loan_id', 'payment_date', 'amount', 'principal_paid', 'interest_paid', 'late_fee', 'status'),
+        (('loans', ('loan_id', 'loan_type'), 'loan_id'),), _loan_analysis),
+}
+
+# Entities each rollup reads (pipeline dependencies)
+ROLLUP_SOURCES = {name: rollup.entities for name, rollup in ROLLUPS.items()}
+
+
+# ========================================
+# Incremental materialisation
+# ========================================
+
+def partition_path(partition: Partition) -> str:
+    year, month = partition
+    return f'year={year}/month={month}'
+
+
+def _partition_of(key: str) -> Partition:
+    year, month = (int(part.split('=')[1]) for part in key.split('/'))
+    return year, month
+
+
+def _month_of(value: date | datetime | str) -> Partition:
+    if isinstance(value, str):
+        value = date.fromisoformat(value[:10])
+    return value.year, value.month
+
+
+def _file_months(path: Path, date_column: str) -> Optional[list[str]]:
+    """Months between the min and max of date_column, from the footer (None without statistics)."""
+    metadata = pq.read_metadata(path)
+    if date_column not in metadata.schema.names:
+        return None
+    index = metadata.schema.names.index(date_column)
+    bounds = []
+    for i in range(metadata.num_row_groups):
+        stats = metadata.row_group(i).column(index).statistics
+        if stats is not None and stats.has_min_max:
+            bounds += [stats.min, stats.max]
+        elif stats is None or stats.null_count != metadata.row_group(i).num_rows:
+            return None
+    if not bounds:
+        return []
+    try:
+        (year, month), last = _month_of(min(bounds)), _month_of(max(bounds))
+    except (TypeError, ValueError):
+        return None
+    months = []
+    while (year, month) <= last:
+        months.append(partition_path((year, month)))
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return months
+
+
+def changed_months(rollup: Rollup, root: Path, previous: dict[str, dict]) -> tuple[dict[str, dict], Optional[set[str]]]:
+    """
+    Fingerprint the rollup's source files; return them and the months their changes touch.
+
+    A new, changed or removed event file touches the months it spans (before
+    and after the change); a lookup file, or an event file without date
+    statistics, touches every month (None).
+    """
+    files, touched = {}, []
+    for entity in rollup.entities:
+        for path in entity_files(entity, root):
+            key, old = str(path), previous.get(str(path))
+            if is_unchanged(path, old):
+                files[key] = refresh_entry(path, old)
+                continue
+            months = _file_months(path, rollup.date_column) if entity == rollup.source else None
+            files[key] = {**fingerprint(path), 'months': months}
+            touched += [months, old['months']] if old else [months]
+    touched += [entry['months'] for key, entry in previous.items() if key not in files]
+    if any(months is None for months in touched):
+        return files, None
+    return files, {month for months in touched for month in months}
+
+
+def month_digests(table: pa.Table) -> dict[str, str]:
+    """
+    Digest of each month's rows over every column: {'year=Y/month=M': md5}.
+
+    Rows are sorted first, so neither file nor join order moves a digest.
+    """
+    keys = PARTITION_KEYS + [name for name in table.column_names if name not in PARTITION_KEYS]
+    table = table.sort_by([(name, 'ascending') for name in keys]).select(keys)
+    counts = table.group_by(PARTITION_KEYS).aggregate([([], 'count_all')])
+    counts = counts.sort_by([(key, 'ascending') for key in PARTITION_KEYS])
+    digests, offset = {}, 0
+    for row in counts.to_pylist():
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table.slice(offset, row['count_all']).combine_chunks())
+        digests[partition_path((row['year'], row['month']))] = hashlib.md5(sink.getvalue()).hexdigest()
+        offset += row['count_all']
+    return digests
+
+
+def _only_partitions(table: pa.Table, partitions: list[Partition]) -> pa.Table:
+    keys = pc.add(pc.multiply(table['year'], 100), table['month'])
+    return table.filter(pc.is_in(keys, pa.array([year * 100 + month for year, month in partitions], pa.int32())))
+
+
+def _write_partitions(name: str, result: pa.Table, partitions: list[Partition], out_root: Path) -> list[Path]:
+    """Write one file per partition (atomically), without the partition columns."""
+    written = []
+    for partition in partitions:
+        path = out_root / name / partition_path(partition) / f'{name}.parquet'
+        path.parent.mkdir(parents=True, exist_ok=True)
+        rows = _only_partitions(result, [partition]).drop_columns(PARTITION_KEYS)
+        tmp_path = path.with_name(f'.{path.name}.tmp')
+        pq.write_table(rows, tmp_path, compression='snappy')
+        os.replace(tmp_path, path)
+        written.append(path)
+    return written
+
+
+def materialise(
+    rollup: Rollup,
+    state: dict[str, dict],
+    root: Path = DEFAULT_ROOT,
+    out_root: Path = REPORTS_DIR,
+    full: bool = False
+) -> MaterialiseResult:
+    """Recompute the rollup's changed months; updates state in place."""
+    previous = {} if full else state.get(rollup.name, {})
+    old_digests = previous.get('months', {})
+    files, touched = changed_months(rollup, root, previous.get('files', {}))
+    if touched is not None:
+        touched |= {key for key in old_digests if not (out_root / rollup.name / key).exists()}
+
+    source, fresh = None, {}
+    if touched is None or touched:
+        source = load(rollup, root, None if touched is None else [_partition_of(key) for key in touched])
+        fresh = month_digests(source)
+    digests = fresh if touched is None else {
+        **{key: digest for key, digest in old_digests.items() if key not in touched}, **fresh
+    }
+    changed = [
+        _partition_of(key)
+        for key, digest in sorted(fresh.items())
+        if old_digests.get(key) != digest or not (out_root / rollup.name / key).exists()
+    ]
+
+    result = MaterialiseResult(rollup.name)
+    if changed:
+        aggregated = rollup.aggregate(_only_partitions(source, changed))
+        result.written = _write_partitions(rollup.name, aggregated, changed, out_root)
+    for key in sorted(set(state.get(rollup.name, {}).get('months', {})) - set(digests)):
+        shutil.rmtree(out_root / rollup.name / key, ignore_errors=True)
+        result.removed.append(key)
+
+    state[rollup.name] = {'files': files, 'months': digests}
+    logger.info(
+        f"📊 {rollup.name}: {len(fresh)}/{len(digests)} months read, {len(changed)} recomputed, "
+        f"{len(result.removed)} removed"
+    )
+    return result
+
+
+def load_state(path: Path = config.ANALYTICS_STATE_PATH) -> dict[str, dict]:
+    """Per rollup: source file fingerprints and month digests from the last run ({} on first run)."""
+    try:
+        state = json.loads(path.read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    # Earlier state files held the month digests only
+    return {name: entry if 'months' in entry else {'files': {}, 'months': entry} for name, entry in state.items()}
+
+
+def save_state(state: dict[str, dict], path: Path = config.ANALYTICS_STATE_PATH) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix('.tmp')
+    tmp_path.write_text(json.dumps(state, indent=2, sort_keys=True))
+    os.replace(tmp_path, path)
+
+
+def materialise_all(
+    rollups: Optional[list[str]] = None,
+    root: Path = DEFAULT_ROOT,
+    out_root: Path = REPORTS_DIR,
+    full: bool = False
+) -> list[MaterialiseResult]:
+    """Materialise the given (default: all) rollups and save the digests."""
+    state = load_state()
+    results = [materialise(ROLLUPS[name], state, root, out_root, full) for name in rollups or ROLLUPS]
+    save_state(state)
+    return results
+
+
+# ========================================
+# Publishing
+# ========================================
+
+def publish(
+    results: list[MaterialiseResult],
+    bucket_name: str = config.S3_BUCKET_NAME,
+    out_root: Path = REPORTS_DIR
+) -> bool:
+    """Upload rewritten partitions, delete removed ones and register them in Glue."""
+    if not any(result.written or result.removed for result in results):
+        return True
+    uploads = [
+        (path, f'{REPORTS_PREFIX}{path.relative_to(out_root).as_posix()}')
+        for result in results for path in result.written
+    ]
+    summary = upload_files(bucket_name, uploads)
+
+    removed = [
+        f'{REPORTS_PREFIX}{result.rollup}/{key}/{result.rollup}.parquet'
+        for result in results for key in result.removed
+    ]
+    if removed:
+        delete_objects(bucket_name, removed)
+
+    registered = True
+    if config.GLUE_REGISTER_TABLES and uploads:
+        registered = register_uploads(uploads, bucket_name, prefix=REPORTS_PREFIX, table_prefix='analytics_')
+    return summary.failed == 0 and registered
@@ -0,0 +1,368 @@
+"""Amazon Athena client with result caching and scan accounting.
+
+- Queries are submitted without blocking (start_query) and polled with
+  exponential backoff; many queries are polled together with one
+  batch_get_query_execution call per tick. Queries still running at the
+  timeout are stopped, so they stop scanning (and billing).
+- Results are paginated into typed Arrow record batches (pandas via
+  to_pandas)
+- Results are cached locally, keyed on the normalised SQL plus a
+  fingerprint (keys + ETags) of every referenced table's S3 location, so
+  a repeated dashboard query only re-scans when the data changed
+- Every query appends runtime and bytes scanned to a JSONL history
+"""
+import hashlib
+import json
+import logging
+import re
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, Optional
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from botocore.exceptions import ClientError
+
+from . import config
+from .aws_clients import get_client
+from .glue_client import get_table_location
+from .s3_client import iter_objects
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+TERMINAL_STATES = {'SUCCEEDED', 'FAILED', 'CANCELLED'}
+
+# Athena result type → Arrow type (decimal handled separately)
+ATHENA_TYPES = {
+    'boolean': pa.bool_(),
+    'tinyint': pa.int8(),
+    'smallint': pa.int16(),
+    'integer': pa.int32(),
+    'bigint': pa.int64(),
+    'float': pa.float32(),
+    'real': pa.float32(),
+    'double': pa.float64(),
+    'date': pa.date32(),
+    'timestamp': pa.timestamp('ms'),
+}
+
+TABLE_PATTERN = re.compile(r'\b(?:from|join)\s+([\w"]+(?:\.[\w"]+)?)')
+
+
+@dataclass
+class QueryStats:
+    """Outcome and cost of one query (one line of the history file)."""
+    sql: str
+    query_id: Optional[str]
+    state: str
+    cached: bool = False
+    engine_ms: int = 0
+    total_ms: int = 0
+    bytes_scanned: int = 0
+    error: Optional[str] = None
+
+    @property
+    def cost(self) -> float:
+        """Athena cost in USD (per-TB pricing, 10 MB minimum per query)."""
+        if self.cached or not self.query_id:
+            return 0.0
+        return max(self.bytes_scanned, 10 * 1024 * 1024) / 1024 ** 4 * config.ATHENA_COST_PER_TB
+
+
+def _get_athena_client():
+    """Get shared Athena client."""
+    return get_client('athena')
+
+
+# ========================================
+# Submission and polling
+# ========================================
+
+def start_query(
+    sql: str,
+    database_name: str = config.GLUE_DATABASE_NAME,
+    output_location: str = config.ATHENA_OUTPUT_LOCATION
+) -> Optional[str]:
+    """Submit a query without waiting; returns its execution id."""
+    athena = _get_athena_client()
+    try:
+        response = athena.start_query_execution(
+            QueryString=sql,
+            QueryExecutionContext={'Database': database_name},
+            ResultConfiguration={'OutputLocation': output_location},
+            WorkGroup=config.ATHENA_WORKGROUP
+        )
+        return response['QueryExecutionId']
+    except ClientError as e:
+        logger.error(f"❌ Failed to start query: {e}")
+        return None
+
+
+def _poll(query_ids: list[str]) -> dict[str, dict]:
+    """Fetch executions for up to 50 ids per request."""
+    athena = _get_athena_client()
+    executions = {}
+    for start in range(0, len(query_ids), 50):
+        response = athena.batch_get_query_execution(QueryExecutionIds=query_ids[start:start + 50])
+        executions.update({e['QueryExecutionId']: e for e in response['QueryExecutions']})
+    return executions
+
+
+def _cancel(query_ids: list[str], timeout: float) -> dict[str, dict]:
+    """Stop queries still running at the timeout; they are returned as CANCELLED."""
+    athena = _get_athena_client()
+    executions = _poll(query_ids)
+    for query_id in query_ids:
+        execution = executions.get(query_id, {'QueryExecutionId': query_id, 'Status': {}})
+        if execution['Status'].get('State') in TERMINAL_STATES:
+            continue  # finished since the last poll
+        try:
+            athena.stop_query_execution(QueryExecutionId=query_id)
+        except ClientError as e:
+            logger.error(f"❌ Failed to stop query {query_id}: {e}")
+        status = {**execution['Status'], 'State': 'CANCELLED', 'StateChangeReason': f'timed out after {timeout:g}s'}
+        executions[query_id] = {**execution, 'Status': status}
+    return executions
+
+
+def wait_for_queries(
+    query_ids: list[str],
+    timeout: float = config.ATHENA_QUERY_TIMEOUT,
+    initial_delay: float = 0.2,
+    max_delay: float = 5.0
+) -> dict[str, dict]:
+    """
+    Poll queries until all are terminal, backing off exponentially.
+
+    Short queries are seen finished within a few hundred ms; long ones
+    cost one request every max_delay seconds. Queries still running at
+    the timeout are stopped and returned as CANCELLED.
+    """
+    deadline = time.monotonic() + timeout
+    delay, done, pending = initial_delay, {}, list(query_ids)
+    while pending:
+        for query_id, execution in _poll(pending).items():
+            if execution['Status']['State'] in TERMINAL_STATES:
+                done[query_id] = execution
+        pending = [query_id for query_id in pending if query_id not in done]
+        remaining = deadline - time.monotonic()
+        if not pending or remaining <= 0:
+            break
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, max_delay)
+    return {**_cancel(pending, timeout), **done} if pending else done
+
+
+def _stats(sql: str, execution: dict) -> QueryStats:
+    """Build QueryStats from a QueryExecution response."""
+    status, statistics = execution['Status'], execution.get('Statistics', {})
+    return QueryStats(
+        sql=sql,
+        query_id=execution['QueryExecutionId'],
+        state=status['State'],
+        engine_ms=statistics.get('EngineExecutionTimeInMillis', 0),
+        total_ms=statistics.get('TotalExecutionTimeInMillis', 0),
+        bytes_scanned=statistics.get('DataScannedInBytes', 0),
+        error=status.get('StateChangeReason'),
+    )
+
+
+# ========================================
+# Results
+# ========================================
+
+def _arrow_type(column: dict) -> pa.DataType:
+    """Arrow type for an Athena ColumnInfo (string when unknown)."""
+    if column['Type'] == 'decimal':
+        return pa.decimal128(column['Precision'], column['Scale'])
+    return ATHENA_TYPES.get(column['Type'], pa.string())
+
+
+def _to_batch(rows: list[dict], columns: list[dict]) -> pa.RecordBatch:
+    """Convert one result page (all values are strings) to a typed batch."""
+    arrays = []
+    for i, column in enumerate(columns):
+        values = pa.array([row['Data'][i].get('VarCharValue') for row in rows], pa.string())
+        arrays.append(pc.cast(values, _arrow_type(column)))
+    return pa.RecordBatch.from_arrays(arrays, names=[column['Name'] for column in columns])
+
+
+def iter_result_batches(query_id: str, page_size: int = 1000) -> Iterator[pa.RecordBatch]:
+    """Stream a finished query's results page by page as Arrow batches."""
+    paginator = _get_athena_client().get_paginator('get_query_results')
+    first = True
+    for page in paginator.paginate(QueryExecutionId=query_id, PaginationConfig={'PageSize': page_size}):
+        columns = page['ResultSet']['ResultSetMetadata']['ColumnInfo']
+        rows = page['ResultSet']['Rows']
+        if first and rows and [d.get('VarCharValue') for d in rows[0]['Data']] == [c['Name'] for c in columns]:
+            rows = rows[1:]  # SELECT results repeat the header as the first row
+        first = False
+        yield _to_batch(rows, columns)
+
+
+def fetch_results(query_id: str) -> pa.Table:
+    """Collect a finished query's results into one Arrow table."""
+    batches = list(iter_result_batches(query_id))
+    return pa.Table.from_batches(batches) if batches else pa.table({})
+
+
+# ========================================
+# Cache
+# ========================================
+
+def normalise_sql(sql: str) -> str:
+    """Canonical SQL for cache keys: no comments, single spaces, keywords lower-cased."""
+    sql = re.sub(r'--[^\n]*', ' ', sql)
+    sql = re.sub(r'/\*.*?\*/', ' ', sql, flags=re.DOTALL)
+    # Odd segments are string literals: keep their case and spacing
+    parts = sql.split("'")
+    parts[::2] = [' '.join(part.split()).lower() for part in parts[::2]]
+    return "'".join(parts).strip().rstrip(';').strip()
+
+
+def referenced_tables(sql: str, database_name: str) -> list[tuple[str, str]]:
+    """(database, table) pairs after FROM/JOIN in normalised SQL."""
+    tables = set()
+    for name in TABLE_PATTERN.findall(sql):
+        database, _, table = name.replace('"', '').rpartition('.')
+        tables.add((database or database_name, table))
+    return sorted(tables)
+
+
+def _location_fingerprint(location: str) -> str:
+    """Hash keys and ETags of every object under an S3 location."""
+    bucket, _, prefix = location.removeprefix('s3://').partition('/')
+    digest = hashlib.sha256()
+    for obj in sorted(iter_objects(bucket, prefix), key=lambda o: o.key):
+        digest.update(f'{obj.key}:{obj.etag}\n'.encode())
+    return digest.hexdigest()
+
+
+def cache_key(sql: str, database_name: str) -> Optional[str]:
+    """
+    Cache key for a query: normalised SQL + fingerprint of its tables' data.
+
+    None (not cacheable) for statements without tables or with a table
+    whose location can't be resolved.
+    """
+    normalised = normalise_sql(sql)
+    tables = referenced_tables(normalised, database_name)
+    if not normalised.startswith(('select', 'with')) or not tables:
+        return None
+
+    digest = hashlib.sha256(normalised.encode())
+    for database, table in tables:
+        location = get_table_location(database, table)
+        if location is None:
+            return None
+        digest.update(f'{database}.{table}={_location_fingerprint(location)}'.encode())
+    return digest.hexdigest()
+
+
+def _cache_path(key: str) -> Path:
+    return config.ATHENA_CACHE_DIR / f'{key}.parquet'
+
+
+def _read_cache(key: Optional[str]) -> Optional[pa.Table]:
+    """Cached result for key, if any."""
+    if key is None or not _cache_path(key).exists():
+        return None
+    return pq.read_table(_cache_path(key))
+
+
+def _write_cache(key: Optional[str], table: pa.Table) -> None:
+    """Store a result (written to a temp file first, then renamed)."""
+    if key is None:
+        return
+    config.ATHENA_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = _cache_path(key).with_suffix('.tmp')
+    pq.write_table(table, tmp_path)
+    tmp_path.replace(_cache_path(key))
+
+
+# ========================================
+# History
+# ========================================
+
+def record_query(stats: QueryStats, path: Path = config.ATHENA_HISTORY_PATH) -> None:
+    """Append a query's runtime and bytes scanned to the JSONL history."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    entry = {'timestamp': datetime.now().isoformat(timespec='seconds'), **asdict(stats)}
+    with open(path, 'a') as f:
+        f.write(json.dumps(entry) + '\n')
+
+
+def load_history(path: Path = config.ATHENA_HISTORY_PATH) -> list[dict]:
+    """Read the query history (oldest first)."""
+    if not path.exists():
+        return []
+    return [json.loads(line) for line in path.read_text().splitlines() if line]
+
+
+def _log_stats(stats: QueryStats) -> None:
+    """One log line per query."""
+    if stats.cached:
+        logger.info(f"💾 Cache hit: {normalise_sql(stats.sql)[:60]}")
+    elif stats.state == 'SUCCEEDED':
+        logger.info(
+            f"✅ Query {stats.query_id}: {stats.engine_ms} ms, "
+            f"{stats.bytes_scanned:,} B scanned (~${stats.cost:.6f})"
+        )
+    else:
+        logger.error(f"❌ Query {stats.query_id} {stats.state}: {stats.error}")
+
+
+def _finish(stats: QueryStats) -> QueryStats:
+    """Log and record a finished (or cached) query."""
+    _log_stats(stats)
+    record_query(stats)
+    return stats
+
+
+# ========================================
+# Public API
+# ========================================
+
+def run_queries(
+    sqls: list[str],
+    database_name: str = config.GLUE_DATABASE_NAME,
+    use_cache: bool = config.ATHENA_CACHE_ENABLED,
+    timeout: float = config.ATHENA_QUERY_TIMEOUT
+) -> list[Optional[pa.Table]]:
+    """
+    Run several queries concurrently, serving repeats from the cache.
+
+    Cache misses are all submitted first and then polled together.
+    Returns one table per query (None for failed queries).
+    """
+    keys = [cache_key(sql, database_name) if use_cache else None for sql in sqls]
+    results = [_read_cache(key) for key in keys]
+    for sql, result in zip(sqls, results):
+        if result is not None:
+            _finish(QueryStats(sql, None, 'SUCCEEDED', cached=True))
+
+    started = {i: start_query(sql, database_name) for i, sql in enumerate(sqls) if results[i] is None}
+    executions = wait_for_queries([qid for qid in started.values() if qid], timeout)
+    for i, query_id in started.items():
+        if query_id is None:
+            _finish(QueryStats(sqls[i], None, 'FAILED', error='submission failed'))
+            continue
+        stats = _finish(_stats(sqls[i], executions[query_id]))
+        if stats.state == 'SUCCEEDED':
+            results[i] = fetch_results(query_id)
+            _write_cache(keys[i], results[i])
+    return results
+
+
+def run_query(
+    sql: str,
+    database_name: str = config.GLUE_DATABASE_NAME,
+    use_cache: bool = config.ATHENA_CACHE_ENABLED,
+    timeout: float = config.ATHENA_QUERY_TIMEOUT
+) -> Optional[pa.Table]:
+    """Run one query and return its result as an Arrow table (None on failure)."""
+    return run_queries([sql], database_name, use_cache, timeout)[0]
@@ -0,0 +1,260 @@
+"""Asyncio API for high fan-out S3 and Glue control-plane calls.
+
+Setting up the lake or registering a catalog means hundreds of small
+calls (folder markers, HEADs, table upserts, partition batches). Made one
+after another, they take hundreds of round trips. Here they are issued
+concurrently, so a batch takes about as long as its slowest few calls.
+
+boto3 is blocking, so AsyncBridge runs the calls on a bounded thread pool
+with a shared pooled client. It adds:
+- a semaphore limiting calls in flight (AWS_ASYNC_CONCURRENCY)
+- the retry policy of retry.py (full-jitter backoff on throttling and
+  5xx errors, per-operation budgets) on top of the client's adaptive
+  mode, up to AWS_ASYNC_MAX_ATTEMPTS per call
+- a retry budget for the whole batch (AWS_ASYNC_RETRY_BUDGET), so a
+  failing service makes the batch fail fast instead of every call
+  retrying to exhaustion
+
+    await setup_data_lake_structure(bucket)
+    async with AsyncBridge() as bridge:
+        heads = await head_objects(bucket, keys, bridge)
+
+Functions take an optional bridge so several batches can share one
+limiter and budget; without one they open their own.
+"""
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import Any, AsyncIterator, Optional
+
+from botocore.exceptions import ClientError
+
+from . import config, metrics, retry
+from .aws_clients import get_client
+from .s3_client import DATA_LAKE_FOLDERS, ObjectInfo
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class AsyncBridge:
+    """Runs blocking boto3 calls for asyncio code on a bounded thread pool."""
+
+    def __init__(
+        self,
+        concurrency: int = config.AWS_ASYNC_CONCURRENCY,
+        max_attempts: int = config.AWS_ASYNC_MAX_ATTEMPTS,
+        retry_budget: int = config.AWS_ASYNC_RETRY_BUDGET
+    ):
+        self.concurrency = concurrency
+        self.max_attempts = max_attempts
+        self.budget = retry.RetryBudget(retry_budget)
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='aws-async')
+
+    async def __aenter__(self) -> 'AsyncBridge':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.executor.shutdown(wait=False)
+
+    async def _call_once(self, service: str, operation: str, kwargs: dict) -> dict:
+        method = getattr(get_client(service, max_pool_connections=self.concurrency), operation)
+        async with self.semaphore:
+            return await asyncio.get_running_loop().run_in_executor(self.executor, partial(method, **kwargs))
+
+    async def call(self, service: str, operation: str, **kwargs: Any) -> dict:
+        """Call client.operation(**kwargs), retrying throttles while the budgets last."""
+        name = f'{service}:{operation}'
+        for attempt in range(self.max_attempts):
+            try:
+                result = await self._call_once(service, operation, kwargs)
+            except ClientError as e:
+                if not retry.should_retry(name, e, attempt, self.max_attempts, self.budget):
+                    raise
+                await asyncio.sleep(retry.backoff_delay(attempt))
+                continue
+            retry.budget(name).refund()
+            return result
+
+
+@asynccontextmanager
+async def _bridge(bridge: Optional[AsyncBridge]) -> AsyncIterator[AsyncBridge]:
+    """Use the caller's bridge, or open one for this batch."""
+    if bridge is not None:
+        yield bridge
+        return
+    async with AsyncBridge() as own:
+        yield own
+
+
+# ========================================
+# S3
+# ========================================
+
+async def _put_folder(bridge: AsyncBridge, bucket_name: str, folder_path: str) -> bool:
+    try:
+        await bridge.call('s3', 'put_object', Bucket=bucket_name, Key=folder_path, Body=b'')
+    except ClientError as e:
+        logger.error(f"❌ Failed to create s3://{bucket_name}/{folder_path}: {e}")
+        return False
+    logger.info(f"📁 s3://{bucket_name}/{folder_path}")
+    return True
+
+
+async def put_folders(bucket_name: str, folders: list[str], bridge: Optional[AsyncBridge] = None) -> int:
+    """Create folder markers concurrently. Returns the number created."""
+    async with _bridge(bridge) as bridge:
+        created = await asyncio.gather(*(_put_folder(bridge, bucket_name, folder) for folder in folders))
+    return sum(created)
+
+
+async def setup_data_lake_structure(bucket_name: str, bridge: Optional[AsyncBridge] = None) -> bool:
+    """Concurrent s3_client.setup_data_lake_structure. True if every folder exists."""
+    created = await put_folders(bucket_name, DATA_LAKE_FOLDERS, bridge)
+    return created == len(DATA_LAKE_FOLDERS)
+
+
+async def _head_object(bridge: AsyncBridge, bucket_name: str, key: str) -> Optional[ObjectInfo]:
+    try:
+        response = await bridge.call('s3', 'head_object', Bucket=bucket_name, Key=key)
+    except ClientError as e:
+        if e.response['Error']['Code'] not in ('404', 'NoSuchKey'):
+            logger.error(f"❌ Head failed: {key}: {e}")
+        return None
+    return ObjectInfo(key, response['ContentLength'], response['ETag'].strip('"'), response['LastModified'])
+
+
+async def head_objects(
+    bucket_name: str, keys: list[str], bridge: Optional[AsyncBridge] = None
+) -> dict[str, Optional[ObjectInfo]]:
+    """HEAD many keys concurrently: {key: ObjectInfo, or None if missing}."""
+    async with _bridge(bridge) as bridge:
+        heads = await asyncio.gather(*(_head_object(bridge, bucket_name, key) for key in keys))
+    return dict(zip(keys, heads))
+
+
+async def _list_prefix(bridge: AsyncBridge, bucket_name: str, prefix: str) -> list[ObjectInfo]:
+    """All objects under one prefix (its pages are sequential by nature)."""
+    objects, token = [], None
+    while True:
+        kwargs = {'ContinuationToken': token} if token else {}
+        page = await bridge.call('s3', 'list_objects_v2', Bucket=bucket_name, Prefix=prefix, **kwargs)
+        objects += [
+            ObjectInfo(obj['Key'], obj['Size'], obj['ETag'].strip('"'), obj['LastModified'])
+            for obj in page.get('Contents', [])
+        ]
+        token = page.get('NextContinuationToken')
+        if not token:
+            return objects
+
+
+async def list_prefixes(
+    bucket_name: str, prefixes: list[str], bridge: Optional[AsyncBridge] = None
+) -> dict[str, list[ObjectInfo]]:
+    """List several prefixes concurrently: {prefix: objects}."""
+    async with _bridge(bridge) as bridge:
+        listings = await asyncio.gather(*(_list_prefix(bridge, bucket_name, prefix) for prefix in prefixes))
+    return dict(zip(prefixes, listings))
+
+
+async def _delete_batch(bridge: AsyncBridge, bucket_name: str, keys: list[str]) -> int:
+    try:
+        response = await bridge.call(
+            's3', 'delete_objects', Bucket=bucket_name,
+            Delete={'Objects': [{'Key': key} for key in keys], 'Quiet': True}
+        )
+    except ClientError as e:
+        logger.error(f"❌ Failed to delete {len(keys)} objects: {e}")
+        return 0
+    for error in response.get('Errors', []):
+        logger.error(f"❌ Failed to delete {error['Key']}: {error['Message']}")
+    return len(keys) - len(response.get('Errors', []))
+
+
+async def delete_objects(bucket_name: str, keys: list[str], bridge: Optional[AsyncBridge] = None) -> int:
+    """Delete keys in concurrent batches of 1000. Returns the number deleted."""
+    async with _bridge(bridge) as bridge:
+        deleted = await asyncio.gather(*(
+            _delete_batch(bridge, bucket_name, keys[start:start + 1000]) for start in range(0, len(keys), 1000)
+        ))
+    return sum(deleted)
+
+
+# ========================================
+# Glue
+# ========================================
+
+async def upsert_table(database_name: str, table_input: dict, bridge: Optional[AsyncBridge] = None) -> bool:
+    """Async glue_client.upsert_table: create the table, or update it if it exists."""
+    async with _bridge(bridge) as bridge:
+        try:
+            await bridge.call('glue', 'create_table', DatabaseName=database_name, TableInput=table_input)
+            logger.info(f"✅ Created table '{database_name}.{table_input['Name']}'")
+            return True
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'AlreadyExistsException':
+                logger.error(f"❌ Failed to create table '{table_input['Name']}': {e}")
+                return False
+        try:
+            await bridge.call('glue', 'update_table', DatabaseName=database_name, TableInput=table_input)
+            logger.info(f"🔄 Updated table '{database_name}.{table_input['Name']}'")
+            return True
+        except ClientError as e:
+            logger.error(f"❌ Failed to update table '{table_input['Name']}': {e}")
+            return False
+
+
+async def _create_partition_batch(
+    bridge: AsyncBridge, database_name: str, table_name: str, batch: list[dict]
+) -> tuple[int, int]:
+    """(created, failed) for one batch; existing partitions are neither."""
+    try:
+        response = await bridge.call(
+            'glue', 'batch_create_partition',
+            DatabaseName=database_name, TableName=table_name, PartitionInputList=batch
+        )
+    except ClientError as e:
+        logger.error(f"❌ Failed to create partitions for '{table_name}': {e}")
+        return 0, len(batch)
+    errors = response.get('Errors', [])
+    failed = [error for error in errors if error['ErrorDetail']['ErrorCode'] != 'AlreadyExistsException']
+    for error in failed:
+        logger.error(f"❌ Partition {error['PartitionValues']}: {error['ErrorDetail']['ErrorMessage']}")
+    return len(batch) - len(errors), len(failed)
+
+
+async def batch_create_partitions(
+    database_name: str, table_name: str, partitions: list[dict], bridge: Optional[AsyncBridge] = None
+) -> tuple[int, int]:
+    """Async glue_client.batch_create_partitions: batches of 100, sent concurrently. Returns (created, failed)."""
+    async with _bridge(bridge) as bridge:
+        batches = await asyncio.gather(*(
+            _create_partition_batch(bridge, database_name, table_name, partitions[start:start + 100])
+            for start in range(0, len(partitions), 100)
+        ))
+    created, failed = sum(created for created, _ in batches), sum(failed for _, failed in batches)
+    metrics.inc('glue_partitions_created_total', created, table=table_name)
+    return created, failed
+
+
+async def _start_crawler(bridge: AsyncBridge, crawler_name: str) -> bool:
+    try:
+        await bridge.call('glue', 'start_crawler', Name=crawler_name)
+    except ClientError as e:
+        if e.response['Error']['Code'] != 'CrawlerRunningException':
+            logger.error(f"❌ Failed to start crawler '{crawler_name}': {e}")
+            return False
+        logger.info(f"⏳ Crawler '{crawler_name}' is already running")
+        return True
+    logger.info(f"🚀 Started crawler '{crawler_name}'")
+    return True
+
+
+async def start_crawlers(crawler_names: list[str], bridge: Optional[AsyncBridge] = None) -> dict[str, bool]:
+    """Start several crawlers concurrently: {name: started or already running}."""
+    async with _bridge(bridge) as bridge:
+        started = await asyncio.gather(*(_start_crawler(bridge, name) for name in crawler_names))
+    return dict(zip(crawler_names, started))
@@ -0,0 +1,76 @@
+"""Process-wide cache of boto3 clients.
+
+Creating a boto3 client re-parses the service model JSON and opens a new
+connection pool, which costs tens of milliseconds per call. Clients are
+thread-safe, so one instance per (service, region, credentials, pool size)
+is built on first use and shared by every caller. boto3 itself is imported
+lazily so that importing `src` modules stays cheap until an AWS call is made.
+
+Clients use the shared retry policy (retry.client_config: adaptive mode)
+and count throttled responses (retry.instrument).
+"""
+import hashlib
+import logging
+import threading
+from typing import Any, Optional
+
+from . import config, retry
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+_clients: dict[tuple, Any] = {}
+_lock = threading.Lock()
+
+
+def _credentials_fingerprint() -> str:
+    """Hash current credentials so rotated keys get fresh clients."""
+    raw = f"{config.AWS_ACCESS_KEY_ID}:{config.AWS_SECRET_ACCESS_KEY}"
+    return hashlib.sha256(raw.encode()).hexdigest()[:16]
+
+
+def _create_client(service: str, region: str, max_pool_connections: Optional[int]) -> Any:
+    """Build a boto3 client (imports boto3 on first use)."""
+    import boto3
+    from botocore.config import Config
+
+    pool = {'max_pool_connections': max_pool_connections} if max_pool_connections else {}
+    client = boto3.client(
+        service,
+        aws_access_key_id=config.AWS_ACCESS_KEY_ID,
+        aws_secret_access_key=config.AWS_SECRET_ACCESS_KEY,
+        region_name=region,
+        config=Config(**retry.client_config(), **pool)
+    )
+    return retry.instrument(client)
+
+
+def get_client(
+    service: str,
+    region: Optional[str] = None,
+    max_pool_connections: Optional[int] = None
+) -> Any:
+    """
+    Get a cached boto3 client, creating it on first use.
+
+    Args:
+        service: AWS service name ('s3', 'glue', 'iam', ...)
+        region: Defaults to config.AWS_REGION
+        max_pool_connections: HTTP pool size for clients used from many threads
+    """
+    key = (service, region or config.AWS_REGION, _credentials_fingerprint(), max_pool_connections)
+    client = _clients.get(key)
+    if client is None:
+        with _lock:
+            client = _clients.get(key)
+            if client is None:
+                client = _create_client(service, key[1], max_pool_connections)
+                _clients[key] = client
+                logger.debug(f"🔌 Created {service} client ({key[1]})")
+    return client
+
+
+def clear_client_cache() -> None:
+    """Drop all cached clients (e.g. after changing credentials or in tests)."""
+    with _lock:
+        _clients.clear()
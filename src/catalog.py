@@ -0,0 +1,203 @@
+"""Crawler-free Glue catalog registration for the processed zone.
+
+The transformer already knows what it wrote: the Arrow schema is in each
+Parquet footer and the partition is in the Hive path
+(date=2024-01-15/, year=2024/month=01/). Registering tables and partitions
+straight from that makes a new load queryable in seconds, without a
+crawler run (minutes plus DPU time).
+
+Tables are named like the crawler named them (parquet_{entity}), so the
+queries in sql/ keep working.
+
+register_uploads() registers all entities concurrently through aws_async
+(table upsert, then partition batches per entity).
+"""
+import asyncio
+import logging
+from pathlib import Path
+from typing import Optional
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from . import aws_async, config
+from .glue_client import batch_create_partitions, upsert_table
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+PARQUET_FORMAT = {
+    'InputFormat': 'org.apache.hadoop.hive.ql.io.parquet.MapredParquetInputFormat',
+    'OutputFormat': 'org.apache.hadoop.hive.ql.io.parquet.MapredParquetOutputFormat',
+    'SerdeInfo': {'SerializationLibrary': 'org.apache.hadoop.hive.ql.io.parquet.serde.ParquetHiveSerDe'},
+}
+
+SIMPLE_TYPES = {
+    pa.bool_(): 'boolean',
+    pa.int8(): 'tinyint',
+    pa.int16(): 'smallint',
+    pa.int32(): 'int',
+    pa.int64(): 'bigint',
+    pa.float32(): 'float',
+    pa.float64(): 'double',
+    pa.string(): 'string',
+    pa.large_string(): 'string',
+    pa.binary(): 'binary',
+    pa.date32(): 'date',
+}
+
+
+def glue_type(arrow_type: pa.DataType) -> str:
+    """Hive/Glue column type for an Arrow type."""
+    if pa.types.is_dictionary(arrow_type):
+        return glue_type(arrow_type.value_type)
+    if pa.types.is_decimal(arrow_type):
+        return f'decimal({arrow_type.precision},{arrow_type.scale})'
+    if pa.types.is_timestamp(arrow_type):
+        return 'timestamp'
+    return SIMPLE_TYPES.get(arrow_type, 'string')
+
+
+def parse_partition(relative_dir: str) -> list[tuple[str, str]]:
+    """Hive path segments → [(key, value)], e.g. 'year=2024/month=1' → [('year', '2024'), ...]."""
+    return [tuple(segment.split('=', 1)) for segment in relative_dir.split('/') if '=' in segment]
+
+
+def _partition_keys(partition: list[tuple[str, str]]) -> list[dict]:
+    """Partition columns: numeric values (year, month) as int, others as string."""
+    return [{'Name': key, 'Type': 'int' if value.isdigit() else 'string'} for key, value in partition]
+
+
+def table_input(table_name: str, location: str, schema: pa.Schema, partition: list[tuple[str, str]]) -> dict:
+    """Glue TableInput for an external Parquet table."""
+    partition_names = {key for key, _ in partition}
+    columns = [
+        {'Name': field.name, 'Type': glue_type(field.type)}
+        for field in schema if field.name not in partition_names
+    ]
+    return {
+        'Name': table_name,
+        'TableType': 'EXTERNAL_TABLE',
+        'Parameters': {'classification': 'parquet', 'EXTERNAL': 'TRUE'},
+        'PartitionKeys': _partition_keys(partition),
+        'StorageDescriptor': {'Columns': columns, 'Location': location, **PARQUET_FORMAT},
+    }
+
+
+def partition_input(table: dict, partition: list[tuple[str, str]]) -> dict:
+    """Glue PartitionInput for one Hive partition of table."""
+    relative_dir = '/'.join(f'{key}={value}' for key, value in partition)
+    storage = {**table['StorageDescriptor'], 'Location': f"{table['StorageDescriptor']['Location']}{relative_dir}/"}
+    return {'Values': [value for _, value in partition], 'StorageDescriptor': storage}
+
+
+def _group_by_entity(uploads: list[tuple[Path, str]], prefix: str) -> dict[str, dict[str, Path]]:
+    """entity → {relative partition dir: one local file in it}."""
+    entities: dict[str, dict[str, Path]] = {}
+    for local_path, s3_key in uploads:
+        entity, _, rest = s3_key[len(prefix):].partition('/')
+        relative_dir = rest.rpartition('/')[0]
+        entities.setdefault(entity, {}).setdefault(relative_dir, local_path)
+    return entities
+
+
+def _entity_inputs(
+    entity: str,
+    partitions: dict[str, Path],
+    bucket_name: str,
+    prefix: str,
+    table_prefix: str
+) -> tuple[dict, list[dict]]:
+    """TableInput from the entity's newest file, and PartitionInputs in its layout."""
+    newest_dir = max(partitions, key=lambda relative_dir: partitions[relative_dir].stat().st_mtime)
+    partition = parse_partition(newest_dir)
+    location = f's3://{bucket_name}/{prefix}{entity}/'
+    table = table_input(f'{table_prefix}{entity}', location, pq.read_schema(partitions[newest_dir]), partition)
+
+    keys = [key for key, _ in partition]
+    inputs = [
+        partition_input(table, parse_partition(relative_dir))
+        for relative_dir in sorted(partitions)
+        if [key for key, _ in parse_partition(relative_dir)] == keys
+    ]
+    return table, inputs if keys else []
+
+
+def register_entity(
+    entity: str,
+    partitions: dict[str, Path],
+    bucket_name: str,
+    database_name: str,
+    prefix: str,
+    table_prefix: str = 'parquet_'
+) -> tuple[int, bool]:
+    """
+    Upsert an entity's table from its newest file, then add its partitions.
+
+    Returns (partitions created, False if the upsert or any partition failed).
+    """
+    table, inputs = _entity_inputs(entity, partitions, bucket_name, prefix, table_prefix)
+    if not upsert_table(database_name, table):
+        return 0, False
+    created, failed = batch_create_partitions(database_name, table['Name'], inputs) if inputs else (0, 0)
+    return created, failed == 0
+
+
+async def register_entity_async(
+    entity: str,
+    partitions: dict[str, Path],
+    bucket_name: str,
+    database_name: str,
+    prefix: str,
+    table_prefix: str = 'parquet_',
+    bridge: Optional[aws_async.AsyncBridge] = None
+) -> tuple[int, bool]:
+    """register_entity through aws_async (partition batches sent concurrently)."""
+    table, inputs = _entity_inputs(entity, partitions, bucket_name, prefix, table_prefix)
+    if not await aws_async.upsert_table(database_name, table, bridge):
+        return 0, False
+    if not inputs:
+        return 0, True
+    created, failed = await aws_async.batch_create_partitions(database_name, table['Name'], inputs, bridge)
+    return created, failed == 0
+
+
+async def register_uploads_async(
+    uploads: list[tuple[Path, str]],
+    bucket_name: str = config.S3_BUCKET_NAME,
+    database_name: str = config.GLUE_DATABASE_NAME,
+    prefix: str = f'{config.S3_PROCESSED_PREFIX}finanzas/',
+    table_prefix: str = 'parquet_'
+) -> bool:
+    """Register every entity of the uploads concurrently. True if every table and partition registered."""
+    entities = sorted(_group_by_entity(uploads, prefix).items())
+    async with aws_async.AsyncBridge() as bridge:
+        results = await asyncio.gather(*(
+            register_entity_async(entity, partitions, bucket_name, database_name, prefix, table_prefix, bridge)
+            for entity, partitions in entities
+        ))
+    failed = [entity for (entity, _), (_, ok) in zip(entities, results) if not ok]
+    logger.info(f"📚 Registered {sum(created for created, _ in results)} new partitions in '{database_name}'")
+    if failed:
+        logger.error(f"❌ Catalog registration failed for {failed}")
+    return not failed
+
+
+def register_uploads(
+    uploads: list[tuple[Path, str]],
+    bucket_name: str = config.S3_BUCKET_NAME,
+    database_name: str = config.GLUE_DATABASE_NAME,
+    prefix: str = f'{config.S3_PROCESSED_PREFIX}finanzas/',
+    table_prefix: str = 'parquet_'
+) -> bool:
+    """
+    Register tables and partitions for uploaded (local_path, s3_key) pairs.
+
+    Uses the same layout rule as the upload: s3_key is
+    {prefix}{entity}/{hive partition dirs}/{file}.parquet. Files in a
+    layout other than the newest one (e.g. old date= folders after
+    switching an entity to year=/month=) are left out. Returns False if
+    any table upsert or partition batch failed (partitions that already
+    exist are not failures).
+    """
+    return asyncio.run(register_uploads_async(uploads, bucket_name, database_name, prefix, table_prefix))
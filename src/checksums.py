@@ -0,0 +1,103 @@
+"""Local S3 ETags, for skipping uploads of unchanged files.
+
+For unencrypted or SSE-S3 objects, S3's ETag is computed from the
+content:
+- single PUT: md5(file)
+- multipart upload: md5(md5(part 1) + ... + md5(part n)) + '-n'
+
+upload_files() splits with multipart_threshold = multipart_chunksize, so
+file_etag() computed with the same part size reproduces the ETag the
+upload would create, reading the file once. (s3transfer grows the part
+size for files over 10,000 parts; the same adjustment is applied here.)
+
+Hashing a large file costs about as much as reading it. Results are
+cached in ETAG_CACHE_PATH by path, size, mtime and part size, so a rerun
+only hashes files that changed.
+
+manifest.py (INCREMENTAL runs) trusts its local record of past uploads.
+This comparison is against the bucket's current state, so it also skips
+files uploaded by another machine or an earlier run without a manifest.
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+
+from . import config
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+READ_CHUNK = 1024 * 1024  # bytes per read
+
+_cache_lock = threading.Lock()
+
+
+def effective_part_size(file_size: int, part_size: int) -> int:
+    """Part size s3transfer actually uses for a file (it grows it past 10,000 parts)."""
+    from s3transfer.utils import ChunksizeAdjuster
+
+    return ChunksizeAdjuster().adjust_chunksize(part_size, file_size)
+
+
+def _part_digests(path: Path, part_size: int) -> list[bytes]:
+    """MD5 of each part_size slice of the file, streamed."""
+    digests = []
+    with open(path, 'rb') as f:
+        while True:
+            part, remaining = hashlib.md5(), part_size
+            while remaining and (chunk := f.read(min(READ_CHUNK, remaining))):
+                part.update(chunk)
+                remaining -= len(chunk)
+            if remaining == part_size:
+                return digests or [part.digest()]
+            digests.append(part.digest())
+
+
+def file_etag(path: Path, part_size: int = config.S3_MULTIPART_CHUNKSIZE) -> str:
+    """The ETag upload_files() would give this file (multipart above part_size)."""
+    size = path.stat().st_size
+    if size < part_size:
+        return _part_digests(path, max(size, 1))[0].hex()
+    digests = _part_digests(path, effective_part_size(size, part_size))
+    return f'{hashlib.md5(b"".join(digests)).hexdigest()}-{len(digests)}'
+
+
+# ========================================
+# Cache
+# ========================================
+
+def load_cache(path: Path = config.ETAG_CACHE_PATH) -> dict[str, dict]:
+    """{local path: {size, mtime_ns, part_size, etag}} ({} if missing)."""
+    try:
+        return json.loads(path.read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_cache(cache: dict[str, dict], path: Path = config.ETAG_CACHE_PATH) -> None:
+    """Write the cache atomically, dropping files that no longer exist."""
+    with _cache_lock:
+        live = {local: entry for local, entry in cache.items() if os.path.exists(local)}
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix('.tmp')
+    tmp_path.write_text(json.dumps(live, indent=1, sort_keys=True))
+    os.replace(tmp_path, path)
+
+
+def cached_etag(path: Path, cache: dict[str, dict], part_size: int = config.S3_MULTIPART_CHUNKSIZE) -> str:
+    """file_etag(), reusing the cached value while the file is unchanged."""
+    stat = path.stat()
+    key = str(path.resolve())
+    fingerprint = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'part_size': part_size}
+    with _cache_lock:
+        entry = cache.get(key)
+    if entry and {k: entry.get(k) for k in fingerprint} == fingerprint:
+        return entry['etag']
+
+    etag = file_etag(path, part_size)
+    with _cache_lock:
+        cache[key] = {**fingerprint, 'etag': etag}
+    return etag
@@ -0,0 +1,204 @@
+"""Sort (cluster) Parquet output on query predicates.
+
+Rows written in CSV order give every row group the same min/max range,
+so Athena cannot skip any of them. Sorting on the columns queries filter
+by (customer_id, city, dates...) makes row-group statistics selective.
+
+Tables that fit in memory are sorted directly. Larger inputs go through
+an external merge sort: sorted runs are spilled to temporary Parquet
+files and merged batch-wise (rows up to the smallest run-tail key are
+safe to emit), so memory stays bounded by the run size.
+"""
+import logging
+import tempfile
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from . import config
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Columns the reference queries in sql/ filter, join or group on
+CLUSTER_KEYS: dict[str, list[str]] = {
+    'customers': ['city', 'customer_id'],
+    'accounts': ['customer_id'],
+    'transactions': ['transaction_date', 'account_id'],
+    'transfers': ['transfer_date'],
+    'loans': ['status', 'loan_type'],
+    'loan_payments': ['payment_date'],
+    'investments': ['customer_id'],
+    'exchange_rates': ['date'],
+}
+
+PREDICATES = {
+    '=': lambda lo, hi, v: lo <= v <= hi,
+    '<': lambda lo, hi, v: lo < v,
+    '<=': lambda lo, hi, v: lo <= v,
+    '>': lambda lo, hi, v: hi > v,
+    '>=': lambda lo, hi, v: hi >= v,
+}
+
+
+def get_cluster_keys(entity: str) -> Optional[list[str]]:
+    """Sort keys for entity, or None if clustering is disabled/unconfigured."""
+    if not config.PARQUET_CLUSTERING:
+        return None
+    return CLUSTER_KEYS.get(entity)
+
+
+def _comparable(column: pa.ChunkedArray | pa.Array) -> pa.ChunkedArray | pa.Array:
+    """Decode dictionary columns (sort/compare kernels don't support them)."""
+    if pa.types.is_dictionary(column.type):
+        return column.cast(column.type.value_type)
+    return column
+
+
+def sort_table(table: pa.Table, keys: list[str]) -> pa.Table:
+    """Sort table ascending by keys, nulls last."""
+    key_table = pa.table({key: _comparable(table[key]) for key in keys})
+    indices = pc.sort_indices(key_table, sort_keys=[(key, 'ascending') for key in keys])
+    return table.take(indices)
+
+
+def _write_run(table: pa.Table, keys: list[str], run_paths: list[Path], tmp_dir: Path) -> None:
+    """Sort a table and spill it as the next run file."""
+    run_paths.append(tmp_dir / f'run{len(run_paths):05d}.parquet')
+    pq.write_table(sort_table(table, keys), run_paths[-1])
+
+
+def _spill_runs(
+    batches: Iterable[pa.RecordBatch],
+    keys: list[str],
+    run_rows: int,
+    tmp_dir: Path
+) -> tuple[Optional[pa.Table], list[Path]]:
+    """
+    Cut input into sorted runs of ~run_rows rows.
+
+    Returns (sorted table, []) when everything fits in one run, otherwise
+    (None, run file paths).
+    """
+    buffer, buffered_rows, run_paths = [], 0, []
+    for batch in batches:
+        buffer.append(batch)
+        buffered_rows += batch.num_rows
+        if buffered_rows >= run_rows:
+            _write_run(pa.Table.from_batches(buffer), keys, run_paths, tmp_dir)
+            buffer, buffered_rows = [], 0
+
+    if not run_paths:
+        return (sort_table(pa.Table.from_batches(buffer), keys) if buffer else None), []
+    if buffer:
+        _write_run(pa.Table.from_batches(buffer), keys, run_paths, tmp_dir)
+    return None, run_paths
+
+
+def _lt_eq(column: pa.ChunkedArray, value: pa.Scalar) -> tuple[pa.ChunkedArray, pa.ChunkedArray]:
+    """Elementwise (column < value, column == value) with nulls sorting last."""
+    column = _comparable(column)
+    if not value.is_valid:
+        return pc.is_valid(column), pc.is_null(column)
+    less = pc.fill_null(pc.less(column, value), False)
+    equal = pc.fill_null(pc.equal(column, value), False)
+    return less, equal
+
+
+def _le_bound(table: pa.Table, keys: list[str], bound: dict[str, pa.Scalar]) -> int:
+    """Count leading rows of a sorted table that are <= bound (lexicographic)."""
+    less, equal = _lt_eq(table[keys[-1]], bound[keys[-1]])
+    mask = pc.or_(less, equal)
+    for key in reversed(keys[:-1]):
+        less, equal = _lt_eq(table[key], bound[key])
+        mask = pc.or_(less, pc.and_(equal, mask))
+    return pc.sum(mask).as_py() or 0
+
+
+def merge_sorted_runs(run_paths: list[Path], keys: list[str], batch_rows: int) -> Iterator[pa.Table]:
+    """K-way merge of sorted run files, emitting sorted tables batch-wise."""
+    readers = [pq.ParquetFile(path).iter_batches(batch_size=batch_rows) for path in run_paths]
+    buffers = [pa.Table.from_batches([next(reader)]) for reader in readers]
+    live = list(range(len(readers)))
+
+    while live:
+        # Smallest last-key across buffers: every row <= it is globally next
+        tails = pa.concat_tables(
+            [buffers[i].slice(buffers[i].num_rows - 1) for i in live], promote_options='permissive'
+        )
+        bound_row = sort_table(tails, keys).slice(0, 1)
+        bound = {key: _comparable(bound_row[key])[0] for key in keys}
+
+        taken = []
+        for i in live:
+            count = _le_bound(buffers[i], keys, bound)
+            taken.append(buffers[i].slice(0, count))
+            buffers[i] = buffers[i].slice(count)
+        yield sort_table(pa.concat_tables(taken, promote_options='permissive'), keys)
+
+        live = [i for i in live if _refill(buffers, readers, i)]
+
+
+def _refill(buffers: list[pa.Table], readers: list[Iterator], i: int) -> bool:
+    """Load the next batch into an empty buffer; False once the run is exhausted."""
+    if buffers[i].num_rows:
+        return True
+    batch = next(readers[i], None)
+    if batch is None:
+        return False
+    buffers[i] = pa.Table.from_batches([batch])
+    return True
+
+
+def external_sort(
+    batches: Iterable[pa.RecordBatch],
+    keys: list[str],
+    run_rows: int = config.CLUSTER_RUN_ROWS
+) -> Iterator[pa.Table]:
+    """
+    Sort a stream of batches with bounded memory.
+
+    Yields sorted tables in order; a single table if the input fits in
+    one run of `run_rows` rows.
+    """
+    with tempfile.TemporaryDirectory(prefix='cluster-') as tmp:
+        table, run_paths = _spill_runs(batches, keys, run_rows, Path(tmp))
+        if table is not None:
+            yield table
+        elif run_paths:
+            logger.info(f"🔀 Merging {len(run_paths)} sorted runs on {keys}")
+            yield from merge_sorted_runs(run_paths, keys, max(run_rows // len(run_paths), 1024))
+
+
+def matching_row_groups(metadata: pq.FileMetaData, column: str, op: str, value: Any) -> list[int]:
+    """
+    Row groups a `column <op> value` predicate cannot rule out via min/max stats.
+
+    `value` must be the Python type of the column's statistics (date,
+    datetime, Decimal, str, int...). Row groups without statistics match.
+    """
+    index = metadata.schema.names.index(column)
+    matches = []
+    for i in range(metadata.num_row_groups):
+        stats = metadata.row_group(i).column(index).statistics
+        if stats is None or not stats.has_min_max or PREDICATES[op](stats.min, stats.max, value):
+            matches.append(i)
+    return matches
+
+
+def pruning_report(parquet_path: Path, column: str, op: str, value: Any) -> dict:
+    """Count row groups a `column <op> value` predicate can skip (see matching_row_groups)."""
+    metadata = pq.ParquetFile(parquet_path).metadata
+    scanned = matching_row_groups(metadata, column, op, value)
+    sizes = [metadata.row_group(i).total_byte_size for i in range(metadata.num_row_groups)]
+
+    return {
+        'predicate': f'{column} {op} {value!r}',
+        'row_groups': metadata.num_row_groups,
+        'row_groups_pruned': metadata.num_row_groups - len(scanned),
+        'bytes_total': sum(sizes),
+        'bytes_scanned': sum(sizes[i] for i in scanned),
+    }
@@ -0,0 +1,343 @@
+"""Small-file compaction for the processed zone.
+
+Every run adds files under processed/finanzas/{entity}/..., and Hive
+partitioning multiplies them. Many small objects slow down Athena query
+planning and cost one GET each. Compaction merges the small files of a
+partition into files of ~COMPACTION_TARGET_SIZE:
+
+1. List the prefix and group files below the target size by partition
+2. Pack each partition's small files into groups of ~target size
+3. Download a group, stream its row groups into one Parquet file
+4. Upload it under a hidden `_compacting-*` key (ignored by Athena)
+5. Once the whole partition is staged, copy server-side to the final
+   keys and batch-delete the originals and staging objects
+
+S3 has no atomic rename; staging keeps the window in which readers can
+see both old and new files down to a few server-side copies.
+
+Outputs are named like the writer's own files ({entity}-{i}.parquet,
+using indices free in the partition). The upload step mirrors the local
+tree: delete_superseded() removes remote files an upload no longer
+contains, so rows are never served twice. compact_local() therefore
+applies the same plan to the local processed tree before each upload
+(script 07, pipeline). The upload then carries compacted files, instead
+of republishing the small ones and deleting what compact() merged.
+
+Only partitions with several small files are compacted. Run-date
+folders (date=YYYY-MM-DD/) hold one file, a full snapshot of the
+entity, and merging across snapshots would duplicate every row, so they
+are left alone; expire old snapshots with lifecycle rules instead.
+"""
+import logging
+import os
+import tempfile
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from . import config
+from .parquet_profiles import WriterProfile, get_profile, row_groups
+from .s3_client import ObjectInfo, copy_object, delete_objects, download_file, iter_objects, upload_file
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class CompactionGroup(NamedTuple):
+    """Small files of one partition that become one output file."""
+    partition: str
+    entity: str
+    objects: list[ObjectInfo]
+
+
+@dataclass
+class CompactionReport:
+    """Outcome (or, in dry-run mode, the plan) of a compaction pass."""
+    dry_run: bool
+    partitions: int = 0
+    files_before: int = 0
+    files_after: int = 0
+    bytes_before: int = 0
+    bytes_after: int = 0
+
+    @property
+    def files_saved(self) -> int:
+        return self.files_before - self.files_after
+
+    @property
+    def bytes_saved(self) -> int:
+        return self.bytes_before - self.bytes_after
+
+
+def _is_data_file(key: str) -> bool:
+    """Parquet data file, excluding hidden (_ / .) staging objects."""
+    name = key.rsplit('/', 1)[-1]
+    return name.endswith('.parquet') and not name.startswith(('_', '.'))
+
+
+def list_partitions(bucket_name: str, prefix: str) -> dict[str, list[ObjectInfo]]:
+    """Map partition prefix → its data files."""
+    partitions: dict[str, list[ObjectInfo]] = {}
+    for obj in iter_objects(bucket_name, prefix):
+        if _is_data_file(obj.key):
+            partitions.setdefault(obj.key.rsplit('/', 1)[0] + '/', []).append(obj)
+    return partitions
+
+
+def _small_files(partitions: dict[str, list[ObjectInfo]], target_size: int) -> dict[str, list[ObjectInfo]]:
+    small = {partition: [obj for obj in objs if obj.size < target_size] for partition, objs in partitions.items()}
+    return {partition: objs for partition, objs in small.items() if len(objs) > 1}
+
+
+def find_small_files(bucket_name: str, prefix: str, target_size: int) -> dict[str, list[ObjectInfo]]:
+    """Map partition prefix → files below target_size, for partitions with 2+ of them."""
+    return _small_files(list_partitions(bucket_name, prefix), target_size)
+
+
+def _pack(objects: list[ObjectInfo], target_size: int) -> list[list[ObjectInfo]]:
+    """Pack files (in key order) into groups of ~target_size bytes."""
+    groups, current, current_size = [], [], 0
+    for obj in sorted(objects, key=lambda o: o.key):
+        current.append(obj)
+        current_size += obj.size
+        if current_size >= target_size:
+            groups.append(current)
+            current, current_size = [], 0
+    if current:
+        groups.append(current)
+    # A lone leftover file gains nothing from being rewritten
+    return [group for group in groups if len(group) > 1]
+
+
+def plan_compaction(
+    partitions: dict[str, list[ObjectInfo]],
+    prefix: str,
+    target_size: int
+) -> list[CompactionGroup]:
+    """Build compaction groups for every partition with small files."""
+    plan = []
+    for partition, objects in sorted(partitions.items()):
+        entity = partition[len(prefix):].split('/', 1)[0]
+        plan.extend(CompactionGroup(partition, entity, group) for group in _pack(objects, target_size))
+    return plan
+
+
+def merge_parquet_files(paths: list[Path], output_path: Path, profile: WriterProfile) -> None:
+    """Stream several Parquet files into one, in row groups of the profile's size (pyarrow's default if unset)."""
+    schema = pa.unify_schemas([pq.read_schema(path) for path in paths], promote_options='permissive')
+    batches = (
+        batch.cast(schema)
+        for path in paths
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=64 * 1024)
+    )
+    rows = sum(pq.read_metadata(path).num_rows for path in paths)
+    with pq.ParquetWriter(output_path, schema, **profile.writer_kwargs(schema, rows)) as writer:
+        for table in row_groups(batches, profile.rows_per_group):
+            writer.write_table(table, row_group_size=profile.rows_per_group)
+
+
+def _download_group(bucket_name: str, group: CompactionGroup, tmp_dir: Path) -> Optional[list[Path]]:
+    """Download a group's files concurrently; None if any download fails."""
+    paths = [tmp_dir / f'{i:05d}.parquet' for i in range(len(group.objects))]
+    with ThreadPoolExecutor(max_workers=config.S3_MAX_CONCURRENCY) as pool:
+        ok = list(pool.map(lambda item: download_file(bucket_name, item[0].key, item[1]), zip(group.objects, paths)))
+    return paths if all(ok) else None
+
+
+def _stage_group(bucket_name: str, group: CompactionGroup, staging_key: str) -> Optional[int]:
+    """Merge a group locally and upload it to staging_key; returns bytes written."""
+    with tempfile.TemporaryDirectory(prefix='compact-') as tmp:
+        paths = _download_group(bucket_name, group, Path(tmp))
+        if paths is None:
+            return None
+        output_path = Path(tmp) / 'compacted.parquet'
+        merge_parquet_files(paths, output_path, get_profile(group.entity))
+        if not upload_file(bucket_name, output_path, staging_key):
+            return None
+        return output_path.stat().st_size
+
+
+def _output_keys(partition: str, entity: str, existing: set[str], count: int) -> list[str]:
+    """count writer-style keys ({entity}-{i}.parquet) not taken in the partition."""
+    keys, i = [], 0
+    while len(keys) < count:
+        key = f'{partition}{entity}-{i}.parquet'
+        if key not in existing:
+            keys.append(key)
+        i += 1
+    return keys
+
+
+def _swap_in(bucket_name: str, staged: dict[str, str], old_keys: list[str]) -> bool:
+    """Publish staged objects under their final keys, then drop the originals."""
+    published = []
+    for staging_key, final_key in staged.items():
+        if not copy_object(bucket_name, staging_key, final_key):
+            delete_objects(bucket_name, published + list(staged))
+            return False
+        published.append(final_key)
+    delete_objects(bucket_name, old_keys + list(staged))
+    return True
+
+
+def _compact_partition(bucket_name: str, groups: list[CompactionGroup], existing: set[str]) -> Optional[int]:
+    """Stage and swap in every group of one partition; returns bytes written."""
+    token = uuid.uuid4().hex[:8]
+    final_keys = _output_keys(groups[0].partition, groups[0].entity, existing, len(groups))
+    staged, written = {}, 0
+    for i, group in enumerate(groups):
+        staging_key = f'{group.partition}_compacting-{token}-{i}.parquet'
+        size = _stage_group(bucket_name, group, staging_key)
+        if size is None:
+            delete_objects(bucket_name, list(staged))
+            return None
+        staged[staging_key] = final_keys[i]
+        written += size
+
+    old_keys = [obj.key for group in groups for obj in group.objects]
+    return written if _swap_in(bucket_name, staged, old_keys) else None
+
+
+def delete_superseded(bucket_name: str, uploads: list[tuple[Path, str]]) -> int:
+    """
+    Delete remote data files in the uploaded partitions that uploads does not contain.
+
+    The writer republishes a partition in full, so anything else under it
+    (files of a run that wrote more of them, or that compact_local() merged) is stale.
+    Pass every file of the partitions, including those skipped as unchanged.
+    """
+    current = {key for _, key in uploads}
+    stale = [
+        obj.key
+        for partition in sorted({key.rsplit('/', 1)[0] + '/' for key in current})
+        for obj in iter_objects(bucket_name, partition)
+        if obj.key.rsplit('/', 1)[0] + '/' == partition and _is_data_file(obj.key) and obj.key not in current
+    ]
+    if stale:
+        logger.info(f"🧹 Removing {len(stale)} superseded file(s) under {len(current)} uploaded key(s)")
+    return delete_objects(bucket_name, stale) if stale else 0
+
+
+# ========================================
+# Local tree
+# ========================================
+
+def _local_partitions(root: Path) -> dict[str, list[ObjectInfo]]:
+    """Partition directory (as 'path/') → its data files, listed like S3 objects."""
+    partitions: dict[str, list[ObjectInfo]] = {}
+    for path in sorted(root.rglob('*.parquet')):
+        if any(part.startswith(('_', '.')) for part in path.relative_to(root).parts):
+            continue
+        stat = path.stat()
+        obj = ObjectInfo(path.as_posix(), stat.st_size, '', datetime.fromtimestamp(stat.st_mtime))
+        partitions.setdefault(path.parent.as_posix() + '/', []).append(obj)
+    return partitions
+
+
+def _compact_local_partition(groups: list[CompactionGroup], existing: set[str]) -> int:
+    """Merge every group of one local partition, then swap the outputs in; returns bytes written."""
+    token = uuid.uuid4().hex[:8]
+    final_paths = _output_keys(groups[0].partition, groups[0].entity, existing, len(groups))
+    staged = []
+    try:
+        for i, group in enumerate(groups):
+            staged.append(Path(f'{group.partition}_compacting-{token}-{i}.parquet'))
+            merge_parquet_files([Path(obj.key) for obj in group.objects], staged[-1], get_profile(group.entity))
+    except (OSError, pa.ArrowException):
+        for path in staged:
+            path.unlink(missing_ok=True)
+        raise
+
+    for group in groups:
+        for obj in group.objects:
+            os.unlink(obj.key)
+    for staged_path, final_path in zip(staged, final_paths):
+        os.replace(staged_path, final_path)
+    return sum(Path(path).stat().st_size for path in final_paths)
+
+
+def compact_local(
+    root: Path,
+    entity: Optional[str] = None,
+    target_size: int = config.COMPACTION_TARGET_SIZE
+) -> CompactionReport:
+    """
+    compact() for the local processed tree (root = processed/finanzas), or one entity in it.
+
+    Inputs are removed once every group of their partition is merged.
+    Run before uploading, so the bucket receives the compacted layout.
+    """
+    tree = root / entity if entity else root
+    if not tree.exists():
+        return CompactionReport(dry_run=False)
+    partitions = _local_partitions(tree)
+    by_partition: dict[str, list[CompactionGroup]] = {}
+    for group in plan_compaction(_small_files(partitions, target_size), root.as_posix() + '/', target_size):
+        by_partition.setdefault(group.partition, []).append(group)
+
+    report = CompactionReport(dry_run=False)
+    for partition, groups in by_partition.items():
+        existing = {obj.key for obj in partitions[partition]}
+        report.partitions += 1
+        report.files_before += sum(len(group.objects) for group in groups)
+        report.files_after += len(groups)
+        report.bytes_before += sum(obj.size for group in groups for obj in group.objects)
+        report.bytes_after += _compact_local_partition(groups, existing)
+    if report.partitions:
+        _log_report(report)
+    return report
+
+
+def _log_report(report: CompactionReport) -> None:
+    """Log file-count and byte savings of a compaction pass."""
+    mode = "Dry run" if report.dry_run else "Compacted"
+    get_savings = report.files_saved / 1000 * config.S3_GET_COST_PER_1000
+    logger.info(
+        f"🗜️  {mode}: {report.partitions} partitions, "
+        f"{report.files_before} → {report.files_after} files (-{report.files_saved}), "
+        f"{report.bytes_before:,} B → {report.bytes_after:,} B"
+    )
+    logger.info(f"  ~${get_savings:.6f} saved per full scan in GET requests")
+
+
+def compact(
+    bucket_name: str = config.S3_BUCKET_NAME,
+    prefix: str = f'{config.S3_PROCESSED_PREFIX}finanzas/',
+    target_size: int = config.COMPACTION_TARGET_SIZE,
+    dry_run: bool = False
+) -> CompactionReport:
+    """
+    Compact small Parquet files under prefix, partition by partition.
+
+    In dry-run mode nothing is written; output sizes are estimated as the
+    input sizes (Parquet merges are roughly size-preserving).
+    """
+    partitions = list_partitions(bucket_name, prefix)
+    plan = plan_compaction(_small_files(partitions, target_size), prefix, target_size)
+    by_partition: dict[str, list[CompactionGroup]] = {}
+    for group in plan:
+        by_partition.setdefault(group.partition, []).append(group)
+
+    report = CompactionReport(dry_run=dry_run)
+    for partition, groups in by_partition.items():
+        files = sum(len(group.objects) for group in groups)
+        size = sum(obj.size for group in groups for obj in group.objects)
+        existing = {obj.key for obj in partitions[partition]}
+        written = size if dry_run else _compact_partition(bucket_name, groups, existing)
+        if written is None:
+            logger.error(f"❌ Compaction failed for {partition}; originals left in place")
+            continue
+        report.partitions += 1
+        report.files_before += files
+        report.files_after += len(groups)
+        report.bytes_before += size
+        report.bytes_after += written
+
+    _log_report(report)
+    return report
@@ -11,21 +11,80 @@ AWS_ACCESS_KEY_ID = os.getenv("AWS_ACCESS_KEY_ID")
 AWS_SECRET_ACCESS_KEY = os.getenv("AWS_SECRET_ACCESS_KEY")
 AWS_REGION = os.getenv("AWS_REGION", "us-east-1")
 
+# Retries (src/retry.py)
+AWS_RETRY_MODE = os.getenv("AWS_RETRY_MODE", "adaptive")  # botocore: legacy | standard | adaptive
+AWS_MAX_ATTEMPTS = int(os.getenv("AWS_MAX_ATTEMPTS", "10"))  # botocore attempts per request
+AWS_OPERATION_ATTEMPTS = int(os.getenv("AWS_OPERATION_ATTEMPTS", "3"))  # retry.call() attempts per operation
+AWS_RETRY_BUDGET = float(os.getenv("AWS_RETRY_BUDGET", "50"))  # retry tokens per operation
+AWS_RETRY_BUDGET_REFILL = float(os.getenv("AWS_RETRY_BUDGET_REFILL", "0.1"))  # tokens refunded per success
+
 # S3 Configuration
 S3_BUCKET_NAME = os.getenv("S3_BUCKET_NAME", "rherediaiam-datalake")
 S3_RAW_PREFIX = os.getenv("S3_RAW_PREFIX", "raw/")
 S3_PROCESSED_PREFIX = os.getenv("S3_PROCESSED_PREFIX", "processed/")
 S3_ANALYTICS_PREFIX = os.getenv("S3_ANALYTICS_PREFIX", "analytics/")
 
+# S3 batch transfers
+S3_MAX_CONCURRENCY = int(os.getenv("S3_MAX_CONCURRENCY", "8"))  # files in flight
+S3_MULTIPART_CONCURRENCY = int(os.getenv("S3_MULTIPART_CONCURRENCY", "4"))  # parts per file
+S3_MULTIPART_CHUNKSIZE = int(os.getenv("S3_MULTIPART_CHUNKSIZE", str(16 * 1024 * 1024)))  # 16 MB
+# Skip uploads whose bytes are already at the key (ETag match, see checksums.py)
+S3_SKIP_UNCHANGED = os.getenv("S3_SKIP_UNCHANGED", "true").lower() == "true"
+
+# Async control-plane calls (src/aws_async.py)
+AWS_ASYNC_CONCURRENCY = int(os.getenv("AWS_ASYNC_CONCURRENCY", "32"))  # calls in flight
+AWS_ASYNC_MAX_ATTEMPTS = int(os.getenv("AWS_ASYNC_MAX_ATTEMPTS", "5"))  # per call
+AWS_ASYNC_RETRY_BUDGET = int(os.getenv("AWS_ASYNC_RETRY_BUDGET", "50"))  # retries per batch
+
 # Glue Configuration
 GLUE_DATABASE_NAME = os.getenv("GLUE_DATABASE_NAME", "datalake_db")
 GLUE_CRAWLER_NAME = os.getenv("GLUE_CRAWLER_NAME", "datalake_crawler")
+# Crawler waiter: jittered backoff between these delays (seconds)
+CRAWLER_POLL_MIN_DELAY = float(os.getenv("CRAWLER_POLL_MIN_DELAY", "2"))
+CRAWLER_POLL_MAX_DELAY = float(os.getenv("CRAWLER_POLL_MAX_DELAY", "30"))
+CRAWLER_TIMEOUT = int(os.getenv("CRAWLER_TIMEOUT", "900"))  # seconds
+# Register processed tables/partitions directly after upload (no crawler run)
+GLUE_REGISTER_TABLES = os.getenv("GLUE_REGISTER_TABLES", "true").lower() == "true"
 
 # Athena Configuration
 ATHENA_OUTPUT_LOCATION = os.getenv(
     "ATHENA_OUTPUT_LOCATION",
     f"s3://{S3_BUCKET_NAME}/athena-results/"
 )
+ATHENA_COST_PER_TB = float(os.getenv("ATHENA_COST_PER_TB", "5.0"))  # USD per TB scanned
+ATHENA_WORKGROUP = os.getenv("ATHENA_WORKGROUP", "primary")
+ATHENA_QUERY_TIMEOUT = int(os.getenv("ATHENA_QUERY_TIMEOUT", "300"))  # seconds
+# Reuse results while the referenced tables' S3 objects are unchanged
+ATHENA_CACHE_ENABLED = os.getenv("ATHENA_CACHE_ENABLED", "true").lower() == "true"
+
+# Parquet transformation
+# Stream CSV → Parquet in blocks instead of loading whole files into pandas
+PARQUET_STREAMING = os.getenv("PARQUET_STREAMING", "false").lower() == "true"
+CSV_BLOCK_SIZE = int(os.getenv("CSV_BLOCK_SIZE", str(64 * 1024 * 1024)))  # 64 MB
+# Writer profile (see parquet_profiles.py): default | scan-optimised | low-latency
+PARQUET_PROFILE = os.getenv("PARQUET_PROFILE", "default")
+# Per-entity overrides, e.g. "transactions:scan-optimised,branches:low-latency"
+PARQUET_ENTITY_PROFILES = os.getenv("PARQUET_ENTITY_PROFILES", "")
+# Sort rows on query predicates before writing (see clustering.py)
+PARQUET_CLUSTERING = os.getenv("PARQUET_CLUSTERING", "false").lower() == "true"
+CLUSTER_RUN_ROWS = int(os.getenv("CLUSTER_RUN_ROWS", "2000000"))  # rows sorted in memory per run
+# Hive partitioning on data columns (see partitioning.py)
+PARQUET_PARTITIONING = os.getenv("PARQUET_PARTITIONING", "false").lower() == "true"
+PARTITION_MAX_COUNT = int(os.getenv("PARTITION_MAX_COUNT", "1024"))  # distinct partitions per entity
+PARTITION_MIN_ROWS = int(os.getenv("PARTITION_MIN_ROWS", "10"))  # avg rows per partition
+PARTITION_MAX_ROWS_PER_FILE = int(os.getenv("PARTITION_MAX_ROWS_PER_FILE", "5000000"))
+PARTITION_MAX_OPEN_FILES = int(os.getenv("PARTITION_MAX_OPEN_FILES", "128"))  # writers open at once
+# Process pool size for transform_all_finance_data (1 = sequential)
+TRANSFORM_WORKERS = int(os.getenv("TRANSFORM_WORKERS", "1"))
+# With workers > 1, CSVs larger than this are split across the pool
+TRANSFORM_CHUNK_SIZE = int(os.getenv("TRANSFORM_CHUNK_SIZE", str(256 * 1024 * 1024)))  # 256 MB
+
+# Synthetic data generator (see data_generator.py)
+DATA_GEN_SCALE = float(os.getenv("DATA_GEN_SCALE", "1"))  # x base row counts (250 customers, 1000 transactions...)
+DATA_GEN_SEED = int(os.getenv("DATA_GEN_SEED", "42"))
+DATA_GEN_FORMAT = os.getenv("DATA_GEN_FORMAT", "csv")  # csv | parquet
+DATA_GEN_CHUNK_ROWS = int(os.getenv("DATA_GEN_CHUNK_ROWS", "1000000"))  # rows per generated chunk
+DATA_GEN_WORKERS = int(os.getenv("DATA_GEN_WORKERS", str(os.cpu_count() or 1)))
 
 # Local paths
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -34,6 +93,34 @@ RAW_DATA_DIR = DATA_DIR / "raw"
 PROCESSED_DATA_DIR = DATA_DIR / "processed"
 ANALYTICS_DATA_DIR = DATA_DIR / "analytics"
 
+# Incremental runs: skip inputs/uploads unchanged since the last run
+INCREMENTAL = os.getenv("INCREMENTAL", "false").lower() == "true"
+MANIFEST_PATH = PROJECT_ROOT / os.getenv("MANIFEST_PATH", "data/manifest.json")  # relative to the project root
+S3_PUT_COST_PER_1000 = float(os.getenv("S3_PUT_COST_PER_1000", "0.005"))  # USD, S3 Standard
+S3_GET_COST_PER_1000 = float(os.getenv("S3_GET_COST_PER_1000", "0.0004"))  # USD, S3 Standard
+
+# Small-file compaction of the processed zone (see compaction.py)
+COMPACTION_TARGET_SIZE = int(os.getenv("COMPACTION_TARGET_SIZE", str(128 * 1024 * 1024)))  # 128 MB
+
+# Pipeline orchestrator (see pipeline.py)
+PIPELINE_WORKERS = int(os.getenv("PIPELINE_WORKERS", "4"))  # tasks in flight
+PIPELINE_CHECKPOINT_PATH = DATA_DIR / "pipeline_checkpoint.json"
+
+# Metrics export (see metrics.py): comma-separated "jsonl", "prometheus" or empty
+METRICS_EXPORT = os.getenv("METRICS_EXPORT", "jsonl")
+METRICS_JSONL_PATH = DATA_DIR / "metrics.jsonl"
+METRICS_PROM_PATH = DATA_DIR / "metrics.prom"
+
+# Analytics rollups (see analytics.py): per-month source digests of the last run
+ANALYTICS_STATE_PATH = DATA_DIR / "analytics_state.json"
+
+# Local ETags of uploaded files (see checksums.py)
+ETAG_CACHE_PATH = DATA_DIR / "etag_cache.json"
+
+# Athena result cache and query history (runtime, bytes scanned)
+ATHENA_CACHE_DIR = DATA_DIR / "athena_cache"
+ATHENA_HISTORY_PATH = DATA_DIR / "athena_history.jsonl"
+
 # Ensure local directories exist
 for dir_path in [RAW_DATA_DIR, PROCESSED_DATA_DIR, ANALYTICS_DATA_DIR]:
     dir_path.mkdir(parents=True, exist_ok=True)
@@ -0,0 +1,483 @@
+"""Synthetic finance data generator.
+
+Generates the twelve finanzas_* entities with referential integrity
+(accounts → customers, transactions → accounts, loan_payments → loans...).
+
+Every entity has contiguous ids 1..N, so a foreign key is a uniform draw
+from 1..N of the parent entity and any slice of rows can be generated on
+its own. Rows are produced in chunks of DATA_GEN_CHUNK_ROWS:
+- columns are sampled with NumPy in bulk; names, addresses and phones
+  come from pools of Faker strings built once per process
+- chunk (entity, first id) gets its own seed derived from DATA_GEN_SEED,
+  so the output is identical whatever the number of workers
+- chunks are generated on a process pool and streamed, in order, into one
+  CSV (or Parquet) file per entity; memory stays at a few chunks
+
+Dimension tables (account types, branches, employees, exchange rates) have
+fixed sizes; the other entities scale with DATA_GEN_SCALE (1 = 250
+customers, 1000 transactions; 100000 = 100M transactions).
+"""
+import logging
+import os
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pv
+import pyarrow.parquet as pq
+
+from . import config
+from .schemas import SCHEMAS
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+BASE_ROWS = {
+    'account_types': 6,
+    'branches': 15,
+    'bank_employees': 50,
+    'exchange_rates': 1460,
+    'customers': 250,
+    'accounts': 500,
+    'cards': 400,
+    'loans': 100,
+    'loan_payments': 500,
+    'transactions': 1000,
+    'transfers': 300,
+    'investments': 80,
+}
+FIXED_ENTITIES = ('account_types', 'branches', 'bank_employees', 'exchange_rates')
+ENTITY_INDEX = {entity: i for i, entity in enumerate(BASE_ROWS)}
+POOL_SIZE = 2000
+
+FIRST_DAY = np.datetime64('2015-01-01')
+LAST_DAY = np.datetime64('2025-12-31')
+EXCHANGE_FIRST_DAY = np.datetime64('2024-01-01')
+
+CITIES = ['Buenos Aires', 'Córdoba', 'Rosario', 'Mendoza', 'La Plata', 'Mar del Plata',
+          'Tucumán', 'Salta', 'Santa Fe', 'San Juan', 'Neuquén', 'Bahía Blanca']
+ACCOUNT_TYPES = [
+    # type_name, currency, min_balance, monthly_fee, interest_rate, allows_overdraft
+    ('Cuenta Corriente', 'ARS', 0.0, 500.0, 0.0, True),
+    ('Caja de Ahorro', 'ARS', 0.0, 0.0, 0.5, False),
+    ('Caja de Ahorro USD', 'USD', 0.0, 0.0, 0.1, False),
+    ('Cuenta Sueldo', 'ARS', 0.0, 0.0, 0.0, False),
+    ('Cuenta Corriente USD', 'USD', 1000.0, 15.0, 0.0, True),
+    ('Cuenta Inversión', 'ARS', 10000.0, 0.0, 1.5, False),
+]
+CURRENCY_PAIRS = [('USD', 950.0), ('EUR', 1030.0), ('BRL', 190.0), ('GBP', 1200.0)]  # → ARS, start rate
+EMPLOYEE_ROLES = ['Teller', 'Loan Officer', 'Account Manager', 'Financial Advisor', 'Branch Manager']
+TRANSACTION_TYPES = ['deposit', 'withdrawal', 'transfer', 'payment', 'fee']
+CHANNELS = ['online', 'mobile', 'atm', 'branch', 'pos']
+LOAN_TYPES = ['personal', 'mortgage', 'auto', 'business']
+LOAN_TERMS = [12, 24, 36, 60, 120, 240]
+TRANSFER_CONCEPTS = ['Alquiler', 'Varios', 'Honorarios', 'Cuota', 'Expensas', 'Haberes', 'Facturas', 'Préstamo']
+INVESTMENT_TYPES = ['stocks', 'bonds', 'mutual_funds', 'fixed_term', 'crypto']
+HEX_DIGITS = np.frombuffer(b'0123456789ABCDEF', np.uint8)
+SYMBOLS = ['GGAL', 'YPFD', 'PAMP', 'BMA', 'TXAR', 'ALUA', 'AL30', 'GD30', 'TX26', 'FCI-RF', 'FCI-RV', 'BTC', 'ETH']
+
+Columns = dict[str, np.ndarray | pa.Array]
+
+
+# ========================================
+# Sampling helpers
+# ========================================
+
+@lru_cache(maxsize=4)
+def _pools(seed: int) -> dict[str, pa.Array]:
+    """Faker string pools, built once per process and seed."""
+    from faker import Faker  # only the generator needs Faker
+
+    fake = Faker('es_AR')
+    fake.seed_instance(seed)
+    return {
+        'first_name': pa.array([fake.first_name() for _ in range(POOL_SIZE)]),
+        'last_name': pa.array([fake.last_name() for _ in range(POOL_SIZE)]),
+        'address': pa.array([fake.street_address() for _ in range(POOL_SIZE)]),
+        'phone': pa.array([fake.phone_number() for _ in range(POOL_SIZE)]),
+    }
+
+
+def _draw(rng: np.random.Generator, values: list | pa.Array, n: int, p: Optional[list[float]] = None) -> np.ndarray:
+    """Indices of n draws from values."""
+    return rng.choice(len(values), n, p=p)
+
+
+def _pick(rng: np.random.Generator, values: list | pa.Array, n: int, p: Optional[list[float]] = None) -> pa.Array:
+    """n draws from values, gathered by Arrow (no per-row Python strings)."""
+    return pa.array(values).take(_draw(rng, values, n, p))
+
+
+def _fk(rng: np.random.Generator, counts: dict[str, int], parent: str, n: int) -> np.ndarray:
+    """Foreign keys: uniform over the parent's ids 1..N."""
+    if n and counts[parent] < 1:
+        raise ValueError(f"Rows referencing '{parent}' need at least one {parent} row (count is {counts[parent]})")
+    return rng.integers(1, counts[parent] + 1, n, dtype=np.int64)
+
+
+def _days(rng: np.random.Generator, n: int, first: np.datetime64 = FIRST_DAY, last: np.datetime64 = LAST_DAY) -> np.ndarray:
+    """Uniform dates in [first, last]."""
+    return first + rng.integers(0, (last - first).astype(int) + 1, n)
+
+
+def _days_after(rng: np.random.Generator, start: np.ndarray, last: np.datetime64 = LAST_DAY) -> np.ndarray:
+    """A date between each start date and last."""
+    return start + (rng.random(len(start)) * (last - start).astype(int)).astype(int)
+
+
+def _timestamps(rng: np.random.Generator, n: int) -> pa.Array:
+    """Uniform second-resolution timestamps over the date range."""
+    span = (LAST_DAY - FIRST_DAY).astype(int) * 86400
+    return pa.array(FIRST_DAY.astype('datetime64[s]') + rng.integers(0, span, n), pa.timestamp('s'))
+
+
+def _money(rng: np.random.Generator, low: float, high: float, n: int) -> np.ndarray:
+    return np.round(rng.uniform(low, high, n), 2)
+
+
+def _scramble(ids: np.ndarray, bits: int) -> np.ndarray:
+    """Unique pseudo-random `bits`-bit numbers from ids (odd multiplier: a bijection mod 2**bits)."""
+    return (ids.astype(np.uint64) * np.uint64(0x9E3779B97F4A7C15)) & np.uint64((1 << bits) - 1)
+
+
+def _text(*parts: str | np.ndarray | pa.Array) -> pa.Array:
+    """Element-wise concatenation of literals and columns, e.g. _text('cliente', ids, '@email.com')."""
+    columns = [part if isinstance(part, str) else pa.array(part).cast(pa.string()) for part in parts]
+    return pc.binary_join_element_wise(*columns, '')
+
+
+def _zero_padded(ids: np.ndarray, width: int) -> pa.Array:
+    return pc.utf8_lpad(pa.array(ids).cast(pa.string()), width, '0')
+
+
+def _hex(values: np.ndarray, width: int) -> pa.Array:
+    """Upper-case, zero-padded hex strings of unsigned values."""
+    shifts = np.arange(width - 1, -1, -1, dtype=np.uint64) * np.uint64(4)
+    digits = HEX_DIGITS[(values[:, None] >> shifts) & np.uint64(15)]
+    return pa.array(digits.view(f'S{width}').ravel()).cast(pa.string())
+
+
+# ========================================
+# Entities
+# ========================================
+
+def _account_types(rng: np.random.Generator, ids: np.ndarray, counts: dict[str, int], pools: dict) -> Columns:
+    rows = [ACCOUNT_TYPES[(i - 1) % len(ACCOUNT_TYPES)] for i in ids]
+    names = ['type_name', 'currency', 'min_balance', 'monthly_fee', 'interest_rate', 'allows_overdraft']
+    return {'account_type_id': ids, **{name: [row[i] for row in rows] for i, name in enumerate(names)}}
+
+
+def _branches(rng: np.random.Generator, ids: np.ndarray, counts: dict[str, int], pools: dict) -> Columns:
+    n = len(ids)
+    cities = _pick(rng, CITIES, n)
+    return {
+        'branch_id': ids,
+        'branch_name': _text('Sucursal ', cities, ' ', ids),
+        'city': cities,
+        'address': _pick(rng, pools['address'], n),
+        'phone': _pick(rng, pools['phone'], n),
+        'manager_id': _fk(rng, counts, 'bank_employees', n),
+        'opened_date': _days(rng, n, np.datetime64('1990-01-01')),
+        'is_active': rng.random(n) < 0.95,
+    }
+
+
+def _bank_employees(rng: np.random.Generator, ids: np.ndarray, counts: dict[str, int], pools: dict) -> Columns:
+    n = len(ids)
+    return {
+        'employee_id': ids,
+        'branch_id': _fk(rng, counts, 'branches', n),
+        'first_name': _pick(rng, pools['first_name'], n),
+        'last_name': _pick(rng, pools['last_name'], n),
+        'role': _pick(rng, EMPLOYEE_ROLES, n),
+        'email': _text('employee', ids, '@banco.com'),
+        'hire_date': _days(rng, n, np.datetime64('2000-01-01')),
+        'salary': _money(rng, 40_000, 400_000, n).round(),
+        'is_active': rng.random(n) < 0.9,
+    }
+
+
+def _exchange_rates(rng: np.random.Generator, ids: np.ndarray, counts: dict[str, int], pools: dict) -> Columns:
+    """One row per (day, currency pair): row i is day i // pairs, pair i % pairs."""
+    day, pair = np.divmod(ids - 1, len(CURRENCY_PAIRS))
+    base = np.array([rate for _, rate in CURRENCY_PAIRS])[pair] * (1 + 0.002 * day) * rng.normal(1, 0.01, len(ids))
+    return {
+        'rate_id': ids,
+        'date': EXCHANGE_FIRST_DAY + day,
+        'currency_from': pa.array([currency for currency, _ in CURRENCY_PAIRS]).take(pair),
+        'currency_to': pa.array(['ARS']).take(np.zeros(len(ids), dtype=np.int64)),
+        'buy_rate': np.round(base * 0.97, 4),
+        'sell_rate': np.round(base * 1.03, 4),
+    }
+
+
+def _customers(rng: np.random.Generator, ids: np.ndarray, counts: dict[str, int], pools: dict) -> Columns:
+    n = len(ids)
+    return {
+        'customer_id': ids,
+        'first_name': _pick(rng, pools['first_name'], n),
+        'last_name': _pick(rng, pools['last_name'], n),
+        'dni': 20_000_000 + (ids * 7919) % 25_000_000,  # unique up to 25M customers
+        'email': _text('cliente', ids, '@email.com'),
+        'phone': _pick(rng, pools['phone'], n),
+        'address': _pick(rng, pools['address'], n),
+        'city': _pick(rng, CITIES, n),
+        'birth_date': _days(rng, n, np.datetime64('1950-01-01'), np.datetime64('2005-12-31')),
+        'registration_date': _days(rng, n),
+        'credit_score': rng.integers(300, 851, n),
+        'is_vip': rng.random(n) < 0.1,
+        'preferred_branch_id': _fk(rng, counts, 'branches', n),
+    }
+
+
+def _accounts(rng: np.random.Generator, ids: np.ndarray, counts: dict[str, int], pools: dict) -> Columns:
+    n = len(ids)
+    opened = _days(rng, n)
+    return {
+        'account_id': ids,
+        'customer_id': _fk(rng, counts, 'customers', n),
+        'account_type_id': _fk(rng, counts, 'account_types', n),
+        'account_number': _text('ACC-', _zero_padded(ids, 10)),
+        'cbu': 1_000_000_000 + _scramble(ids, 32).astype(np.int64) % 9_000_000_000,
+        'balance': _money(rng, 0, 100_000, n),
+        'opened_date': opened,
+        'status': _pick(rng, ['active', 'inactive', 'closed'], n, [0.85, 0.1, 0.05]),
+        'last_activity_date': _days_after(rng, opened),
+    }
+
+
+def _cards(rng: np.random.Generator, ids: np.ndarray, counts: dict[str, int], pools: dict) -> Columns:
+    n = len(ids)
+    issued = _days(rng, n, np.datetime64('2020-01-01'))
+    return {
+        'card_id': ids,
+        'account_id': _fk(rng, counts, 'accounts', n),
+        'card_type': _pick(rng, ['debit', 'credit'], n, [0.6, 0.4]),
+        'card_brand': _pick(rng, ['Visa', 'Mastercard', 'American Express'], n, [0.5, 0.4, 0.1]),
+        'card_number_last4': rng.integers(1000, 10_000, n),
+        'expiry_date': issued + 365 * rng.integers(3, 9, n),
+        'credit_limit': _money(rng, 50_000, 1_000_000, n).round(),
+        'is_active': rng.random(n) < 0.9,
+        'issued_date': issued,
+    }
+
+
+def _loans(rng: np.random.Generator, ids: np.ndarray, counts: dict[str, int], pools: dict) -> Columns:
+    n = len(ids)
+    principal = _money(rng, 100_000, 5_000_000, n).round()
+    rate = np.round(rng.uniform(15, 60, n), 2)
+    term = _pick(rng, LOAN_TERMS, n)
+    monthly_rate = rate / 100 / 12
+    start = _days(rng, n, np.datetime64('2018-01-01'))
+    return {
+        'loan_id': ids,
+        'customer_id': _fk(rng, counts, 'customers', n),
+        'loan_type': _pick(rng, LOAN_TYPES, n),
+        'principal_amount': principal,
+        'interest_rate': rate,
+        'term_months': term,
+        'monthly_payment': np.round(principal * monthly_rate / (1 - (1 + monthly_rate) ** -term), 2),
+        'start_date': start,
+        'end_date': start + np.round(term * 30.44).astype(int),
+        'status': _pick(rng, ['active', 'paid', 'defaulted'], n, [0.7, 0.25, 0.05]),
+        'collateral': _pick(rng, ['None', 'Property', 'Vehicle', 'Property/Vehicle'], n),
+    }
+
+
+def _loan_payments(rng: np.random.Generator, ids: np.ndarray, counts: dict[str, int], pools: dict) -> Columns:
+    n = len(ids)
+    statuses = ['on_time', 'late', 'missed']
+    status = _draw(rng, statuses, n, [0.85, 0.1, 0.05])
+    principal = _money(rng, 100, 5_000, n)
+    interest = np.round(principal * rng.uniform(0.05, 0.4, n), 2)
+    late_fee = np.where(status == statuses.index('late'), np.round((principal + interest) * 0.02, 2), 0.0)
+    return {
+        'payment_id': ids,
+        'loan_id': _fk(rng, counts, 'loans', n),
+        'payment_date': _days(rng, n, np.datetime64('2018-01-01')),
+        'amount': np.round(principal + interest + late_fee, 2),
+        'principal_paid': principal,
+        'interest_paid': interest,
+        'late_fee': late_fee,
+        'status': pa.array(statuses).take(status),
+    }
+
+
+def _transactions(rng: np.random.Generator, ids: np.ndarray, counts: dict[str, int], pools: dict) -> Columns:
+    n = len(ids)
+    types = _draw(rng, TRANSACTION_TYPES, n)
+    sign = np.where(types == TRANSACTION_TYPES.index('deposit'), 1, -1)
+    return {
+        'transaction_id': ids,
+        'account_id': _fk(rng, counts, 'accounts', n),
+        'transaction_type': pa.array(TRANSACTION_TYPES).take(types),
+        'amount': sign * _money(rng, 1, 5_000, n),
+        'balance_after': _money(rng, 0, 100_000, n),
+        'transaction_date': _timestamps(rng, n),
+        'description': pa.array([name.capitalize() for name in TRANSACTION_TYPES]).take(types),
+        'reference_number': _text('TXN-', _hex(_scramble(ids, 48), 12)),
+        'channel': _pick(rng, CHANNELS, n),
+        'status': _pick(rng, ['completed', 'pending', 'failed'], n, [0.9, 0.07, 0.03]),
+    }
+
+
+def _transfers(rng: np.random.Generator, ids: np.ndarray, counts: dict[str, int], pools: dict) -> Columns:
+    n, accounts = len(ids), counts['accounts']
+    from_account = _fk(rng, counts, 'accounts', n)
+    offset = rng.integers(1, max(accounts, 2), n)  # never 0: no self-transfers
+    return {
+        'transfer_id': ids,
+        'from_account_id': from_account,
+        'to_account_id': (from_account - 1 + offset) % accounts + 1,
+        'amount': _money(rng, 100, 50_000, n),
+        'transfer_date': _timestamps(rng, n),
+        'concept': _pick(rng, TRANSFER_CONCEPTS, n),
+        'status': _pick(rng, ['completed', 'pending', 'cancelled'], n, [0.9, 0.05, 0.05]),
+    }
+
+
+def _investments(rng: np.random.Generator, ids: np.ndarray, counts: dict[str, int], pools: dict) -> Columns:
+    n = len(ids)
+    purchase_price = _money(rng, 10, 10_000, n)
+    return {
+        'investment_id': ids,
+        'customer_id': _fk(rng, counts, 'customers', n),
+        'investment_type': _pick(rng, INVESTMENT_TYPES, n),
+        'symbol': _pick(rng, SYMBOLS, n),
+        'quantity': np.round(rng.uniform(1, 1_000, n), 4),
+        'purchase_price': purchase_price,
+        'current_price': np.round(purchase_price * rng.uniform(0.7, 1.5, n), 2),
+        'purchase_date': _days(rng, n, np.datetime64('2019-01-01')),
+        'status': _pick(rng, ['holding', 'sold'], n, [0.8, 0.2]),
+    }
+
+
+GENERATORS: dict[str, Callable[..., Columns]] = {
+    'account_types': _account_types,
+    'branches': _branches,
+    'bank_employees': _bank_employees,
+    'exchange_rates': _exchange_rates,
+    'customers': _customers,
+    'accounts': _accounts,
+    'cards': _cards,
+    'loans': _loans,
+    'loan_payments': _loan_payments,
+    'transactions': _transactions,
+    'transfers': _transfers,
+    'investments': _investments,
+}
+
+
+# ========================================
+# Chunks and output
+# ========================================
+
+def row_counts(scale: float = config.DATA_GEN_SCALE, overrides: Optional[dict[str, int]] = None) -> dict[str, int]:
+    """Rows per entity: fixed dimensions, the rest BASE_ROWS × scale, then overrides (0 or more)."""
+    negative = {entity: rows for entity, rows in (overrides or {}).items() if rows < 0}
+    if negative:
+        raise ValueError(f"Row counts must be 0 or more: {negative}")
+    counts = {
+        entity: rows if entity in FIXED_ENTITIES else max(int(rows * scale), 1)
+        for entity, rows in BASE_ROWS.items()
+    }
+    return {**counts, **(overrides or {})}
+
+
+def generate_chunk(entity: str, start: int, stop: int, counts: dict[str, int], seed: int, parquet: bool) -> pa.Table:
+    """Rows with ids start..stop-1 of an entity (deterministic for a seed)."""
+    rng = np.random.default_rng([seed, ENTITY_INDEX[entity], start])
+    columns = GENERATORS[entity](rng, np.arange(start, stop, dtype=np.int64), counts, _pools(seed))
+    table = pa.table(columns).select(SCHEMAS[entity].names)
+    return table.cast(SCHEMAS[entity]) if parquet else table
+
+
+def _bounded_map(pool: Optional[Executor], fn: Callable, tasks: list[tuple], window: int) -> Iterator:
+    """Ordered results of fn(*task), at most `window` tasks in flight (inline without a pool)."""
+    if pool is None:
+        yield from (fn(*task) for task in tasks)
+        return
+    pending = deque()
+    for task in tasks:
+        pending.append(pool.submit(fn, *task))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _open_writer(path: Path, fmt: str, schema: pa.Schema) -> pv.CSVWriter | pq.ParquetWriter:
+    if fmt == 'parquet':
+        return pq.ParquetWriter(path, schema, compression='snappy')
+    return pv.CSVWriter(path, schema)
+
+
+def generate_entity(
+    entity: str,
+    output_dir: Path,
+    counts: dict[str, int],
+    seed: int,
+    fmt: str,
+    chunk_rows: int,
+    pool: Optional[Executor] = None
+) -> Path:
+    """Stream an entity's chunks into output_dir/finanzas_{entity}.{fmt} (atomically)."""
+    path = output_dir / f'finanzas_{entity}.{fmt}'
+    tmp_path = output_dir / f'.{path.name}.tmp'
+    rows = counts[entity]
+    # 0 rows: one empty chunk, so the file still has its header / schema
+    tasks = [(entity, start, min(start + chunk_rows, rows + 1), counts, seed, fmt == 'parquet')
+             for start in range(1, max(rows, 1) + 1, chunk_rows)]
+    window = 2 * getattr(pool, '_max_workers', 1)
+
+    writer = None
+    for table in _bounded_map(pool, generate_chunk, tasks, window):
+        writer = writer or _open_writer(tmp_path, fmt, table.schema)
+        writer.write_table(table)
+    writer.close()
+    os.replace(tmp_path, path)
+    return path
+
+
+def generate_all_data(
+    output_dir: Path = config.RAW_DATA_DIR,
+    scale: float = config.DATA_GEN_SCALE,
+    seed: int = config.DATA_GEN_SEED,
+    fmt: str = config.DATA_GEN_FORMAT,
+    workers: int = config.DATA_GEN_WORKERS,
+    chunk_rows: int = config.DATA_GEN_CHUNK_ROWS,
+    rows: Optional[dict[str, int]] = None
+) -> dict[str, Path]:
+    """
+    Generate all twelve entities as finanzas_{entity}.csv (or .parquet).
+
+    Args:
+        scale: Multiplier for the non-dimension entities (see BASE_ROWS)
+        fmt: 'csv' (what the pipeline ingests) or 'parquet'
+        workers: Processes generating chunks (1 = in this process)
+        rows: Exact row counts for some entities, e.g. {'transactions': 100_000_000}
+    """
+    if fmt not in ('csv', 'parquet'):
+        raise ValueError(f"Unknown format '{fmt}' (expected 'csv' or 'parquet')")
+    output_dir.mkdir(parents=True, exist_ok=True)
+    counts = row_counts(scale, rows)
+
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    paths = {}
+    try:
+        for entity in GENERATORS:
+            start = time.perf_counter()
+            paths[entity] = generate_entity(entity, output_dir, counts, seed, fmt, chunk_rows, pool)
+            seconds = time.perf_counter() - start
+            logger.info(f"✅ {paths[entity].name}: {counts[entity]:,} rows "
+                        f"({seconds:.1f}s, {counts[entity] / seconds:,.0f} rows/s)")
+    finally:
+        if pool:
+            pool.shutdown()
+    return paths
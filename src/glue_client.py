@@ -7,35 +7,47 @@ Principles applied:
 - Logging over print
 """
 import logging
+import random
+import time
+from dataclasses import dataclass
+from datetime import datetime
 from typing import Optional
 
-import boto3
 from botocore.exceptions import ClientError
 
-from . import config
+from . import config, metrics, retry
+from .aws_clients import get_client
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class CrawlResult:
+    """Outcome of a crawl, from the crawler's LastCrawl and metrics."""
+    crawler_name: str
+    state: Optional[str]
+    status: Optional[str] = None  # LastCrawl: SUCCEEDED | FAILED | CANCELLED, or TIMEOUT if still running
+    tables_created: int = 0
+    tables_updated: int = 0
+    tables_deleted: int = 0
+    duration_seconds: float = 0.0
+    error: Optional[str] = None
+    timed_out: bool = False
+
+    @property
+    def succeeded(self) -> bool:
+        return self.status == 'SUCCEEDED' and not self.timed_out
+
+
 def _get_glue_client():
-    """Create configured Glue client."""
-    return boto3.client(
-        'glue',
-        aws_access_key_id=config.AWS_ACCESS_KEY_ID,
-        aws_secret_access_key=config.AWS_SECRET_ACCESS_KEY,
-        region_name=config.AWS_REGION
-    )
+    """Get shared Glue client."""
+    return get_client('glue')
 
 
 def _get_iam_client():
-    """Create configured IAM client."""
-    return boto3.client(
-        'iam',
-        aws_access_key_id=config.AWS_ACCESS_KEY_ID,
-        aws_secret_access_key=config.AWS_SECRET_ACCESS_KEY,
-        region_name=config.AWS_REGION
-    )
+    """Get shared IAM client."""
+    return get_client('iam')
 
 
 def database_exists(database_name: str) -> bool:
@@ -193,3 +205,239 @@ def get_crawler_status(crawler_name: str) -> Optional[str]:
     except ClientError as e:
         logger.error(f"❌ Failed to get crawler status: {e}")
         return None
+
+
+def get_table_location(database_name: str, table_name: str) -> Optional[str]:
+    """Get a catalog table's S3 location, or None if it doesn't exist."""
+    glue = _get_glue_client()
+    try:
+        response = glue.get_table(DatabaseName=database_name, Name=table_name)
+        return response['Table']['StorageDescriptor']['Location']
+    except ClientError as e:
+        if e.response['Error']['Code'] != 'EntityNotFoundException':
+            logger.error(f"❌ Failed to get table '{database_name}.{table_name}': {e}")
+        return None
+
+
+def get_crawlers(crawler_names: list[str]) -> dict[str, dict]:
+    """Fetch crawler descriptions, up to 100 names per request."""
+    glue = _get_glue_client()
+    crawlers = {}
+    for start in range(0, len(crawler_names), 100):
+        response = glue.batch_get_crawlers(CrawlerNames=crawler_names[start:start + 100])
+        crawlers.update({crawler['Name']: crawler for crawler in response['Crawlers']})
+    return crawlers
+
+
+def get_crawler_metrics(crawler_names: list[str]) -> dict[str, dict]:
+    """Fetch crawler metrics (tables created/updated, runtimes) by name, up to 100 names per request."""
+    glue = _get_glue_client()
+    crawler_metrics = {}
+    for start in range(0, len(crawler_names), 100):
+        response = glue.get_crawler_metrics(CrawlerNameList=crawler_names[start:start + 100])
+        crawler_metrics.update({entry['CrawlerName']: entry for entry in response['CrawlerMetricsList']})
+    return crawler_metrics
+
+
+def _crawl_finished(crawler: dict, seen_running: bool, started_after: Optional[datetime]) -> bool:
+    """
+    A crawl is finished once the crawler is READY again.
+
+    Right after start_crawler the state can still read READY, so when
+    started_after is given the crawl must also have been seen running or
+    have a LastCrawl starting after it.
+    """
+    if crawler['State'] != 'READY':
+        return False
+    if started_after is None or seen_running:
+        return True
+    last_start = crawler.get('LastCrawl', {}).get('StartTime')
+    return last_start is not None and last_start >= started_after
+
+
+def _first_delay(crawler_names: list[str]) -> float:
+    """Start polling near the crawlers' median runtime when it is known."""
+    try:
+        medians = [m.get('MedianRuntimeSeconds', 0) for m in get_crawler_metrics(crawler_names).values()]
+    except ClientError:
+        medians = []
+    median = min(medians, default=0)
+    return min(max(median * 0.8, config.CRAWLER_POLL_MIN_DELAY), config.CRAWLER_POLL_MAX_DELAY)
+
+
+def _crawl_result(crawler: dict, metrics: dict) -> CrawlResult:
+    """Build a CrawlResult from batch_get_crawlers + get_crawler_metrics entries."""
+    last_crawl = crawler.get('LastCrawl', {})
+    return CrawlResult(
+        crawler_name=crawler['Name'],
+        state=crawler['State'],
+        status=last_crawl.get('Status'),
+        tables_created=metrics.get('TablesCreated', 0),
+        tables_updated=metrics.get('TablesUpdated', 0),
+        tables_deleted=metrics.get('TablesDeleted', 0),
+        duration_seconds=metrics.get('LastRuntimeSeconds', 0.0),
+        error=last_crawl.get('ErrorMessage'),
+    )
+
+
+def _poll_crawlers(crawler_names: list[str]) -> Optional[dict[str, dict]]:
+    """get_crawlers, or None (logged) if the request failed."""
+    try:
+        return get_crawlers(crawler_names)
+    except ClientError as e:
+        logger.error(f"❌ Failed to get crawler status: {e}")
+        return None
+
+
+def _collect_results(crawlers: dict[str, dict]) -> dict[str, CrawlResult]:
+    """Attach metrics to the final crawler descriptions (none if they can't be fetched)."""
+    try:
+        metrics = get_crawler_metrics(list(crawlers)) if crawlers else {}
+    except ClientError as e:
+        logger.error(f"❌ Failed to get crawler metrics: {e}")
+        metrics = {}
+    return {
+        name: _crawl_result(crawler, metrics.get(name, {}))
+        for name, crawler in crawlers.items()
+    }
+
+
+def wait_for_crawlers(
+    crawler_names: list[str],
+    timeout: float = config.CRAWLER_TIMEOUT,
+    started_after: Optional[datetime] = None
+) -> dict[str, CrawlResult]:
+    """
+    Wait for several crawlers at once and return their LastCrawl results.
+
+    One batch_get_crawlers call per tick covers every crawler. Ticks back
+    off by 1.5x with jitter between CRAWLER_POLL_MIN_DELAY and
+    CRAWLER_POLL_MAX_DELAY, so completion is noticed within a few seconds
+    of the real crawl time without hammering the API.
+
+    Pass started_after (timezone-aware, taken just before start_crawler)
+    so a crawler that hasn't left READY yet isn't taken as finished.
+
+    Crawlers still running at the deadline come back with status TIMEOUT
+    and their last polled state (their LastCrawl is the previous run). If
+    the status can't be fetched (ClientError), waiting stops and the
+    crawlers still pending come back with state None and the error.
+    """
+    start = time.monotonic()
+    deadline = start + timeout
+    delay = _first_delay(crawler_names)
+    pending, seen_running, finished, crawlers = set(crawler_names), set(), {}, {}
+    while pending:
+        crawlers = _poll_crawlers(sorted(pending))
+        if crawlers is None:
+            break
+        for name in pending - crawlers.keys():
+            logger.error(f"❌ Crawler '{name}' not found")
+        pending &= crawlers.keys()
+        for name, crawler in crawlers.items():
+            if crawler['State'] != 'READY':
+                seen_running.add(name)
+            elif _crawl_finished(crawler, name in seen_running, started_after):
+                finished[name] = crawler
+                pending.discard(name)
+        remaining = deadline - time.monotonic()
+        if not pending or remaining <= 0:
+            break
+        logger.info(f"⏳ Waiting on {len(pending)} crawler(s): {sorted(pending)}")
+        # Never sleep past the deadline: the last poll happens at it
+        time.sleep(min(random.uniform(delay / 2, delay), remaining))
+        delay = min(delay * 1.5, config.CRAWLER_POLL_MAX_DELAY)
+
+    results = _collect_results(finished)
+    for name in sorted(pending):
+        if crawlers is None:
+            results[name] = CrawlResult(name, state=None, error='crawler status unavailable')
+        else:
+            results[name] = CrawlResult(name, state=crawlers[name]['State'], status='TIMEOUT', timed_out=True)
+    metrics.observe('glue_crawler_wait_seconds', time.monotonic() - start)
+    for result in results.values():
+        _record_crawl_metrics(result)
+        _log_crawl_result(result)
+    return results
+
+
+def wait_for_crawler(
+    crawler_name: str,
+    timeout: float = config.CRAWLER_TIMEOUT,
+    started_after: Optional[datetime] = None
+) -> Optional[CrawlResult]:
+    """Wait for one crawler; None if it doesn't exist."""
+    return wait_for_crawlers([crawler_name], timeout, started_after).get(crawler_name)
+
+
+def _record_crawl_metrics(result: CrawlResult) -> None:
+    """Crawl runtime and table counters per crawler."""
+    labels = {'crawler': result.crawler_name}
+    metrics.inc('glue_crawls_total', status='timeout' if result.timed_out else result.status, **labels)
+    metrics.observe('glue_crawl_runtime_seconds', result.duration_seconds, **labels)
+    metrics.inc('glue_tables_created_total', result.tables_created, **labels)
+    metrics.inc('glue_tables_updated_total', result.tables_updated, **labels)
+
+
+def _log_crawl_result(result: CrawlResult) -> None:
+    """Log one crawl outcome."""
+    if result.timed_out:
+        logger.warning(f"⏱️  Crawler '{result.crawler_name}' still {result.state} at timeout")
+    elif result.succeeded:
+        logger.info(
+            f"✅ Crawler '{result.crawler_name}' finished in {result.duration_seconds:.0f}s: "
+            f"{result.tables_created} created, {result.tables_updated} updated, {result.tables_deleted} deleted"
+        )
+    else:
+        logger.error(f"❌ Crawler '{result.crawler_name}' {result.status}: {result.error}")
+
+
+def upsert_table(database_name: str, table_input: dict) -> bool:
+    """Create a catalog table, or update its definition if it exists."""
+    glue = _get_glue_client()
+    try:
+        retry.call('glue:create_table', glue.create_table, DatabaseName=database_name, TableInput=table_input)
+        logger.info(f"✅ Created table '{database_name}.{table_input['Name']}'")
+        return True
+    except ClientError as e:
+        if e.response['Error']['Code'] != 'AlreadyExistsException':
+            logger.error(f"❌ Failed to create table '{table_input['Name']}': {e}")
+            return False
+
+    try:
+        retry.call('glue:update_table', glue.update_table, DatabaseName=database_name, TableInput=table_input)
+        logger.info(f"🔄 Updated table '{database_name}.{table_input['Name']}'")
+        return True
+    except ClientError as e:
+        logger.error(f"❌ Failed to update table '{table_input['Name']}': {e}")
+        return False
+
+
+def batch_create_partitions(database_name: str, table_name: str, partitions: list[dict]) -> tuple[int, int]:
+    """
+    Register partitions (PartitionInput dicts) 100 per request.
+
+    Partitions that already exist are skipped silently. Returns (created,
+    failed) partition counts.
+    """
+    glue = _get_glue_client()
+    created = failed = 0
+    for start in range(0, len(partitions), 100):
+        batch = partitions[start:start + 100]
+        try:
+            response = retry.call(
+                'glue:batch_create_partition', glue.batch_create_partition,
+                DatabaseName=database_name, TableName=table_name, PartitionInputList=batch
+            )
+        except ClientError as e:
+            logger.error(f"❌ Failed to create partitions for '{table_name}': {e}")
+            failed += len(batch)
+            continue
+        errors = response.get('Errors', [])
+        for error in errors:
+            if error['ErrorDetail']['ErrorCode'] != 'AlreadyExistsException':
+                logger.error(f"❌ Partition {error['PartitionValues']}: {error['ErrorDetail']['ErrorMessage']}")
+                failed += 1
+        created += len(batch) - len(errors)
+    metrics.inc('glue_partitions_created_total', created, table=table_name)
+    return created, failed
@@ -0,0 +1,136 @@
+"""Local manifest of already-processed inputs for incremental runs.
+
+Layout (JSON):
+    {
+        "transforms": {"<csv path>": {size, mtime, sha256, output, writer_config}},
+        "uploads": {"<s3 key>": {size, mtime, sha256, etag}}
+    }
+
+A file counts as unchanged when size and mtime match the stored entry, or,
+if only the mtime moved, when its SHA-256 still matches. A transform is
+also redone when the digest of its writer settings (config_digest) moved.
+"""
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Optional
+
+from . import config
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+HASH_CHUNK_SIZE = 8 * 1024 * 1024
+
+
+def load_manifest(path: Path = config.MANIFEST_PATH) -> dict:
+    """Load manifest from disk (empty manifest if missing or corrupt)."""
+    try:
+        manifest = json.loads(path.read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        manifest = {}
+    manifest.setdefault('transforms', {})
+    manifest.setdefault('uploads', {})
+    return manifest
+
+
+def save_manifest(manifest: dict, path: Path = config.MANIFEST_PATH) -> None:
+    """Atomically write manifest to disk."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix('.tmp')
+    tmp_path.write_text(json.dumps(manifest, indent=2, sort_keys=True))
+    os.replace(tmp_path, path)
+
+
+def file_sha256(path: Path) -> str:
+    """Hash file contents in fixed-size chunks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        while chunk := f.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def fingerprint(path: Path, previous: Optional[dict] = None) -> dict:
+    """
+    Build {size, mtime, sha256} for a file.
+
+    Reuses the previous hash when size and mtime are unchanged, so
+    unchanged files are never re-read.
+    """
+    stat = path.stat()
+    entry = {'size': stat.st_size, 'mtime': stat.st_mtime}
+    if previous and previous.get('size') == entry['size'] and previous.get('mtime') == entry['mtime']:
+        entry['sha256'] = previous['sha256']
+    else:
+        entry['sha256'] = file_sha256(path)
+    return entry
+
+
+def config_digest(settings: dict) -> str:
+    """SHA-256 of JSON-serialisable settings (key order does not matter)."""
+    return hashlib.sha256(json.dumps(settings, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def is_unchanged(path: Path, previous: Optional[dict]) -> bool:
+    """Check a file against its stored manifest entry (read-only)."""
+    if not previous or not path.exists():
+        return False
+    stat = path.stat()
+    if previous['size'] != stat.st_size:
+        return False
+    return previous['mtime'] == stat.st_mtime or previous['sha256'] == file_sha256(path)
+
+
+def refresh_entry(path: Path, previous: dict) -> dict:
+    """
+    Entry for a file is_unchanged() accepted, with its current mtime.
+
+    A touched-but-identical file then takes the cheap size/mtime path on
+    the next run instead of being hashed again.
+    """
+    return {**previous, 'mtime': path.stat().st_mtime}
+
+
+def filter_unchanged_uploads(
+    files: list[tuple[Path, str]],
+    manifest: dict
+) -> tuple[list[tuple[Path, str]], list[tuple[Path, str]]]:
+    """Split (local_path, s3_key) pairs into (pending, skipped); see record_skipped_uploads."""
+    pending, skipped = [], []
+    for local_path, s3_key in files:
+        if is_unchanged(local_path, manifest['uploads'].get(s3_key)):
+            skipped.append((local_path, s3_key))
+        else:
+            pending.append((local_path, s3_key))
+    return pending, skipped
+
+
+def record_uploads(results: list, manifest: dict) -> None:
+    """Store fingerprint and S3 ETag (as reported by upload_files) for each successful TransferResult."""
+    for result in results:
+        if not result.success:
+            continue
+        entry = fingerprint(result.local_path, manifest['uploads'].get(result.s3_key))
+        entry['etag'] = result.etag
+        manifest['uploads'][result.s3_key] = entry
+
+
+def record_skipped_uploads(skipped: list[tuple[Path, str]], manifest: dict) -> None:
+    """Refresh the mtimes of files filter_unchanged_uploads() skipped."""
+    for local_path, s3_key in skipped:
+        manifest['uploads'][s3_key] = refresh_entry(local_path, manifest['uploads'][s3_key])
+
+
+def log_upload_savings(skipped: list[tuple[Path, str]]) -> None:
+    """Log PUT requests and bytes avoided by skipping unchanged files."""
+    if not skipped:
+        return
+    saved_bytes = sum(local_path.stat().st_size for local_path, _ in skipped)
+    saved_cost = len(skipped) / 1000 * config.S3_PUT_COST_PER_1000
+    logger.info(
+        f"⏭️  Skipped {len(skipped)} unchanged uploads "
+        f"({saved_bytes:,} B, ~${saved_cost:.6f} in PUT requests)"
+    )
@@ -0,0 +1,186 @@
+"""Pipeline instrumentation: counters, histograms and timers.
+
+A process-wide, thread-safe registry that the transformer, S3 and Glue
+clients record into:
+
+    metrics.inc('s3_upload_bytes_total', size, prefix='processed')
+    with metrics.timer('transform_seconds', entity='customers'):
+        ...
+
+    @metrics.timed('glue_crawler_wait_seconds')
+    def wait(...): ...
+
+export() appends the run's series to a JSON lines file and/or writes a
+Prometheus text file (METRICS_EXPORT), so throughput can be compared
+across runs or scraped by node_exporter's textfile collector.
+"""
+import bisect
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Iterator
+
+from . import config
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Seconds, from a fast API call up to a long crawl
+DEFAULT_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600)
+
+Labels = tuple[tuple[str, str], ...]
+
+
+@dataclass
+class Histogram:
+    """Cumulative-bucket histogram (Prometheus semantics)."""
+    buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    counts: list[int] = field(default_factory=lambda: [0] * (len(DEFAULT_BUCKETS) + 1))
+    count: int = 0
+    sum: float = 0.0
+    min: float = float('inf')
+    max: float = float('-inf')
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        """(le, cumulative count) pairs including +Inf."""
+        total, pairs = 0, []
+        for bound, count in zip([*map(str, self.buckets), '+Inf'], self.counts):
+            total += count
+            pairs.append((bound, total))
+        return pairs
+
+
+_lock = threading.Lock()
+_counters: dict[tuple[str, Labels], float] = {}
+_histograms: dict[tuple[str, Labels], Histogram] = {}
+
+
+def _labels(labels: dict) -> Labels:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def inc(name: str, value: float = 1, **labels) -> None:
+    """Add value to a counter."""
+    key = (name, _labels(labels))
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + value
+
+
+def observe(name: str, value: float, **labels) -> None:
+    """Record one observation in a histogram."""
+    key = (name, _labels(labels))
+    with _lock:
+        _histograms.setdefault(key, Histogram()).observe(value)
+
+
+@contextmanager
+def timer(name: str, **labels) -> Iterator[None]:
+    """Time a block into histogram `name` (seconds), also when it raises."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(name, time.perf_counter() - start, **labels)
+
+
+def timed(name: str, **labels) -> Callable:
+    """Decorator version of timer()."""
+    def decorator(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with timer(name, **labels):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def reset() -> None:
+    """Drop all recorded series (e.g. between benchmark runs)."""
+    with _lock:
+        _counters.clear()
+        _histograms.clear()
+
+
+def snapshot() -> list[dict]:
+    """All series as plain dicts (the JSON lines records)."""
+    with _lock:
+        records = [
+            {'name': name, 'type': 'counter', 'labels': dict(labels), 'value': value}
+            for (name, labels), value in sorted(_counters.items())
+        ]
+        records += [
+            {
+                'name': name, 'type': 'histogram', 'labels': dict(labels),
+                'count': h.count, 'sum': h.sum, 'min': h.min, 'max': h.max,
+                'buckets': dict(h.cumulative()),
+            }
+            for (name, labels), h in sorted(_histograms.items())
+        ]
+    return records
+
+
+def export_jsonl(path: Path = config.METRICS_JSONL_PATH, run_id: str = '') -> None:
+    """Append this run's series to a JSON lines file (one record per series)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    stamp = {'timestamp': datetime.now().isoformat(timespec='seconds'), 'run_id': run_id}
+    with open(path, 'a') as f:
+        for record in snapshot():
+            f.write(json.dumps({**stamp, **record}) + '\n')
+
+
+def _prom_labels(labels: dict, **extra) -> str:
+    pairs = {**labels, **extra}
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{key}="{value}"' for key, value in pairs.items()) + '}'
+
+
+def _prom_lines(record: dict) -> list[str]:
+    """Prometheus exposition lines for one series."""
+    name, labels = record['name'], record['labels']
+    if record['type'] == 'counter':
+        return [f"{name}{_prom_labels(labels)} {record['value']}"]
+    lines = [f"{name}_bucket{_prom_labels(labels, le=le)} {count}" for le, count in record['buckets'].items()]
+    lines.append(f"{name}_sum{_prom_labels(labels)} {record['sum']}")
+    lines.append(f"{name}_count{_prom_labels(labels)} {record['count']}")
+    return lines
+
+
+def export_prometheus(path: Path = config.METRICS_PROM_PATH) -> None:
+    """Write all series in Prometheus text format (replaces the file atomically)."""
+    lines, typed = [], set()
+    for record in snapshot():
+        if record['name'] not in typed:
+            lines.append(f"# TYPE {record['name']} {record['type']}")
+            typed.add(record['name'])
+        lines.extend(_prom_lines(record))
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix('.tmp')
+    tmp_path.write_text('\n'.join(lines) + '\n')
+    os.replace(tmp_path, path)
+
+
+def export(run_id: str = '') -> None:
+    """Export to the formats listed in METRICS_EXPORT ('jsonl', 'prometheus')."""
+    formats = {item.strip() for item in config.METRICS_EXPORT.split(',') if item.strip()}
+    if 'jsonl' in formats:
+        export_jsonl(run_id=run_id)
+    if 'prometheus' in formats:
+        export_prometheus()
+    if formats:
+        logger.info(f"📈 Exported {len(snapshot())} metric series ({', '.join(sorted(formats))})")
@@ -0,0 +1,168 @@
+"""Named Parquet writer profiles.
+
+Profiles bundle the writer knobs that trade file size and scan speed
+against write latency:
+- default: snappy, pyarrow defaults (the original transformer output)
+- scan-optimised: zstd, large row groups, page index + Bloom filters,
+  for big fact tables scanned by Athena
+- low-latency: snappy, small row groups and pages, for small dimension
+  tables that are rewritten often
+
+Selection is per entity via config (PARQUET_PROFILE / PARQUET_ENTITY_PROFILES).
+"""
+import dataclasses
+import inspect
+import logging
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Optional
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from . import config
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Bloom filters need pyarrow >= 22
+SUPPORTS_BLOOM_FILTERS = 'bloom_filter_options' in inspect.signature(pq.ParquetWriter.__init__).parameters
+
+DEFAULT_ROW_GROUP_SIZE = 1024 * 1024  # pyarrow's default max rows per row group
+
+# High-cardinality lookup columns worth a Bloom filter (point lookups by value)
+ENTITY_BLOOM_FILTER_COLUMNS: dict[str, tuple[str, ...]] = {
+    'customers': ('email', 'dni'),
+    'accounts': ('account_number',),
+    'transactions': ('reference_number',),
+}
+
+
+@dataclass(frozen=True)
+class WriterProfile:
+    """Parquet writer settings.
+
+    Attributes:
+        dictionary: 'all' (every column), 'categorical' (only columns the
+            schema marks as dictionary) or 'none'
+        row_group_size: Max rows per row group (None = pyarrow default)
+        data_page_size: Target data page size in bytes
+        bloom_filter_fpp: False-positive rate of each Bloom filter
+    """
+    name: str
+    compression: str = 'snappy'
+    compression_level: Optional[int] = None
+    row_group_size: Optional[int] = None
+    data_page_size: Optional[int] = None
+    dictionary: str = 'all'
+    write_statistics: bool = True
+    write_page_index: bool = False
+    bloom_filters: bool = False
+    bloom_filter_columns: tuple[str, ...] = ()
+    bloom_filter_fpp: float = 0.05
+
+    def writer_kwargs(self, schema: Optional[pa.Schema] = None, expected_rows: Optional[int] = None) -> dict:
+        """Keyword arguments for pq.ParquetWriter (expected_rows sizes the Bloom filters)."""
+        kwargs = {
+            'compression': self.compression,
+            'compression_level': self.compression_level,
+            'data_page_size': self.data_page_size,
+            'use_dictionary': self._use_dictionary(schema),
+            'write_statistics': self.write_statistics,
+            'write_page_index': self.write_page_index,
+        }
+        if self.bloom_filter_columns and SUPPORTS_BLOOM_FILTERS:
+            options = {'ndv': self.bloom_filter_ndv(expected_rows), 'fpp': self.bloom_filter_fpp}
+            kwargs['bloom_filter_options'] = {column: options for column in self.bloom_filter_columns}
+        return kwargs
+
+    @property
+    def rows_per_group(self) -> int:
+        """row_group_size, or pyarrow's default, so every write path groups rows alike."""
+        return self.row_group_size or DEFAULT_ROW_GROUP_SIZE
+
+    def bloom_filter_ndv(self, expected_rows: Optional[int] = None) -> int:
+        """
+        Distinct values each Bloom filter is sized for.
+
+        Filters are per row group, and the Bloom columns are near-unique, so
+        one row group (or the whole file, if smaller) bounds the count.
+        Without an explicit ndv pyarrow reserves ~1M values per filter,
+        tens of MB of writer memory per open file.
+        """
+        ndv = self.rows_per_group
+        return max(1, min(ndv, expected_rows)) if expected_rows is not None else ndv
+
+    def _use_dictionary(self, schema: Optional[pa.Schema]) -> bool | list[str]:
+        """Resolve the dictionary setting against a schema."""
+        if self.dictionary == 'none':
+            return False
+        if self.dictionary == 'categorical' and schema is not None:
+            return [field.name for field in schema if pa.types.is_dictionary(field.type)]
+        return True
+
+
+PROFILES: dict[str, WriterProfile] = {
+    'default': WriterProfile(name='default'),
+    'scan-optimised': WriterProfile(
+        name='scan-optimised',
+        compression='zstd',
+        compression_level=9,
+        row_group_size=1_000_000,
+        data_page_size=1024 * 1024,
+        write_page_index=True,
+        bloom_filters=True,
+    ),
+    'low-latency': WriterProfile(
+        name='low-latency',
+        compression='snappy',
+        row_group_size=50_000,
+        data_page_size=64 * 1024,
+        dictionary='categorical',
+    ),
+}
+
+DEFAULT_PROFILE = PROFILES['default']
+
+
+def _entity_profile_names() -> dict[str, str]:
+    """Parse PARQUET_ENTITY_PROFILES ('transactions:scan-optimised,...')."""
+    mapping = {}
+    for item in filter(None, config.PARQUET_ENTITY_PROFILES.split(',')):
+        entity, _, name = item.partition(':')
+        mapping[entity.strip()] = name.strip()
+    return mapping
+
+
+def get_profile(entity: Optional[str] = None) -> WriterProfile:
+    """Get the configured writer profile for an entity."""
+    name = _entity_profile_names().get(entity, config.PARQUET_PROFILE)
+    if name not in PROFILES:
+        raise ValueError(f"Unknown Parquet profile '{name}' (expected one of {sorted(PROFILES)})")
+
+    profile = PROFILES[name]
+    if profile.bloom_filters and entity in ENTITY_BLOOM_FILTER_COLUMNS:
+        if not SUPPORTS_BLOOM_FILTERS:
+            logger.warning(f"⚠️  pyarrow {pa.__version__} cannot write Bloom filters; skipping for {entity}")
+        profile = dataclasses.replace(profile, bloom_filter_columns=ENTITY_BLOOM_FILTER_COLUMNS[entity])
+    return profile
+
+
+def row_groups(batches: Iterable[pa.RecordBatch], row_group_size: int) -> Iterator[pa.Table]:
+    """
+    Regroup batches into tables of exactly row_group_size rows, the last
+    one shorter.
+
+    Overflow is carried into the next table, so writing each table as one
+    row group leaves no small remainder groups behind.
+    """
+    buffer, buffered_rows = [], 0
+    for batch in batches:
+        buffer.append(batch)
+        buffered_rows += batch.num_rows
+        while buffered_rows >= row_group_size:
+            table = pa.Table.from_batches(buffer)
+            yield table.slice(0, row_group_size)
+            rest = table.slice(row_group_size)
+            buffer, buffered_rows = rest.to_batches(), rest.num_rows
+    if buffered_rows:
+        yield pa.Table.from_batches(buffer)
@@ -0,0 +1,124 @@
+"""Memory-mapped Parquet reader for downstream consumers.
+
+`pd.read_parquet` reads every column of every row group and copies the
+result into pandas blocks. For a job that needs two columns of a wide
+table, most of that work and memory is wasted. This module instead:
+- memory-maps the files: opening one reads only the footer, and column
+  chunks are served from the page cache without read() copies
+- reads only the requested columns (projection) and row groups (picked
+  by index or by a min/max-statistics predicate)
+- yields RecordBatches for streaming jobs, so memory stays at one batch
+- returns Arrow tables; to_pandas() converts only when asked, with
+  split blocks and self-destruct so the conversion does not double
+  memory
+
+Entities are resolved like query_engine does: the latest date= snapshot,
+or all Hive data partitions. Hive partition columns (year=, month=) are
+in the path, not in the files, so they are not returned; use
+query_engine for partition-aware queries.
+
+    table = read_entity('transactions', columns=['account_id', 'amount'],
+                        where=('transaction_date', '>=', datetime(2024, 1, 1)))
+    for batch in iter_batches('transactions', columns=['amount']):
+        ...
+"""
+import logging
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.fs as pafs
+import pyarrow.parquet as pq
+
+from . import config
+from .clustering import matching_row_groups
+from .query_engine import list_entity_files
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_ROOT = config.PROCESSED_DATA_DIR / 'finanzas'
+DEFAULT_BATCH_SIZE = 64 * 1024  # rows
+
+# (column, op, value) with op in clustering.PREDICATES, e.g. ('amount', '>', Decimal('1000'))
+Predicate = tuple[str, str, Any]
+
+
+def open_file(path: Path) -> pq.ParquetFile:
+    """Memory-map a Parquet file (only the footer is read)."""
+    return pq.ParquetFile(path, memory_map=True)
+
+
+def entity_files(entity: str, root: Path = DEFAULT_ROOT) -> list[Path]:
+    """Local data files of an entity (latest snapshot or all Hive partitions)."""
+    entity_dir = Path(root).resolve() / entity
+    return [Path(path) for path in list_entity_files(pafs.LocalFileSystem(), str(entity_dir))]
+
+
+def select_row_groups(parquet_file: pq.ParquetFile, where: Optional[Predicate]) -> Optional[list[int]]:
+    """Row groups that may hold rows matching where (None = all)."""
+    if where is None:
+        return None
+    return matching_row_groups(parquet_file.metadata, *where)
+
+
+def read(
+    path: Path,
+    columns: Optional[list[str]] = None,
+    row_groups: Optional[list[int]] = None,
+    where: Optional[Predicate] = None
+) -> pa.Table:
+    """
+    Read selected columns and row groups of one file as an Arrow table.
+
+    `where` only skips row groups whose statistics rule it out; rows of
+    the remaining groups are not filtered.
+    """
+    parquet_file = open_file(path)
+    if row_groups is None:
+        row_groups = select_row_groups(parquet_file, where)
+    if row_groups is None:
+        return parquet_file.read(columns=columns)
+    return parquet_file.read_row_groups(row_groups, columns=columns)
+
+
+def read_entity(
+    entity: str,
+    columns: Optional[list[str]] = None,
+    where: Optional[Predicate] = None,
+    root: Path = DEFAULT_ROOT
+) -> pa.Table:
+    """Read an entity's files (projected and row-group pruned) as one table."""
+    files = entity_files(entity, root)
+    if not files:
+        raise FileNotFoundError(f"No Parquet files for '{entity}' under {root}")
+    tables = [read(path, columns, where=where) for path in files]
+    return pa.concat_tables(tables, promote_options='permissive')
+
+
+def iter_batches(
+    entity: str,
+    columns: Optional[list[str]] = None,
+    where: Optional[Predicate] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    root: Path = DEFAULT_ROOT
+) -> Iterator[pa.RecordBatch]:
+    """Stream an entity as RecordBatches of up to batch_size rows."""
+    for path in entity_files(entity, root):
+        parquet_file = open_file(path)
+        row_groups = select_row_groups(parquet_file, where)
+        if row_groups == []:
+            continue
+        yield from parquet_file.iter_batches(batch_size, row_groups=row_groups, columns=columns)
+
+
+def to_pandas(table: pa.Table) -> pd.DataFrame:
+    """
+    Convert to pandas without doubling memory.
+
+    Columns become separate blocks (no consolidation copy) and Arrow
+    buffers are released as they are converted: `table` must not be used
+    afterwards.
+    """
+    return table.to_pandas(split_blocks=True, self_destruct=True)
@@ -5,25 +5,40 @@ Benefits:
 - 100x faster queries (columnar format)
 - Cheaper Athena costs (less data scanned)
 """
+import dataclasses
+import io
 import logging
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
+from typing import NamedTuple, Optional
 
-import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pv
+import pyarrow.parquet as pq
 
-from . import config
+from . import config, metrics
+from .clustering import external_sort, get_cluster_keys, merge_sorted_runs, sort_table
+from .manifest import config_digest, fingerprint, is_unchanged, load_manifest, refresh_entry, save_manifest
+from .parquet_profiles import DEFAULT_PROFILE, WriterProfile, get_profile, row_groups
+from .partitioning import (
+    PartitionField,
+    add_partition_columns,
+    check_partition_guard,
+    get_partition_spec,
+    remove_partition_dirs,
+    write_partitioned
+)
+from .schemas import get_schema
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-def csv_to_parquet(csv_path: Path, parquet_path: Path) -> None:
-    """Convert CSV file to Parquet format."""
-    parquet_path.parent.mkdir(parents=True, exist_ok=True)
-
-    df = pd.read_csv(csv_path)
-    df.to_parquet(parquet_path, compression='snappy', index=False)
-
+def _log_compression(csv_path: Path, parquet_path: Path) -> None:
+    """Log size before/after conversion."""
     csv_size = csv_path.stat().st_size
     parquet_size = parquet_path.stat().st_size
     compression_ratio = csv_size / parquet_size if parquet_size > 0 else 0
@@ -34,10 +49,522 @@ def csv_to_parquet(csv_path: Path, parquet_path: Path) -> None:
     )
 
 
-def transform_all_finance_data() -> None:
-    """Transform all finance CSV files to Parquet."""
+def _entity_schema(csv_path: Path) -> Optional[pa.Schema]:
+    """Look up the registered schema for a finanzas_{entity}.csv file."""
+    return get_schema(csv_path.stem.replace('finanzas_', ''))
+
+
+def _entity_profile(csv_path: Path) -> WriterProfile:
+    """Look up the configured writer profile for a finanzas_{entity}.csv file."""
+    return get_profile(csv_path.stem.replace('finanzas_', ''))
+
+
+def _entity_cluster_keys(csv_path: Path) -> Optional[list[str]]:
+    """Look up sort keys for a finanzas_{entity}.csv file (None = CSV order)."""
+    return get_cluster_keys(csv_path.stem.replace('finanzas_', ''))
+
+
+def _writer_kwargs(
+    arrow_schema: pa.Schema,
+    profile: WriterProfile,
+    schema: Optional[pa.Schema] = None,
+    cluster_keys: Optional[list[str]] = None,
+    expected_rows: Optional[int] = None
+) -> dict:
+    """Profile writer settings plus sorting-column metadata for clustered output."""
+    kwargs = profile.writer_kwargs(schema, expected_rows)
+    if cluster_keys:
+        ordering = [(key, 'ascending') for key in cluster_keys]
+        kwargs['sorting_columns'] = pq.SortingColumn.from_ordering(arrow_schema, ordering)
+    return kwargs
+
+
+def _write_table(
+    table: pa.Table,
+    parquet_path: Path,
+    profile: WriterProfile,
+    schema: Optional[pa.Schema] = None,
+    cluster_keys: Optional[list[str]] = None
+) -> None:
+    """Write a table with the profile's writer settings, sorted if clustered."""
+    if cluster_keys:
+        table = sort_table(table, cluster_keys)
+    kwargs = _writer_kwargs(table.schema, profile, schema, cluster_keys, table.num_rows)
+    with pq.ParquetWriter(parquet_path, table.schema, **kwargs) as writer:
+        writer.write_table(table, row_group_size=profile.rows_per_group)
+
+
+def _pandas_type(inferred: pa.DataType) -> pa.DataType:
+    """The type pandas.read_csv would give a column pyarrow inferred as `inferred`."""
+    if pa.types.is_null(inferred):
+        return pa.float64()
+    if pa.types.is_integer(inferred) or pa.types.is_floating(inferred) or pa.types.is_boolean(inferred):
+        return inferred
+    return pa.large_string()
+
+
+def _column_types(csv_path: Path, schema: Optional[pa.Schema]) -> pa.Schema:
+    """
+    Types to parse a CSV into: the registered schema, or inferred ones.
+
+    Without a schema, types are inferred from the first block and mapped
+    to what the pandas conversion wrote: dates, times and text stay
+    large_string, all-null columns are float64. (Integer columns with
+    blanks stay nullable int64, where pandas fell back to float64.)
+    Every read path uses this, so the output does not depend on the mode.
+    """
+    if schema is not None:
+        return schema
+    reader = pv.open_csv(csv_path)
+    inferred = reader.schema
+    reader.close()
+    return pa.schema([(field.name, _pandas_type(field.type)) for field in inferred])
+
+
+def _convert_options(column_types: pa.Schema) -> pv.ConvertOptions:
+    """Parse columns straight into the given types."""
+    return pv.ConvertOptions(column_types={field.name: field.type for field in column_types})
+
+
+def _stream_csv_to_parquet(
+    csv_path: Path,
+    parquet_path: Path,
+    block_size: int,
+    schema: Optional[pa.Schema] = None,
+    profile: WriterProfile = DEFAULT_PROFILE,
+    cluster_keys: Optional[list[str]] = None
+) -> int:
+    """
+    Convert CSV to Parquet in bounded batches.
+
+    CSV blocks are regrouped into row groups of the profile's
+    row_group_size (pyarrow's default if unset) and appended through a
+    single ParquetWriter, so peak memory is bounded by the row-group size
+    regardless of file size. With cluster_keys, blocks go through an
+    external merge sort first. Returns the number of rows written.
+    """
+    read_options = pv.ReadOptions(block_size=block_size)
+    convert_options = _convert_options(_column_types(csv_path, schema))
+    reader = pv.open_csv(csv_path, read_options=read_options, convert_options=convert_options)
+    batches = reader
+    if cluster_keys:
+        # Spilled runs round-trip through Parquet (timestamp[s] comes back as [ms])
+        sorted_tables = external_sort(reader, cluster_keys)
+        batches = (batch for table in sorted_tables for batch in table.cast(reader.schema).to_batches())
+
+    rows = 0
+    row_group_size = profile.rows_per_group
+    kwargs = _writer_kwargs(reader.schema, profile, schema, cluster_keys)
+    with pq.ParquetWriter(parquet_path, reader.schema, **kwargs) as writer:
+        for table in row_groups(batches, row_group_size):
+            writer.write_table(table, row_group_size=row_group_size)
+            rows += table.num_rows
+    return rows
+
+
+def _read_csv_table(csv_path: Path, schema: Optional[pa.Schema]) -> pa.Table:
+    """Read a whole CSV into the schema's types (see _column_types without one)."""
+    return pv.read_csv(csv_path, convert_options=_convert_options(_column_types(csv_path, schema)))
+
+
+def csv_to_parquet(
+    csv_path: Path,
+    parquet_path: Path,
+    streaming: bool = False,
+    block_size: int = config.CSV_BLOCK_SIZE,
+    schema: Optional[pa.Schema] = None,
+    profile: WriterProfile = DEFAULT_PROFILE,
+    cluster_keys: Optional[list[str]] = None
+) -> None:
+    """
+    Convert CSV file to Parquet format.
+
+    Args:
+        streaming: Read the CSV in blocks of `block_size` bytes instead of
+            loading it into a single DataFrame (for files larger than RAM)
+        schema: Explicit column types (see schemas.py); without one,
+            types are inferred as pandas did (see _column_types)
+        profile: Writer settings (codec, row groups, dictionary...); see
+            parquet_profiles.py
+        cluster_keys: Sort rows by these columns so row-group min/max
+            statistics can prune (see clustering.py)
+    """
+    parquet_path.parent.mkdir(parents=True, exist_ok=True)
+
+    if streaming:
+        _stream_csv_to_parquet(csv_path, parquet_path, block_size, schema, profile, cluster_keys)
+    else:
+        table = _read_csv_table(csv_path, schema)
+        _write_table(table, parquet_path, profile, schema, cluster_keys)
+
+    _log_compression(csv_path, parquet_path)
+
+
+def _split_csv(csv_path: Path, chunk_size: int) -> list[tuple[int, int]]:
+    """
+    Split CSV body into newline-aligned (start, end) byte ranges.
+
+    Assumes no quoted field contains a newline (true for the finance extracts).
+    """
+    file_size = csv_path.stat().st_size
+    ranges = []
+    with open(csv_path, 'rb') as f:
+        start = len(f.readline())
+        while start < file_size:
+            f.seek(min(start + chunk_size, file_size))
+            f.readline()
+            end = min(f.tell(), file_size)
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def _convert_csv_range(
+    csv_path: Path,
+    start: int,
+    end: int,
+    part_path: Path,
+    column_types: pa.Schema,
+    cluster_keys: Optional[list[str]] = None
+) -> None:
+    """Convert one byte range of a CSV (plus its header) to a Parquet part (a sorted run if clustered)."""
+    with open(csv_path, 'rb') as f:
+        header = f.readline()
+        f.seek(start)
+        body = f.read(end - start)
+
+    table = pv.read_csv(io.BytesIO(header + body), convert_options=_convert_options(column_types))
+    if cluster_keys:
+        table = sort_table(table, cluster_keys)
+    pq.write_table(table, part_path, compression='snappy')
+
+
+def _merge_parts(
+    part_paths: list[Path],
+    parquet_path: Path,
+    profile: WriterProfile = DEFAULT_PROFILE,
+    cluster_keys: Optional[list[str]] = None
+) -> None:
+    """
+    Combine Parquet parts into one file with the profile's settings.
+
+    Parts are concatenated in order, or k-way merged when they are sorted
+    runs of a clustered entity. Their batches (one per CSV block) are
+    re-batched to full row groups, pyarrow's default size if the profile
+    sets none, so the output matches a single-pass write.
+    """
+    schemas = [pq.read_schema(part) for part in part_paths]
+    schema = pa.unify_schemas(schemas, promote_options='permissive')
+    if cluster_keys:
+        batch_rows = max(config.CLUSTER_RUN_ROWS // len(part_paths), 1024)
+        tables = merge_sorted_runs(part_paths, cluster_keys, batch_rows)
+    else:
+        tables = (pq.read_table(part) for part in part_paths)
+    batches = (batch for table in tables for batch in table.cast(schema).to_batches())
+
+    rows = sum(pq.read_metadata(part).num_rows for part in part_paths)
+    row_group_size = profile.rows_per_group
+    kwargs = _writer_kwargs(schema, profile, cluster_keys=cluster_keys, expected_rows=rows)
+    with pq.ParquetWriter(parquet_path, schema, **kwargs) as writer:
+        for table in row_groups(batches, row_group_size):
+            writer.write_table(table, row_group_size=row_group_size)
+
+    for part in part_paths:
+        part.unlink()
+
+
+def _partition_keys(
+    csv_path: Path,
+    spec: list[PartitionField],
+    schema: Optional[pa.Schema],
+    block_size: int
+) -> tuple[pa.Table, int, int]:
+    """Cheap pass over only the partition source columns: (distinct keys, row count, largest partition)."""
+    sources = sorted({field.source for field in spec})
+    column_types = _column_types(csv_path, schema)
+    convert_options = pv.ConvertOptions(
+        include_columns=sources,
+        column_types={name: column_types.field(name).type for name in sources}
+    )
+    reader = pv.open_csv(csv_path, read_options=pv.ReadOptions(block_size=block_size), convert_options=convert_options)
+
+    names = [f.name for f in spec]
+    counts = []
+    for batch in reader:
+        keys = add_partition_columns(pa.Table.from_batches([batch]), spec).select(names)
+        counts.append(keys.group_by(names).aggregate([([], 'count_all')]))
+    if not counts:
+        return pa.table({name: [] for name in names}), 0, 0
+    per_partition = pa.concat_tables(counts).group_by(names).aggregate([('count_all', 'sum')])
+    rows = pc.sum(per_partition['count_all_sum']).as_py()
+    return per_partition.select(names), rows, pc.max(per_partition['count_all_sum']).as_py()
+
+
+def csv_to_partitioned_parquet(
+    csv_path: Path,
+    output_dir: Path,
+    spec: list[PartitionField],
+    streaming: bool = False,
+    block_size: int = config.CSV_BLOCK_SIZE,
+    schema: Optional[pa.Schema] = None,
+    profile: WriterProfile = DEFAULT_PROFILE,
+    cluster_keys: Optional[list[str]] = None
+) -> Optional[list[Path]]:
+    """
+    Convert CSV to a Hive-partitioned Parquet dataset under output_dir.
+
+    Returns the written files, or None if the partition guards reject
+    the spec (caller falls back to the single-file layout).
+    """
+    keys, rows, largest = _partition_keys(csv_path, spec, schema, block_size)
+    if not check_partition_guard(keys, rows):
+        return None
+
+    if streaming:
+        reader = pv.open_csv(csv_path, read_options=pv.ReadOptions(block_size=block_size),
+                             convert_options=_convert_options(_column_types(csv_path, schema)))
+        batches = reader
+        if cluster_keys:
+            batches = (b for t in external_sort(reader, cluster_keys) for b in t.cast(reader.schema).to_batches())
+        data = (add_partition_columns(batch, spec) for batch in batches)
+        data_schema = add_partition_columns(reader.schema.empty_table(), spec).schema
+    else:
+        # Grouped by partition, each writer is finished before the next opens (PARTITION_MAX_OPEN_FILES)
+        data = add_partition_columns(_read_csv_table(csv_path, schema), spec)
+        data = sort_table(data, [field.name for field in spec] + (cluster_keys or []))
+        data_schema = data.schema
+
+    writer_kwargs = profile.writer_kwargs(schema, expected_rows=min(largest, config.PARTITION_MAX_ROWS_PER_FILE))
+    written = [Path(path) for path in write_partitioned(data, data_schema, output_dir, spec, output_dir.name,
+                                                        writer_kwargs, profile)]
+    parquet_size = sum(path.stat().st_size for path in written)
+    logger.info(f"✅ {csv_path.name} → {output_dir.name}/ ({csv_path.stat().st_size:,} B → {parquet_size:,} B)")
+    return written
+
+
+class TransformResult(NamedTuple):
+    """Output of one entity conversion (a file, or a Hive dataset directory)."""
+    csv_path: Path
+    output_path: Path
+    output_bytes: int
+    rows: int = 0
+    seconds: float = 0.0
+
+
+def _result(csv_file: Path, output_path: Path, files: list[Path], start: float) -> TransformResult:
+    """Build a TransformResult, reading row counts from the Parquet footers."""
+    rows = sum(pq.ParquetFile(path).metadata.num_rows for path in files)
+    size = sum(path.stat().st_size for path in files)
+    return TransformResult(csv_file, output_path, size, rows, time.perf_counter() - start)
+
+
+def _convert_entity(csv_file: Path, parquet_file: Path, streaming: bool) -> TransformResult:
+    """
+    Convert one entity with its registered schema, profile, clustering and
+    partitioning. Runs in pool workers, so everything is resolved here.
+    """
+    start = time.perf_counter()
+    entity = csv_file.stem.replace('finanzas_', '')
+    options = dict(schema=get_schema(entity), profile=get_profile(entity), cluster_keys=get_cluster_keys(entity))
+
+    spec = get_partition_spec(entity)
+    if spec:
+        dataset_dir = parquet_file.parent.parent
+        written = csv_to_partitioned_parquet(csv_file, dataset_dir, spec, streaming, **options)
+        if written is not None:
+            return _result(csv_file, dataset_dir, written, start)
+        logger.info(f"↩️  {entity}: falling back to single-file layout")
+        remove_partition_dirs(dataset_dir, spec)
+
+    csv_to_parquet(csv_file, parquet_file, streaming=streaming, **options)
+    return _result(csv_file, parquet_file, [parquet_file], start)
+
+
+def _record_metrics(results: list[TransformResult]) -> None:
+    """
+    Record per-entity timings and row/byte counters.
+
+    Done in the parent process from the results, since metrics recorded
+    inside pool workers would be lost.
+    """
+    for result in results:
+        entity = result.csv_path.stem.replace('finanzas_', '')
+        metrics.observe('transform_seconds', result.seconds, entity=entity)
+        metrics.inc('transform_rows_total', result.rows, entity=entity)
+        metrics.inc('transform_input_bytes_total', result.csv_path.stat().st_size, entity=entity)
+        metrics.inc('transform_output_bytes_total', result.output_bytes, entity=entity)
+
+
+def _submit_chunks(
+    pool: ProcessPoolExecutor,
+    csv_file: Path,
+    parquet_file: Path,
+    chunk_size: int
+) -> tuple[list[Path], list[Future]]:
+    """Fan one large CSV out to the pool as byte-range chunks."""
+    parquet_file.parent.mkdir(parents=True, exist_ok=True)
+    part_paths, futures = [], []
+    column_types = _column_types(csv_file, _entity_schema(csv_file))
+    for i, (start, end) in enumerate(_split_csv(csv_file, chunk_size)):
+        part_path = parquet_file.with_name(f'.{parquet_file.stem}.part{i:05d}.parquet')
+        part_paths.append(part_path)
+        futures.append(pool.submit(
+            _convert_csv_range, csv_file, start, end, part_path,
+            column_types, _entity_cluster_keys(csv_file)
+        ))
+    return part_paths, futures
+
+
+def _is_partitioned(csv_file: Path) -> bool:
+    """Check whether an entity writes a Hive-partitioned dataset."""
+    return get_partition_spec(csv_file.stem.replace('finanzas_', '')) is not None
+
+
+def _transform_parallel(
+    jobs: list[tuple[Path, Path]],
+    workers: int,
+    streaming: bool,
+    chunk_size: int
+) -> list[TransformResult]:
+    """
+    Run CSV → Parquet jobs on a process pool.
+
+    Large single-file entities are split into chunks and merged afterwards;
+    partitioned entities are converted whole (the dataset writer is
+    multi-threaded itself).
+    """
+    start = time.perf_counter()
+    chunked = {}
+    futures, part_futures = [], []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for csv_file, parquet_file in jobs:
+            if csv_file.stat().st_size > chunk_size and not _is_partitioned(csv_file):
+                part_paths, chunk_futures = _submit_chunks(pool, csv_file, parquet_file, chunk_size)
+                chunked[csv_file] = (parquet_file, part_paths)
+                part_futures.extend(chunk_futures)
+            else:
+                futures.append(pool.submit(_convert_entity, csv_file, parquet_file, streaming))
+
+        for future in part_futures:
+            future.result()
+        results = [future.result() for future in futures]
+
+    for csv_file, (parquet_file, part_paths) in chunked.items():
+        _merge_parts(part_paths, parquet_file, _entity_profile(csv_file), _entity_cluster_keys(csv_file))
+        _log_compression(csv_file, parquet_file)
+        results.append(_result(csv_file, parquet_file, [parquet_file], start))
+    return results
+
+
+def _log_summary(results: list[TransformResult], skipped: int = 0) -> None:
+    """Log aggregated compression stats for transformed files."""
+    logger.info(f"\n📊 Summary:")
+    logger.info(f"  Files transformed: {len(results)}")
+    if skipped:
+        logger.info(f"  Files skipped (unchanged): {skipped}")
+    if not results:
+        return
+
+    total_csv_size = sum(result.csv_path.stat().st_size for result in results)
+    total_parquet_size = sum(result.output_bytes for result in results)
+    overall_ratio = total_csv_size / total_parquet_size if total_parquet_size > 0 else 0
+
+    logger.info(f"  Total CSV size: {total_csv_size:,} bytes ({total_csv_size / 1024:.1f} KB)")
+    logger.info(f"  Total Parquet size: {total_parquet_size:,} bytes ({total_parquet_size / 1024:.1f} KB)")
+    logger.info(f"  Overall compression: {overall_ratio:.1f}x")
+    logger.info(f"  Savings: {(1 - 1/overall_ratio) * 100:.1f}%")
+
+
+def writer_config(csv_file: Path) -> str:
+    """Digest of everything that shapes an entity's output besides its CSV."""
+    entity = csv_file.stem.replace('finanzas_', '')
+    schema = get_schema(entity)
+    spec = get_partition_spec(entity)
+    return config_digest({
+        'profile': dataclasses.asdict(get_profile(entity)),
+        'schema': schema.serialize().to_pybytes().hex() if schema is not None else None,
+        'cluster_keys': get_cluster_keys(entity),
+        'partition_spec': [tuple(field) for field in spec] if spec else None,
+    })
+
+
+def _filter_unchanged(
+    jobs: list[tuple[Path, Path]],
+    manifest: dict
+) -> tuple[list[tuple[Path, Path]], list[tuple[Path, Path]]]:
+    """Split jobs into (pending, skipped): skipped if neither the CSV nor its writer settings changed."""
+    pending, skipped = [], []
+    for csv_file, parquet_file in jobs:
+        previous = manifest['transforms'].get(str(csv_file))
+        if (
+            is_unchanged(csv_file, previous)
+            and previous.get('writer_config') == writer_config(csv_file)
+            and Path(previous['output']).exists()
+        ):
+            skipped.append((csv_file, Path(previous['output'])))
+        else:
+            pending.append((csv_file, parquet_file))
+    return pending, skipped
+
+
+def _record_transforms(results: list[TransformResult], skipped: list[tuple[Path, Path]], manifest: dict) -> None:
+    """Store input fingerprints and outputs for completed jobs; refresh the mtimes of skipped ones."""
+    for csv_file, _ in skipped:
+        manifest['transforms'][str(csv_file)] = refresh_entry(csv_file, manifest['transforms'][str(csv_file)])
+    for result in results:
+        key = str(result.csv_path)
+        entry = fingerprint(result.csv_path, manifest['transforms'].get(key))
+        entry['output'] = str(result.output_path)
+        entry['writer_config'] = writer_config(result.csv_path)
+        manifest['transforms'][key] = entry
+
+
+def _run_jobs(
+    jobs: list[tuple[Path, Path]],
+    streaming: bool,
+    workers: int,
+    chunk_size: int
+) -> list[TransformResult]:
+    """Convert jobs sequentially or on the process pool."""
+    if workers > 1:
+        return _transform_parallel(jobs, workers, streaming, chunk_size)
+    return [_convert_entity(csv_file, parquet_file, streaming) for csv_file, parquet_file in jobs]
+
+
+def processed_path(entity: str, run_date: str) -> Path:
+    """Single-file output path: processed/finanzas/{entity}/date={run_date}/{entity}.parquet."""
+    return config.PROCESSED_DATA_DIR / 'finanzas' / entity / f'date={run_date}' / f'{entity}.parquet'
+
+
+def transform_entity(
+    entity: str,
+    run_date: Optional[str] = None,
+    streaming: bool = config.PARQUET_STREAMING
+) -> TransformResult:
+    """Transform one entity's raw CSV (used by the pipeline's per-entity tasks)."""
+    csv_file = config.RAW_DATA_DIR / f'finanzas_{entity}.csv'
+    run_date = run_date or datetime.now().strftime('%Y-%m-%d')
+    result = _convert_entity(csv_file, processed_path(entity, run_date), streaming)
+    _record_metrics([result])
+    return result
+
+
+def transform_all_finance_data(
+    streaming: bool = config.PARQUET_STREAMING,
+    workers: int = config.TRANSFORM_WORKERS,
+    chunk_size: int = config.TRANSFORM_CHUNK_SIZE,
+    incremental: bool = config.INCREMENTAL
+) -> None:
+    """
+    Transform all finance CSV files to Parquet.
+
+    Args:
+        workers: Process pool size; 1 keeps the sequential loop
+        chunk_size: With workers > 1, CSVs larger than this many bytes are
+            split into chunks converted in parallel, then merged
+        incremental: Skip CSVs unchanged since the last run (see manifest)
+    """
     raw_dir = config.RAW_DATA_DIR
-    processed_dir = config.PROCESSED_DATA_DIR / 'finanzas'
 
     # Get current date for partitioning
     today = datetime.now().strftime('%Y-%m-%d')
@@ -48,29 +575,23 @@ def transform_all_finance_data() -> None:
         logger.error("❌ No CSV files found in raw directory")
         return
 
-    logger.info(f"🔄 Transforming {len(csv_files)} CSV files to Parquet...\n")
-
-    total_csv_size = 0
-    total_parquet_size = 0
-
+    jobs = []
     for csv_file in csv_files:
         # Extract entity name (e.g., 'customers' from 'finanzas_customers.csv')
         entity = csv_file.stem.replace('finanzas_', '')
+        jobs.append((csv_file, processed_path(entity, today)))
 
-        # Create partitioned path
-        parquet_dir = processed_dir / entity / f'date={today}'
-        parquet_file = parquet_dir / f'{entity}.parquet'
+    manifest = load_manifest() if incremental else None
+    skipped = []
+    if incremental:
+        jobs, skipped = _filter_unchanged(jobs, manifest)
 
-        csv_to_parquet(csv_file, parquet_file)
+    logger.info(f"🔄 Transforming {len(jobs)} CSV files to Parquet...\n")
+    results = _run_jobs(jobs, streaming, workers, chunk_size)
+    _record_metrics(results)
 
-        total_csv_size += csv_file.stat().st_size
-        total_parquet_size += parquet_file.stat().st_size
+    if incremental:
+        _record_transforms(results, skipped, manifest)
+        save_manifest(manifest)
 
-    overall_ratio = total_csv_size / total_parquet_size if total_parquet_size > 0 else 0
-
-    logger.info(f"\n📊 Summary:")
-    logger.info(f"  Files transformed: {len(csv_files)}")
-    logger.info(f"  Total CSV size: {total_csv_size:,} bytes ({total_csv_size / 1024:.1f} KB)")
-    logger.info(f"  Total Parquet size: {total_parquet_size:,} bytes ({total_parquet_size / 1024:.1f} KB)")
-    logger.info(f"  Overall compression: {overall_ratio:.1f}x")
-    logger.info(f"  Savings: {(1 - 1/overall_ratio) * 100:.1f}%")
+    _log_summary(results, len(skipped))
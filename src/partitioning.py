@@ -0,0 +1,213 @@
+"""Hive-style partitioning of finance entities on data columns.
+
+Instead of one `date={run date}` folder per load, event tables are split
+on their own dates (e.g. transactions/year=2023/month=12/), so Athena can
+prune partitions from WHERE clauses on those columns.
+
+Guards against a flood of tiny files:
+- PARTITION_MAX_COUNT: more distinct partitions than this → fall back
+  to the single-file layout
+- PARTITION_MIN_ROWS: fewer rows per partition on average → fall back
+- PARTITION_MAX_ROWS_PER_FILE bounds file sizes within a partition
+- PARTITION_MAX_OPEN_FILES bounds writers open at once (each holds its
+  row-group buffers and Bloom filters). In-memory tables are sorted by
+  partition first, so this only splits files for streamed input that
+  spans more partitions than the cap.
+
+The dataset is written to a staging directory first. Each finished
+partition directory then replaces its counterpart in the output, so a
+crashed write never leaves truncated files where the upload step finds
+them. Every write is a full snapshot of the entity: partitions it no
+longer contains, and folders of the other layout (date=...), are
+removed from the output when it is published.
+"""
+import logging
+import shutil
+from pathlib import Path
+from typing import Iterable, NamedTuple, Optional
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+
+from . import config
+from .parquet_profiles import WriterProfile
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+STAGING_ROOT = config.DATA_DIR / '.staging'
+
+
+class PartitionField(NamedTuple):
+    """One partition directory level: name=transform(source column)."""
+    name: str
+    source: str
+    transform: str = 'identity'  # identity | year | month | day
+
+
+PARTITION_SPECS: dict[str, list[PartitionField]] = {
+    'transactions': [
+        PartitionField('year', 'transaction_date', 'year'),
+        PartitionField('month', 'transaction_date', 'month'),
+    ],
+    'transfers': [
+        PartitionField('year', 'transfer_date', 'year'),
+        PartitionField('month', 'transfer_date', 'month'),
+    ],
+    'loan_payments': [PartitionField('year', 'payment_date', 'year')],
+    'exchange_rates': [PartitionField('year', 'date', 'year')],
+}
+
+TRANSFORMS = {
+    'year': pc.year,
+    'month': pc.month,
+    'day': pc.day,
+}
+
+
+def get_partition_spec(entity: str) -> Optional[list[PartitionField]]:
+    """Partition spec for entity, or None if partitioning is disabled/unconfigured."""
+    if not config.PARQUET_PARTITIONING:
+        return None
+    return PARTITION_SPECS.get(entity)
+
+
+def _partition_value(column: pa.ChunkedArray | pa.Array, transform: str) -> pa.Array:
+    """Apply a partition transform (date parts come back as int16)."""
+    if transform == 'identity':
+        return column
+    if pa.types.is_string(column.type) or pa.types.is_large_string(column.type):
+        column = pc.cast(column, pa.timestamp('s'))
+    return pc.cast(TRANSFORMS[transform](column), pa.int16())
+
+
+def add_partition_columns(
+    data: pa.Table | pa.RecordBatch,
+    spec: list[PartitionField]
+) -> pa.Table | pa.RecordBatch:
+    """Append derived partition columns (identity fields already exist)."""
+    for field in spec:
+        if field.transform != 'identity':
+            data = data.append_column(field.name, _partition_value(data[field.source], field.transform))
+    return data
+
+
+def partition_schema(data_schema: pa.Schema, spec: list[PartitionField]) -> pa.Schema:
+    """Schema of the partition key columns."""
+    return pa.schema([
+        (field.name, data_schema.field(field.source).type if field.transform == 'identity' else pa.int16())
+        for field in spec
+    ])
+
+
+def check_partition_guard(keys: pa.Table, total_rows: int) -> bool:
+    """
+    Check a table of partition key values against the count/size guards.
+
+    Returns False (and logs why) if partitioning would produce too many
+    or too small partitions.
+    """
+    partitions = keys.group_by(keys.column_names).aggregate([]).num_rows
+    if partitions > config.PARTITION_MAX_COUNT:
+        logger.warning(f"⚠️  {partitions} partitions exceeds PARTITION_MAX_COUNT={config.PARTITION_MAX_COUNT}")
+        return False
+    if partitions and total_rows / partitions < config.PARTITION_MIN_ROWS:
+        logger.warning(
+            f"⚠️  {total_rows / partitions:,.0f} rows/partition is below "
+            f"PARTITION_MIN_ROWS={config.PARTITION_MIN_ROWS} (too many small files)"
+        )
+        return False
+    return True
+
+
+def _replace_dir(staged: Path, target: Path) -> None:
+    """Move a staged partition directory over target (the old one is removed)."""
+    old = target.with_name(f'.{target.name}.old')
+    shutil.rmtree(old, ignore_errors=True)
+    if target.exists():
+        target.rename(old)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    staged.rename(target)
+    shutil.rmtree(old, ignore_errors=True)
+
+
+def _remove(path: Path) -> None:
+    if path.is_dir():
+        shutil.rmtree(path)
+    else:
+        path.unlink()
+
+
+def _prune(directory: Path, relative: Path, keep: set[Path], ancestors: set[Path]) -> None:
+    """Remove everything under directory except the kept partition directories."""
+    for child in directory.iterdir():
+        child_relative = relative / child.name
+        if child_relative in keep:
+            continue
+        if child_relative in ancestors:
+            _prune(child, child_relative, keep, ancestors)
+        else:
+            _remove(child)
+
+
+def _publish(staging_dir: Path, output_dir: Path, written: list[str]) -> list[str]:
+    """
+    Swap every written partition directory into output_dir, then remove
+    partitions (and other-layout folders) the snapshot no longer has.
+    Returns the final file paths.
+    """
+    partition_dirs = {Path(path).parent.relative_to(staging_dir) for path in written}
+    for partition_dir in sorted(partition_dirs):
+        _replace_dir(staging_dir / partition_dir, output_dir / partition_dir)
+    if output_dir.exists():
+        ancestors = {parent for partition_dir in partition_dirs for parent in partition_dir.parents}
+        _prune(output_dir, Path('.'), partition_dirs, ancestors)
+    shutil.rmtree(staging_dir, ignore_errors=True)
+    return [str(output_dir / Path(path).relative_to(staging_dir)) for path in written]
+
+
+def remove_partition_dirs(output_dir: Path, spec: list[PartitionField]) -> None:
+    """Drop an entity's Hive partitions, after it fell back to the single-file layout."""
+    if output_dir.exists():
+        for child in output_dir.glob(f'{spec[0].name}=*'):
+            shutil.rmtree(child)
+
+
+def write_partitioned(
+    data: pa.Table | Iterable[pa.RecordBatch],
+    schema: pa.Schema,
+    output_dir: Path,
+    spec: list[PartitionField],
+    entity: str,
+    writer_kwargs: dict,
+    profile: WriterProfile
+) -> list[str]:
+    """
+    Write data (already carrying partition columns) as a Hive dataset.
+
+    Partitions being written replace any previous files in them, and
+    every other file under output_dir is removed (see _publish). Returns
+    the written file paths.
+    """
+    staging_dir = STAGING_ROOT / entity
+    shutil.rmtree(staging_dir, ignore_errors=True)  # leftovers of a crashed run
+    written = []
+    ds.write_dataset(
+        data,
+        staging_dir,
+        schema=schema,
+        format='parquet',
+        partitioning=ds.partitioning(partition_schema(schema, spec), flavor='hive'),
+        basename_template=f'{entity}-{{i}}.parquet',
+        file_options=ds.ParquetFileFormat().make_write_options(**writer_kwargs),
+        max_partitions=config.PARTITION_MAX_COUNT,
+        max_open_files=config.PARTITION_MAX_OPEN_FILES,
+        max_rows_per_file=config.PARTITION_MAX_ROWS_PER_FILE,
+        max_rows_per_group=profile.rows_per_group,
+        preserve_order=True,
+        file_visitor=lambda written_file: written.append(written_file.path),
+    )
+    written = _publish(staging_dir, Path(output_dir), written)
+    logger.info(f"🗂️  {entity}: {len(written)} file(s) across Hive partitions {[f.name for f in spec]}")
+    return written
@@ -0,0 +1,296 @@
+"""End-to-end pipeline orchestrator.
+
+Replaces running scripts 01 → 09 by hand. The pipeline is a DAG of
+tasks, one per (stage, entity) where the stage works entity by entity:
+
+    setup ──────────────┬──────────────┬─────────────────────┐
+    generate ─┬─► upload_raw:{e}       │                     lifecycle
+              └─► transform:{e} ─► upload_processed:{e} ─► catalog:{e}
+                         └──────────► analytics (rollups of the entities it reads)
+
+A task starts as soon as its own dependencies are done, so raw uploads
+overlap with Parquet conversion and a small entity can be queryable
+while a large one is still converting. A failed task skips only its
+dependents.
+
+Finished tasks are checkpointed to PIPELINE_CHECKPOINT_PATH; a resumed
+run (same run date) only runs what is left. Every task is timed and a
+per-stage summary is logged at the end.
+"""
+import asyncio
+import json
+import logging
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Optional
+
+from . import config, metrics
+from .analytics import ROLLUP_SOURCES, materialise_all, publish
+from .catalog import register_uploads
+from .compaction import compact_local, delete_superseded
+from .parquet_transformer import transform_entity
+from .aws_async import setup_data_lake_structure
+from .s3_client import create_bucket, setup_lifecycle_policies, upload_files
+from .schemas import SCHEMAS
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+PROCESSED_PREFIX = f'{config.S3_PROCESSED_PREFIX}finanzas/'
+
+
+@dataclass
+class Task:
+    """One node of the pipeline DAG. fn returns False (or raises) on failure."""
+    name: str
+    fn: Callable[[], bool]
+    deps: list[str] = field(default_factory=list)
+
+    @property
+    def stage(self) -> str:
+        return self.name.split(':', 1)[0]
+
+
+@dataclass
+class TaskRun:
+    """Outcome of a task: done | failed | skipped (a dependency failed)."""
+    status: str
+    seconds: float = 0.0
+    error: Optional[str] = None
+
+
+# ========================================
+# Stage implementations
+# ========================================
+
+def _setup(bucket_name: str) -> bool:
+    """Bucket and folder structure (script 01)."""
+    if not create_bucket(bucket_name, config.AWS_REGION):
+        return False
+    return asyncio.run(setup_data_lake_structure(bucket_name))
+
+
+def _generate() -> bool:
+    """Generate raw CSVs unless they already exist (script 02)."""
+    if any(config.RAW_DATA_DIR.glob('finanzas_*.csv')):
+        logger.info("⏭️  Raw CSVs already present, skipping generation")
+        return True
+    from .data_generator import generate_all_data  # Faker etc. only needed here
+
+    generate_all_data(config.RAW_DATA_DIR, fmt='csv')
+    return True
+
+
+def _upload_raw(bucket_name: str, entity: str, run_date: str) -> bool:
+    """Upload one raw CSV under raw/finanzas/{entity}/date=... (script 03)."""
+    csv_file = config.RAW_DATA_DIR / f'finanzas_{entity}.csv'
+    summary = upload_files(bucket_name, [(csv_file, f'raw/finanzas/{entity}/date={run_date}/{csv_file.name}')])
+    return summary.failed == 0
+
+
+def processed_files(entity: str, run_date: str) -> list[tuple[Path, str]]:
+    """
+    (local_path, s3_key) pairs of an entity's output for a run.
+
+    That is the run's date= folder, or the Hive data partitions when the
+    entity is partitioned on its own columns; older run folders are left out.
+    """
+    root = config.PROCESSED_DATA_DIR / 'finanzas'
+    files = []
+    for path in sorted((root / entity).rglob('*.parquet')):
+        relative = path.relative_to(root / entity)
+        if relative.parts[0].startswith(('.', '_')):
+            continue
+        if relative.parts[0].startswith('date=') and relative.parts[0] != f'date={run_date}':
+            continue
+        files.append((path, f'{PROCESSED_PREFIX}{path.relative_to(root).as_posix()}'))
+    return files
+
+
+def _upload_processed(bucket_name: str, entity: str, run_date: str) -> bool:
+    """Compact and upload an entity's Parquet output (script 07, upload part)."""
+    compact_local(config.PROCESSED_DATA_DIR / 'finanzas', entity)
+    files = processed_files(entity, run_date)
+    if not files or upload_files(bucket_name, files).failed:
+        return False
+    delete_superseded(bucket_name, files)
+    return True
+
+
+def _catalog(bucket_name: str, entity: str, run_date: str) -> bool:
+    """Register the entity's table and partitions in Glue (no crawler)."""
+    return register_uploads(processed_files(entity, run_date), bucket_name)
+
+
+def _analytics(bucket_name: str, rollups: list[str]) -> bool:
+    """Refresh the changed months of the analytics/reports/ rollups."""
+    return publish(materialise_all(rollups), bucket_name)
+
+
+# ========================================
+# DAG
+# ========================================
+
+def _analytics_task(bucket_name: str, entities: list[str]) -> Optional[Task]:
+    """Rollups whose sources are all part of this run, after their transforms."""
+    rollups = [name for name, sources in ROLLUP_SOURCES.items() if set(sources) <= set(entities)]
+    if not rollups:
+        return None
+    sources = sorted({entity for name in rollups for entity in ROLLUP_SOURCES[name]})
+    return Task('analytics', lambda: _analytics(bucket_name, rollups), ['setup'] + [f'transform:{e}' for e in sources])
+
+
+def build_tasks(
+    bucket_name: str = config.S3_BUCKET_NAME,
+    entities: Optional[list[str]] = None,
+    run_date: Optional[str] = None
+) -> list[Task]:
+    """Build the task graph for a run."""
+    run_date = run_date or datetime.now().strftime('%Y-%m-%d')
+    tasks = [
+        Task('setup', lambda: _setup(bucket_name)),
+        Task('generate', _generate),
+        Task('lifecycle', lambda: setup_lifecycle_policies(bucket_name), ['setup']),
+    ]
+    entities = entities or list(SCHEMAS)
+    for entity in entities:
+        tasks += [
+            Task(f'upload_raw:{entity}', lambda e=entity: _upload_raw(bucket_name, e, run_date), ['setup', 'generate']),
+            Task(f'transform:{entity}', lambda e=entity: bool(transform_entity(e, run_date)), ['generate']),
+            Task(f'upload_processed:{entity}', lambda e=entity: _upload_processed(bucket_name, e, run_date),
+                 ['setup', f'transform:{entity}']),
+        ]
+        if config.GLUE_REGISTER_TABLES:
+            tasks.append(Task(f'catalog:{entity}', lambda e=entity: _catalog(bucket_name, e, run_date),
+                              [f'upload_processed:{entity}']))
+    analytics = _analytics_task(bucket_name, entities)
+    return tasks + [analytics] if analytics else tasks
+
+
+# ========================================
+# Checkpoints
+# ========================================
+
+def load_checkpoint(run_date: str, path: Path = config.PIPELINE_CHECKPOINT_PATH) -> dict[str, dict]:
+    """Task states of an earlier attempt at the same run date ({} otherwise)."""
+    try:
+        checkpoint = json.loads(path.read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    return checkpoint['tasks'] if checkpoint.get('run_date') == run_date else {}
+
+
+def save_checkpoint(run_date: str, runs: dict[str, TaskRun], path: Path = config.PIPELINE_CHECKPOINT_PATH) -> None:
+    """Atomically write task states."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix('.tmp')
+    tasks = {name: vars(run) for name, run in runs.items()}
+    tmp_path.write_text(json.dumps({'run_date': run_date, 'tasks': tasks}, indent=2, sort_keys=True))
+    os.replace(tmp_path, path)
+
+
+# ========================================
+# Scheduler
+# ========================================
+
+def _run_task(task: Task) -> TaskRun:
+    """Run and time a task, turning exceptions into a failed TaskRun."""
+    start = time.perf_counter()
+    try:
+        ok = task.fn()
+        error = None if ok else 'task returned False'
+    except Exception as e:  # noqa: BLE001 - one task must not bring the run down
+        ok, error = False, f'{type(e).__name__}: {e}'
+    run = TaskRun('done' if ok else 'failed', time.perf_counter() - start, error)
+    metrics.observe('pipeline_task_seconds', run.seconds, stage=task.stage)
+    metrics.inc('pipeline_tasks_total', stage=task.stage, status=run.status)
+    icon = '✅' if ok else '❌'
+    logger.info(f"{icon} {task.name} ({run.seconds:.1f}s){f': {error}' if error else ''}")
+    return run
+
+
+def _skip_blocked(tasks: dict[str, Task], runs: dict[str, TaskRun]) -> None:
+    """Mark tasks whose dependencies failed or were skipped as skipped."""
+    changed = True
+    while changed:
+        changed = False
+        for name, task in tasks.items():
+            if name not in runs and any(runs.get(dep, TaskRun('')).status in ('failed', 'skipped') for dep in task.deps):
+                runs[name] = TaskRun('skipped', error=f'blocked by {task.deps}')
+                changed = True
+
+
+def _ready(tasks: dict[str, Task], runs: dict[str, TaskRun], running: set[str]) -> list[Task]:
+    """Tasks not yet run whose dependencies are all done."""
+    return [
+        task for name, task in tasks.items()
+        if name not in runs and name not in running
+        and all(runs.get(dep, TaskRun('')).status == 'done' for dep in task.deps)
+    ]
+
+
+def run_tasks(
+    tasks: list[Task],
+    run_date: str,
+    max_workers: int = config.PIPELINE_WORKERS,
+    resume: bool = False
+) -> dict[str, TaskRun]:
+    """
+    Execute the DAG on a thread pool, checkpointing after every task.
+
+    With resume, tasks already done in the checkpoint for run_date are
+    not run again.
+    """
+    by_name = {task.name: task for task in tasks}
+    previous = load_checkpoint(run_date) if resume else {}
+    runs = {name: TaskRun(**state) for name, state in previous.items() if state['status'] == 'done' and name in by_name}
+    if runs:
+        logger.info(f"⏩ Resuming: {len(runs)} tasks already done")
+
+    futures: dict[Future, str] = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        while True:
+            _skip_blocked(by_name, runs)
+            for task in _ready(by_name, runs, set(futures.values())):
+                futures[pool.submit(_run_task, task)] = task.name
+            if not futures:
+                break
+            finished, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in finished:
+                runs[futures.pop(future)] = future.result()
+            save_checkpoint(run_date, runs)
+    return runs
+
+
+def _log_timings(tasks: list[Task], runs: dict[str, TaskRun], wall_seconds: float) -> None:
+    """Per-stage task counts and summed task time."""
+    stages: dict[str, list[TaskRun]] = {}
+    for task in tasks:
+        stages.setdefault(task.stage, []).append(runs[task.name])
+
+    logger.info(f"\n⏱️  Pipeline finished in {wall_seconds:.1f}s")
+    for stage, stage_runs in stages.items():
+        done = sum(1 for run in stage_runs if run.status == 'done')
+        busy = sum(run.seconds for run in stage_runs)
+        logger.info(f"  {stage:<18} {done}/{len(stage_runs)} done, {busy:7.1f}s task time")
+
+
+def run_pipeline(
+    bucket_name: str = config.S3_BUCKET_NAME,
+    entities: Optional[list[str]] = None,
+    max_workers: int = config.PIPELINE_WORKERS,
+    resume: bool = False
+) -> bool:
+    """Run the whole pipeline; True if every task succeeded."""
+    run_date = datetime.now().strftime('%Y-%m-%d')
+    tasks = build_tasks(bucket_name, entities, run_date)
+
+    start = time.perf_counter()
+    runs = run_tasks(tasks, run_date, max_workers, resume)
+    metrics.observe('pipeline_run_seconds', time.perf_counter() - start)
+    _log_timings(tasks, runs, time.perf_counter() - start)
+    return all(run.status == 'done' for run in runs.values())
@@ -0,0 +1,301 @@
+"""Local query engine over the processed zone.
+
+Reads processed/finanzas/{entity}/ with pyarrow.dataset, locally
+(config.PROCESSED_DATA_DIR) or straight from S3 (`s3://bucket/prefix`,
+byte-range reads), so the reference queries in sql/ answer in
+milliseconds without Athena:
+- Projection: only the requested columns are read
+- Predicate pushdown: filters skip row groups by their min/max
+  statistics. Arrow only prunes Hive partitions (year=/month=) on
+  predicates over the partition fields themselves, so date_range_filter()
+  restates a date range on the partitions derived from that column.
+- Aggregations run vectorised on Arrow tables
+
+Run-date snapshots (date=YYYY-MM-DD/) each hold a full copy of an
+entity, so only the latest snapshot is read. Data-column partitions
+(year=/month=) are read together. If both layouts are present (e.g. a
+prefix the writer never cleaned up), the one written last wins.
+
+estimate_scan() applies the same pruning without reading data, to
+pre-check how many bytes an Athena query would scan.
+"""
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Optional
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.fs as pafs
+
+from . import config
+from .partitioning import PARTITION_SPECS, PartitionField
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_ROOT = config.PROCESSED_DATA_DIR / 'finanzas'
+ATHENA_MIN_BYTES = 10 * 1024 * 1024  # Athena bills at least 10 MB per query
+
+
+@dataclass
+class ScanEstimate:
+    """Data a query would touch after partition and row-group pruning."""
+    files_total: int = 0
+    files_scanned: int = 0
+    row_groups_total: int = 0
+    row_groups_scanned: int = 0
+    bytes_total: int = 0
+    bytes_scanned: int = 0
+
+    @property
+    def athena_cost(self) -> float:
+        """Estimated Athena cost in USD (per-TB pricing, 10 MB minimum)."""
+        billed = max(self.bytes_scanned, ATHENA_MIN_BYTES)
+        return billed / 1024 ** 4 * config.ATHENA_COST_PER_TB
+
+
+def _resolve(root: Path | str) -> tuple[pafs.FileSystem, str]:
+    """Filesystem and base path for a local directory or s3:// URI."""
+    if isinstance(root, str) and root.startswith('s3://'):
+        return pafs.FileSystem.from_uri(root.rstrip('/'))
+    return pafs.LocalFileSystem(), str(Path(root).resolve())
+
+
+def _is_visible(path: str) -> bool:
+    """Skip hidden/staging files (_compacting-*, .part files, _SUCCESS)."""
+    return path.endswith('.parquet') and not any(part.startswith(('_', '.')) for part in path.split('/'))
+
+
+def list_entity_files(filesystem: pafs.FileSystem, entity_dir: str) -> list[str]:
+    """Data files of an entity: its latest run-date snapshot, or all Hive partitions, whichever is newer."""
+    infos = filesystem.get_file_info(pafs.FileSelector(entity_dir, recursive=True, allow_not_found=True))
+    files = {info.path: info.mtime for info in infos if info.is_file and _is_visible(info.path)}
+
+    def snapshot(path: str) -> Optional[str]:
+        first = path[len(entity_dir):].lstrip('/').split('/', 1)[0]
+        return first if first.startswith('date=') else None
+
+    partitioned = [path for path in files if snapshot(path) is None]
+    latest = max((snapshot(path) for path in files if snapshot(path)), default=None)
+    snapshot_files = [path for path in files if latest and snapshot(path) == latest]
+    if not (partitioned and snapshot_files):
+        return partitioned or snapshot_files
+
+    newest = max(snapshot_files + partitioned, key=files.get)
+    logger.warning(f"⚠️  {entity_dir} holds both Hive partitions and {latest}/; reading the newer layout")
+    return snapshot_files if newest in snapshot_files else partitioned
+
+
+def open_dataset(entity: str, root: Path | str = DEFAULT_ROOT) -> ds.Dataset:
+    """Open an entity as a (possibly Hive-partitioned) Parquet dataset."""
+    filesystem, base = _resolve(root)
+    entity_dir = f'{base}/{entity}'
+    files = list_entity_files(filesystem, entity_dir)
+    if not files:
+        raise FileNotFoundError(f"No Parquet files for '{entity}' under {root}")
+    return ds.dataset(
+        files,
+        filesystem=filesystem,
+        format='parquet',
+        partitioning=ds.HivePartitioning.discover(infer_dictionary=False),
+        partition_base_dir=entity_dir,
+    )
+
+
+def scan(
+    entity: str,
+    columns: Optional[list[str]] = None,
+    filter: Optional[pc.Expression] = None,
+    root: Path | str = DEFAULT_ROOT
+) -> pa.Table:
+    """Read selected columns of rows matching filter (pushed down to the scan)."""
+    return open_dataset(entity, root).to_table(columns=columns, filter=filter)
+
+
+def aggregate(
+    entity: str,
+    group_by: list[str],
+    aggregations: list[tuple[str, str]],
+    filter: Optional[pc.Expression] = None,
+    root: Path | str = DEFAULT_ROOT
+) -> pa.Table:
+    """
+    GROUP BY group_by with (column, function) aggregations.
+
+    Only the grouped and aggregated columns are read. Results are named
+    `{column}_{function}`, as in pyarrow's Table.group_by.
+    """
+    columns = list(dict.fromkeys(group_by + [column for column, _ in aggregations]))
+    # Dictionary columns get one dictionary per row group; group_by needs a shared one
+    table = scan(entity, columns, filter, root).unify_dictionaries()
+    return table.group_by(group_by).aggregate(aggregations)
+
+
+def _fragment_columns_bytes(fragment: ds.ParquetFileFragment, columns: Optional[list[str]]) -> tuple[int, int]:
+    """(all bytes, projected bytes) of a fragment's selected row groups."""
+    total = projected = 0
+    metadata = fragment.metadata
+    for row_group in fragment.row_groups:
+        group = metadata.row_group(row_group.id)
+        for i in range(group.num_columns):
+            chunk = group.column(i)
+            total += chunk.total_compressed_size
+            if columns is None or chunk.path_in_schema.split('.')[0] in columns:
+                projected += chunk.total_compressed_size
+    return total, projected
+
+
+def estimate_scan(
+    entity: str,
+    columns: Optional[list[str]] = None,
+    filter: Optional[pc.Expression] = None,
+    root: Path | str = DEFAULT_ROOT
+) -> ScanEstimate:
+    """
+    Estimate bytes scanned by a projection + filter without reading data.
+
+    Partition pruning drops whole files, row-group statistics drop row
+    groups, projection drops column chunks (Parquet footers only).
+    """
+    dataset = open_dataset(entity, root)
+    estimate = ScanEstimate()
+    kept = {fragment.path for fragment in dataset.get_fragments(filter=filter)}
+
+    for fragment in dataset.get_fragments():
+        total_groups = fragment.num_row_groups
+        estimate.files_total += 1
+        estimate.row_groups_total += total_groups
+        estimate.bytes_total += _fragment_columns_bytes(fragment, None)[0]
+        if fragment.path not in kept:
+            continue
+        selected = fragment.subset(filter, schema=dataset.schema) if filter is not None else fragment
+        estimate.files_scanned += 1 if selected.num_row_groups else 0
+        estimate.row_groups_scanned += selected.num_row_groups
+        estimate.bytes_scanned += _fragment_columns_bytes(selected, columns)[1]
+    return estimate
+
+
+def _date_scalar(dataset: ds.Dataset, column: str, value: datetime) -> pa.Scalar | str:
+    """value as the column's type (date/timestamp, or ISO text for string columns)."""
+    column_type = dataset.schema.field(column).type
+    if pa.types.is_timestamp(column_type) or pa.types.is_date(column_type):
+        return pa.scalar(value).cast(column_type)
+    return value.strftime('%Y-%m-%d')
+
+
+def _partition_bound(fields: list[PartitionField], value: datetime, op: str) -> pc.Expression:
+    """Lexicographic (year, month, ...) op= value's parts; op is '>' or '<'."""
+    parts = [(ds.field(field.name), getattr(value, field.transform)) for field in fields]
+    field, part = parts[-1]
+    expression = field >= part if op == '>' else field <= part
+    for field, part in reversed(parts[:-1]):
+        beyond = field > part if op == '>' else field < part
+        expression = beyond | ((field == part) & expression)
+    return expression
+
+
+def date_range_filter(
+    entity: str,
+    dataset: ds.Dataset,
+    column: str,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None
+) -> pc.Expression:
+    """
+    start <= column < end, also stated on the year=/month= partitions of column.
+
+    The partition terms let get_fragments() drop whole partitions; the
+    column terms keep the result exact within the boundary partitions.
+    """
+    fields = [
+        field for field in PARTITION_SPECS.get(entity, [])
+        if field.source == column and field.transform != 'identity' and field.name in dataset.schema.names
+    ]
+    expression = pc.scalar(True)
+    if start is not None:
+        expression &= ds.field(column) >= _date_scalar(dataset, column, start)
+        expression &= _partition_bound(fields, start, '>') if fields else pc.scalar(True)
+    if end is not None:
+        expression &= ds.field(column) < _date_scalar(dataset, column, end)
+        expression &= _partition_bound(fields, end, '<') if fields else pc.scalar(True)
+    return expression
+
+
+# ========================================
+# Reference queries (sql/01_athena_queries.sql, sql/02_parquet_comparison.sql)
+# ========================================
+
+def count_customers(root: Path | str = DEFAULT_ROOT) -> pa.Table:
+    """SELECT COUNT(*) FROM parquet_customers."""
+    return pa.table({'total_customers': [open_dataset('customers', root).count_rows()]})
+
+
+def customers_by_city(root: Path | str = DEFAULT_ROOT) -> pa.Table:
+    """Customers per city, most first."""
+    table = aggregate('customers', ['city'], [('customer_id', 'count')], root=root)
+    table = table.rename_columns(['customer_count' if name == 'customer_id_count' else name for name in table.column_names])
+    return table.sort_by([('customer_count', 'descending')])
+
+
+def customer_emails(root: Path | str = DEFAULT_ROOT) -> pa.Table:
+    """SELECT customer_id, email LIMIT 10 (projection)."""
+    return open_dataset('customers', root).head(10, columns=['customer_id', 'email'])
+
+
+def top_customers_by_balance(root: Path | str = DEFAULT_ROOT) -> pa.Table:
+    """Top 10 customers by total account balance."""
+    balances = aggregate('accounts', ['customer_id'], [('balance', 'sum')], root=root)
+    customers = scan('customers', ['customer_id', 'first_name', 'last_name'], root=root)
+    joined = customers.join(balances, 'customer_id', join_type='inner')
+    # binary_join_element_wise has no large_string kernel with a str separator
+    full_name = pc.binary_join_element_wise(
+        joined['first_name'].cast(pa.string()), joined['last_name'].cast(pa.string()), ' '
+    )
+    result = pa.table({
+        'customer_id': joined['customer_id'],
+        'full_name': full_name,
+        'total_balance': joined['balance_sum'],
+    })
+    return result.sort_by([('total_balance', 'descending')]).slice(0, 10)
+
+
+def credit_score_distribution(root: Path | str = DEFAULT_ROOT) -> pa.Table:
+    """Customers per credit score band."""
+    scores = scan('customers', ['credit_score'], root=root)['credit_score']
+    category = pc.case_when(
+        pc.make_struct(pc.greater_equal(scores, 750), pc.greater_equal(scores, 650), pc.greater_equal(scores, 550)),
+        'Excellent', 'Good', 'Fair', 'Poor'
+    )
+    table = pa.table({'score_category': category}).group_by('score_category').aggregate([([], 'count_all')])
+    return table.rename_columns(['score_category', 'customer_count']).sort_by([('customer_count', 'descending')])
+
+
+def active_loans_by_type(root: Path | str = DEFAULT_ROOT) -> pa.Table:
+    """Active loans per type: count and total principal."""
+    table = aggregate(
+        'loans', ['loan_type'], [('loan_id', 'count'), ('principal_amount', 'sum')],
+        filter=ds.field('status') == 'active', root=root
+    )
+    table = table.rename_columns(['loan_type', 'num_loans', 'total_amount'])
+    return table.sort_by([('total_amount', 'descending')])
+
+
+def transactions_since_2024(root: Path | str = DEFAULT_ROOT) -> pa.Table:
+    """COUNT(*) of transactions from 2024-01-01 (partition/row-group pruned)."""
+    dataset = open_dataset('transactions', root)
+    since = date_range_filter('transactions', dataset, 'transaction_date', start=datetime(2024, 1, 1))
+    return pa.table({'transactions_2024': [dataset.count_rows(filter=since)]})
+
+
+REFERENCE_QUERIES: dict[str, Callable[..., pa.Table]] = {
+    'count_customers': count_customers,
+    'customers_by_city': customers_by_city,
+    'customer_emails': customer_emails,
+    'top_customers_by_balance': top_customers_by_balance,
+    'credit_score_distribution': credit_score_distribution,
+    'active_loans_by_type': active_loans_by_type,
+    'transactions_since_2024': transactions_since_2024,
+}
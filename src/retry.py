@@ -0,0 +1,189 @@
+"""Shared retry policy for AWS calls.
+
+Three layers, from the wire up:
+- Every client is built with botocore's adaptive retry mode
+  (client_config()). Throttled requests are retried AWS_MAX_ATTEMPTS
+  times, and a client-side token bucket slows the shared client down to
+  the rate the service accepts.
+- call() retries a whole operation (e.g. a multipart upload, or a
+  partition batch) once botocore gives up. It uses full-jitter backoff,
+  so workers that were throttled together do not come back in lockstep.
+- Each operation draws its retries from its own RetryBudget. Successes
+  refill it slowly, so a transient burst is absorbed while a service
+  that keeps failing stops being retried at all.
+
+Throttles are counted as aws_throttles_total{service, operation, code} from a
+botocore hook, including those botocore retried on its own. Operation-
+level retries are counted as aws_retries_total.
+"""
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional, TypeVar
+
+from botocore.exceptions import ClientError
+
+from . import config, metrics
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+THROTTLING_CODES = {
+    'SlowDown', 'Throttling', 'ThrottlingException', 'ThrottledException', 'RequestLimitExceeded',
+    'TooManyRequestsException', 'ProvisionedThroughputExceededException', 'RequestThrottled',
+}
+TRANSIENT_CODES = {'RequestTimeout', 'RequestTimeoutException', 'InternalError', 'InternalFailure',
+                   'InternalServiceException', 'ServiceUnavailable'}
+BACKOFF_BASE = 0.1  # seconds
+BACKOFF_CAP = 20.0  # seconds
+
+
+@dataclass
+class RetryBudget:
+    """Token bucket of retries: a retry spends one token, a success refunds `refill`."""
+    capacity: float
+    refill: float = 0.0
+    tokens: float = field(init=False)
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def __post_init__(self) -> None:
+        self.tokens = self.capacity
+
+    def spend(self) -> bool:
+        with self.lock:
+            if self.tokens < 1:
+                return False
+            self.tokens -= 1
+            return True
+
+    def refund(self) -> None:
+        with self.lock:
+            self.tokens = min(self.capacity, self.tokens + self.refill)
+
+    def give_back(self) -> None:
+        """Return a token spent on a retry that did not happen."""
+        with self.lock:
+            self.tokens = min(self.capacity, self.tokens + 1)
+
+
+_budgets: dict[str, RetryBudget] = {}
+_budgets_lock = threading.Lock()
+
+
+def budget(operation: str) -> RetryBudget:
+    """The process-wide retry budget of an operation."""
+    with _budgets_lock:
+        if operation not in _budgets:
+            _budgets[operation] = RetryBudget(config.AWS_RETRY_BUDGET, config.AWS_RETRY_BUDGET_REFILL)
+        return _budgets[operation]
+
+
+def client_config() -> dict:
+    """botocore Config kwargs: adaptive mode (retries plus client-side rate limiting)."""
+    return {'retries': {'mode': config.AWS_RETRY_MODE, 'total_max_attempts': config.AWS_MAX_ATTEMPTS}}
+
+
+# ========================================
+# Classification
+# ========================================
+
+def client_error(error: BaseException) -> Optional[ClientError]:
+    """The ClientError behind error (boto3 transfers wrap it, e.g. S3UploadFailedError)."""
+    if isinstance(error, ClientError):
+        return error
+    cause = error.__cause__ or error.__context__
+    return cause if isinstance(cause, ClientError) else None
+
+
+def error_code(error: ClientError) -> str:
+    return error.response.get('Error', {}).get('Code', '')
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Throttling, transient and 5xx errors are worth retrying."""
+    cause = client_error(error)
+    if cause is None:
+        return False
+    status = cause.response.get('ResponseMetadata', {}).get('HTTPStatusCode', 0)
+    return error_code(cause) in THROTTLING_CODES | TRANSIENT_CODES or status >= 500
+
+
+def backoff_delay(attempt: int) -> float:
+    """Full jitter: uniform in [0, min(cap, base * 2^attempt)]."""
+    return random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt))
+
+
+# ========================================
+# Throttle metrics
+# ========================================
+
+def _count_throttle(response: Optional[tuple], operation: Any, **kwargs) -> None:
+    """botocore needs-retry hook: count throttled responses (never decides retries)."""
+    if response is None:
+        return
+    code = response[1].get('Error', {}).get('Code', '')
+    if code in THROTTLING_CODES:
+        metrics.inc(
+            'aws_throttles_total', service=operation.service_model.service_name, operation=operation.name, code=code
+        )
+
+
+def instrument(client: Any) -> Any:
+    """Register the throttle counter on a client's events."""
+    client.meta.events.register('needs-retry', _count_throttle, unique_id='datalake-throttle-metrics')
+    return client
+
+
+# ========================================
+# Operation-level retries
+# ========================================
+
+def _spend_all(budgets: list[RetryBudget]) -> bool:
+    """Take one token from every budget, or from none of them."""
+    for i, retry_budget in enumerate(budgets):
+        if not retry_budget.spend():
+            for spent in budgets[:i]:
+                spent.give_back()
+            return False
+    return True
+
+
+def should_retry(
+    operation: str,
+    error: BaseException,
+    attempt: int,
+    max_attempts: int,
+    *budgets: RetryBudget
+) -> bool:
+    """
+    Retry if the error is retryable, attempts remain and the operation's
+    budget (plus any extra budgets, e.g. a batch's) has a token.
+
+    Tokens are only taken when the retry is going to happen.
+    """
+    if not is_retryable(error) or attempt + 1 >= max_attempts:
+        return False
+    if not _spend_all([budget(operation), *budgets]):
+        return False
+    metrics.inc('aws_retries_total', operation=operation, code=error_code(client_error(error)))
+    logger.warning(f"🔁 {operation}: {error_code(client_error(error))}, retry {attempt + 1}/{max_attempts - 1}")
+    return True
+
+
+def call(operation: str, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run fn(*args, **kwargs), retrying with full-jitter backoff while the budget lasts."""
+    attempts = config.AWS_OPERATION_ATTEMPTS
+    for attempt in range(attempts):
+        try:
+            result = fn(*args, **kwargs)
+        except Exception as e:
+            if not should_retry(operation, e, attempt, attempts):
+                raise
+            time.sleep(backoff_delay(attempt))
+            continue
+        budget(operation).refund()
+        return result
@@ -7,26 +7,80 @@ Principles applied:
 - Logging over print
 """
 import logging
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, NamedTuple, Optional
 
-import boto3
-from botocore.exceptions import ClientError
+from botocore.exceptions import BotoCoreError, ClientError
 
-from . import config
+from . import checksums, config, metrics, retry
+from .aws_clients import get_client
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
 def _get_s3_client():
-    """Create configured S3 client."""
-    return boto3.client(
-        's3',
-        aws_access_key_id=config.AWS_ACCESS_KEY_ID,
-        aws_secret_access_key=config.AWS_SECRET_ACCESS_KEY,
-        region_name=config.AWS_REGION
-    )
+    """Get shared S3 client."""
+    return get_client('s3')
+
+
+def _get_pooled_s3_client(max_pool_connections: int):
+    """Shared S3 client with a connection pool sized for concurrent transfers.
+
+    boto3 clients are thread-safe, so one instance serves every worker thread.
+    """
+    return get_client('s3', max_pool_connections=max_pool_connections)
+
+
+class ObjectInfo(NamedTuple):
+    """Compact listing record for one S3 object."""
+    key: str
+    size: int
+    etag: str
+    last_modified: datetime
+
+
+@dataclass
+class TransferResult:
+    """Outcome of a single file transfer."""
+    local_path: Path
+    s3_key: str
+    success: bool
+    bytes: int = 0
+    seconds: float = 0.0
+    error: Optional[str] = None
+    skipped: bool = False  # already up to date, nothing transferred
+    etag: Optional[str] = None  # of the object now at s3_key (uploads only)
+
+
+@dataclass
+class TransferSummary:
+    """Aggregated outcome of a batch transfer."""
+    results: list[TransferResult] = field(default_factory=list)
+    seconds: float = 0.0
+
+    @property
+    def succeeded(self) -> int:
+        return sum(1 for r in self.results if r.success)
+
+    @property
+    def failed(self) -> int:
+        return len(self.results) - self.succeeded
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(r.bytes for r in self.results if r.success)
+
+    @property
+    def throughput_mbps(self) -> float:
+        """Aggregate throughput in MB/s over the batch wall-clock time."""
+        return self.total_bytes / 1024 / 1024 / self.seconds if self.seconds > 0 else 0.0
 
 
 def bucket_exists(bucket_name: str) -> bool:
@@ -68,6 +122,20 @@ def create_folder(bucket_name: str, folder_path: str) -> None:
     logger.info(f"📁 s3://{bucket_name}/{folder_path}")
 
 
+DATA_LAKE_ENTITIES = ['customers', 'accounts', 'transactions', 'cards', 'loans',
+                      'loan_payments', 'transfers', 'investments', 'exchange_rates',
+                      'branches', 'bank_employees', 'account_types']
+
+DATA_LAKE_FOLDERS = [
+    *[f'raw/finanzas/{entity}/' for entity in DATA_LAKE_ENTITIES],
+    *[f'processed/finanzas/{entity}/' for entity in DATA_LAKE_ENTITIES],
+    'analytics/reports/daily_transactions/',
+    'analytics/reports/customer_metrics/',
+    'analytics/reports/loan_analysis/',
+    'athena-results/',
+]
+
+
 def setup_data_lake_structure(bucket_name: str) -> None:
     """
     Create Data Lake folder structure for finance domain.
@@ -75,34 +143,71 @@ def setup_data_lake_structure(bucket_name: str) -> None:
     Structure:
         raw/finanzas/{customers,accounts,transactions,...}/
         processed/finanzas/{customers,accounts,transactions,...}/
-        analytics/reports/{daily_transactions,customer_metrics}/
+        analytics/reports/{daily_transactions,customer_metrics,loan_analysis}/
         athena-results/
+
+    One call per folder; aws_async.setup_data_lake_structure issues
+    them concurrently.
     """
-    entities = ['customers', 'accounts', 'transactions', 'cards', 'loans',
-                'loan_payments', 'transfers', 'investments', 'exchange_rates',
-                'branches', 'bank_employees', 'account_types']
+    for folder in DATA_LAKE_FOLDERS:
+        create_folder(bucket_name, folder)
 
-    folders = [
-        *[f'raw/finanzas/{entity}/' for entity in entities],
-        *[f'processed/finanzas/{entity}/' for entity in entities],
-        'analytics/reports/daily_transactions/',
-        'analytics/reports/customer_metrics/',
-        'analytics/reports/loan_analysis/',
-        'athena-results/',
-    ]
 
-    for folder in folders:
-        create_folder(bucket_name, folder)
+LIFECYCLE_RULES = [
+    {
+        'ID': 'Archive-old-raw-data',
+        'Status': 'Enabled',
+        'Filter': {'Prefix': 'raw/'},
+        'Transitions': [{'Days': 30, 'StorageClass': 'GLACIER'}]
+    },
+    {
+        'ID': 'Delete-temp-athena-results',
+        'Status': 'Enabled',
+        'Filter': {'Prefix': 'athena-results/'},
+        'Expiration': {'Days': 7}
+    },
+    {
+        'ID': 'Archive-old-processed-data',
+        'Status': 'Enabled',
+        'Filter': {'Prefix': 'processed/'},
+        'Transitions': [{'Days': 90, 'StorageClass': 'GLACIER'}]
+    },
+]
+
+
+def setup_lifecycle_policies(bucket_name: str) -> bool:
+    """
+    Configure S3 lifecycle policies for cost optimization.
+
+    - raw/ → Glacier after 30 days
+    - processed/ → Glacier after 90 days
+    - athena-results/ → deleted after 7 days
+    """
+    s3 = _get_s3_client()
+    try:
+        s3.put_bucket_lifecycle_configuration(
+            Bucket=bucket_name,
+            LifecycleConfiguration={'Rules': LIFECYCLE_RULES}
+        )
+        logger.info(f"✅ Lifecycle policies configured for {bucket_name}")
+        return True
+    except ClientError as e:
+        logger.error(f"❌ Failed to set lifecycle policies: {e}")
+        return False
 
 
 def upload_file(bucket_name: str, local_path: Path, s3_key: str) -> bool:
     """Upload file to S3."""
     s3 = _get_s3_client()
     try:
-        s3.upload_file(str(local_path), bucket_name, s3_key)
+        with metrics.timer('s3_upload_seconds'):
+            s3.upload_file(str(local_path), bucket_name, s3_key)
+        metrics.inc('s3_upload_bytes_total', local_path.stat().st_size)
+        metrics.inc('s3_upload_files_total', status='ok')
         logger.info(f"✅ {local_path.name} → s3://{bucket_name}/{s3_key}")
         return True
     except ClientError as e:
+        metrics.inc('s3_upload_files_total', status='failed')
         logger.error(f"❌ Upload failed: {e}")
         return False
 
@@ -112,7 +217,9 @@ def download_file(bucket_name: str, s3_key: str, local_path: Path) -> bool:
     s3 = _get_s3_client()
     try:
         local_path.parent.mkdir(parents=True, exist_ok=True)
-        s3.download_file(bucket_name, s3_key, str(local_path))
+        with metrics.timer('s3_download_seconds'):
+            s3.download_file(bucket_name, s3_key, str(local_path))
+        metrics.inc('s3_download_bytes_total', local_path.stat().st_size)
         logger.info(f"✅ s3://{bucket_name}/{s3_key} → {local_path}")
         return True
     except ClientError as e:
@@ -120,14 +227,262 @@ def download_file(bucket_name: str, s3_key: str, local_path: Path) -> bool:
         return False
 
 
-def list_objects(bucket_name: str, prefix: str = '') -> list[str]:
-    """List object keys in S3 bucket with prefix."""
+def copy_object(bucket_name: str, source_key: str, dest_key: str) -> bool:
+    """Server-side copy within the bucket (no data passes through the client)."""
     s3 = _get_s3_client()
     try:
-        response = s3.list_objects_v2(Bucket=bucket_name, Prefix=prefix)
-        keys = [obj['Key'] for obj in response.get('Contents', [])]
-        logger.info(f"📋 Found {len(keys)} objects with prefix '{prefix}'")
-        return keys
+        s3.copy({'Bucket': bucket_name, 'Key': source_key}, bucket_name, dest_key)
+        return True
+    except ClientError as e:
+        logger.error(f"❌ Copy failed: {source_key} → {dest_key}: {e}")
+        return False
+
+
+def delete_objects(bucket_name: str, keys: list[str]) -> int:
+    """
+    Delete keys in batches of 1,000 (one request per batch).
+
+    Returns the number of objects deleted; per-key failures are logged.
+    """
+    s3 = _get_s3_client()
+    deleted = 0
+    for start in range(0, len(keys), 1000):
+        batch = [{'Key': key} for key in keys[start:start + 1000]]
+        try:
+            response = s3.delete_objects(Bucket=bucket_name, Delete={'Objects': batch, 'Quiet': True})
+        except ClientError as e:
+            logger.error(f"❌ Delete failed: {e}")
+            continue
+        for error in response.get('Errors', []):
+            logger.error(f"❌ Delete failed: {error['Key']}: {error['Message']}")
+        deleted += len(batch) - len(response.get('Errors', []))
+    return deleted
+
+
+def _iter_pages(bucket_name: str, prefix: str) -> Iterator[list[ObjectInfo]]:
+    """Yield listing pages (up to 1,000 objects each) for a prefix."""
+    paginator = _get_s3_client().get_paginator('list_objects_v2')
+    for page in paginator.paginate(Bucket=bucket_name, Prefix=prefix):
+        yield [
+            ObjectInfo(obj['Key'], obj['Size'], obj['ETag'].strip('"'), obj['LastModified'])
+            for obj in page.get('Contents', [])
+        ]
+
+
+def iter_objects(bucket_name: str, prefix: str = '') -> Iterator[ObjectInfo]:
+    """Lazily list all objects under prefix, one page in memory at a time."""
+    try:
+        for page in _iter_pages(bucket_name, prefix):
+            yield from page
     except ClientError as e:
         logger.error(f"❌ List failed: {e}")
-        return []
+
+
+def _put_page(pages: queue.Queue, page: list[ObjectInfo] | Exception | None, stop: threading.Event) -> bool:
+    """Put onto the bounded queue unless the consumer has gone away."""
+    while not stop.is_set():
+        try:
+            pages.put(page, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _produce_pages(
+    bucket_name: str,
+    prefix: str,
+    pages: queue.Queue,
+    stop: threading.Event
+) -> None:
+    """
+    Push listing pages for one prefix, then an end marker: None, or the
+    exception that stopped the listing (re-raised by the consumer).
+    """
+    end: Optional[Exception] = None
+    try:
+        for page in _iter_pages(bucket_name, prefix):
+            if not _put_page(pages, page, stop):
+                return
+    except ClientError as e:
+        logger.error(f"❌ List failed for '{prefix}': {e}")
+    except Exception as e:
+        end = e
+    finally:
+        _put_page(pages, end, stop)
+
+
+def iter_objects_parallel(
+    bucket_name: str,
+    prefixes: list[str],
+    max_workers: int = config.S3_MAX_CONCURRENCY
+) -> Iterator[ObjectInfo]:
+    """
+    List several prefixes concurrently, yielding objects as pages arrive.
+
+    Order across prefixes is not preserved. At most 2 * max_workers pages
+    are buffered, so memory stays bounded however large the listing is.
+    A ClientError on one prefix is logged like in iter_objects(); any other
+    error in a worker (e.g. a dropped connection) is raised here.
+    """
+    pages: queue.Queue = queue.Queue(maxsize=max_workers * 2)
+    stop = threading.Event()
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        for prefix in prefixes:
+            pool.submit(_produce_pages, bucket_name, prefix, pages, stop)
+        try:
+            remaining = len(prefixes)
+            while remaining:
+                page = pages.get()
+                if isinstance(page, Exception):
+                    raise page
+                if page is None:
+                    remaining -= 1
+                    continue
+                yield from page
+        finally:
+            # Unblocks producers if the caller stopped iterating early
+            stop.set()
+
+
+def list_objects(bucket_name: str, prefix: str = '') -> list[str]:
+    """List object keys in S3 bucket with prefix."""
+    keys = [obj.key for obj in iter_objects(bucket_name, prefix)]
+    logger.info(f"📋 Found {len(keys)} objects with prefix '{prefix}'")
+    return keys
+
+
+LISTING_DEPTH = 3  # zone/domain/entity/: one listing per entity prefix
+
+
+def listing_prefix(s3_key: str) -> str:
+    """The prefix listed to find s3_key: its first LISTING_DEPTH folders."""
+    folders = s3_key.split('/')[:-1][:LISTING_DEPTH]
+    return ''.join(f'{folder}/' for folder in folders)
+
+
+def remote_snapshot(bucket_name: str, keys: list[str]) -> Optional[dict[str, ObjectInfo]]:
+    """
+    ObjectInfo of the existing keys, from one paginated listing per prefix instead of a HEAD per key.
+
+    None if a listing broke off (nothing can then be skipped safely).
+    """
+    wanted = set(keys)
+    prefixes = sorted({listing_prefix(key) for key in keys})
+    try:
+        snapshot = {obj.key: obj for obj in iter_objects_parallel(bucket_name, prefixes) if obj.key in wanted}
+    except BotoCoreError as e:
+        logger.warning(f"⚠️  Listing failed, uploading every file: {e}")
+        return None
+    logger.info(f"🔎 {len(snapshot)}/{len(wanted)} keys already in s3://{bucket_name}/ ({len(prefixes)} listings)")
+    return snapshot
+
+
+def matches_remote(local_path: Path, remote: Optional[ObjectInfo], etag_cache: dict, part_size: int) -> bool:
+    """Remote object holds the same bytes (size first, then the local ETag)."""
+    if remote is None or remote.size != local_path.stat().st_size:
+        return False
+    return remote.etag == checksums.cached_etag(local_path, etag_cache, part_size)
+
+
+def _skip_upload(bucket_name: str, local_path: Path, remote: ObjectInfo) -> TransferResult:
+    """Count and log a file whose bytes are already at remote.key (no request made)."""
+    metrics.inc('s3_upload_files_total', status='skipped')
+    metrics.inc('s3_upload_skipped_bytes_total', local_path.stat().st_size)
+    logger.info(f"⏭️  {local_path.name} unchanged at s3://{bucket_name}/{remote.key}")
+    return TransferResult(local_path, remote.key, True, skipped=True, etag=remote.etag)
+
+
+def _upload_one(
+    s3,
+    bucket_name: str,
+    local_path: Path,
+    s3_key: str,
+    transfer_config
+) -> TransferResult:
+    """Upload one file with the shared client, timing the transfer."""
+    from boto3.exceptions import S3UploadFailedError
+
+    start = time.perf_counter()
+    try:
+        retry.call('s3:upload_file', s3.upload_file, str(local_path), bucket_name, s3_key, Config=transfer_config)
+    except (ClientError, S3UploadFailedError, OSError) as e:
+        metrics.inc('s3_upload_files_total', status='failed')
+        logger.error(f"❌ Upload failed: {local_path.name}: {e}")
+        return TransferResult(local_path, s3_key, False, error=str(e))
+
+    elapsed = time.perf_counter() - start
+    metrics.observe('s3_upload_seconds', elapsed)
+    metrics.inc('s3_upload_bytes_total', local_path.stat().st_size)
+    metrics.inc('s3_upload_files_total', status='ok')
+    logger.info(f"✅ {local_path.name} → s3://{bucket_name}/{s3_key}")
+    return TransferResult(local_path, s3_key, True, local_path.stat().st_size, elapsed)
+
+
+def _upload_changed(s3, bucket_name: str, item: tuple[Path, str], snapshot: Optional[dict], etag_cache: dict,
+                    transfer_config) -> TransferResult:
+    """
+    Upload one file unless the snapshot shows identical bytes at its key.
+
+    The result carries the object's ETag: the listed one if skipped, or
+    the one the upload produced (checksums.file_etag, hashed locally and
+    cached rather than fetched with a HEAD).
+    """
+    local_path, s3_key = item
+    part_size = transfer_config.multipart_chunksize
+    remote = snapshot.get(s3_key) if snapshot is not None else None
+    if matches_remote(local_path, remote, etag_cache, part_size):
+        return _skip_upload(bucket_name, local_path, remote)
+    result = _upload_one(s3, bucket_name, local_path, s3_key, transfer_config)
+    if result.success:
+        result.etag = checksums.cached_etag(local_path, etag_cache, part_size)
+    return result
+
+
+def upload_files(
+    bucket_name: str,
+    files: list[tuple[Path, str]],
+    max_workers: int = config.S3_MAX_CONCURRENCY,
+    multipart_chunksize: int = config.S3_MULTIPART_CHUNKSIZE,
+    multipart_concurrency: int = config.S3_MULTIPART_CONCURRENCY,
+    skip_unchanged: bool = config.S3_SKIP_UNCHANGED
+) -> TransferSummary:
+    """
+    Upload many (local_path, s3_key) pairs concurrently.
+
+    Files run on `max_workers` threads; each large file is further split
+    into `multipart_chunksize` parts uploaded `multipart_concurrency` at a
+    time. All threads share one pooled client, whose adaptive retry mode
+    paces requests under SlowDown; a file whose upload still fails with
+    a throttling or 5xx error is retried whole (retry.call).
+
+    With skip_unchanged, keys are first looked up in one listing per
+    entity prefix, and files whose ETag (checksums.py) matches the
+    object are skipped. Skipped files count as succeeded with 0 bytes.
+    """
+    from boto3.s3.transfer import TransferConfig
+
+    transfer_config = TransferConfig(
+        multipart_threshold=multipart_chunksize,
+        multipart_chunksize=multipart_chunksize,
+        max_concurrency=multipart_concurrency
+    )
+    s3 = _get_pooled_s3_client(max_workers * multipart_concurrency)
+    snapshot = remote_snapshot(bucket_name, [key for _, key in files]) if skip_unchanged else None
+    etag_cache = checksums.load_cache()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        results = list(pool.map(
+            lambda item: _upload_changed(s3, bucket_name, item, snapshot, etag_cache, transfer_config),
+            files
+        ))
+    summary = TransferSummary(results, time.perf_counter() - start)
+    checksums.save_cache(etag_cache)
+
+    skipped = sum(1 for r in results if r.skipped)
+    logger.info(
+        f"📤 Uploaded {summary.succeeded - skipped}/{len(files)} files ({skipped} unchanged), "
+        f"{summary.total_bytes:,} B in {summary.seconds:.1f}s ({summary.throughput_mbps:.1f} MB/s)"
+    )
+    return summary
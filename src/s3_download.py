@@ -0,0 +1,251 @@
+"""Parallel, resumable bulk downloads from S3.
+
+download_file() fetches one object at a time over one connection. For a
+prefix or key list this module instead:
+- splits every object into S3_MULTIPART_CHUNKSIZE byte ranges and runs
+  all ranges of all objects on one pool of
+  S3_MAX_CONCURRENCY × S3_MULTIPART_CONCURRENCY threads (shared pooled
+  client), so a few large objects use the whole bandwidth as well
+- pre-allocates each file (.{name}.part) to its final size when its
+  first range starts and writes ranges in place with pwrite, with no
+  reassembly pass. Ranges are queued object by object and each file is
+  closed as soon as its last range lands, so only the objects in flight
+  hold a file descriptor.
+- records finished ranges in .{name}.progress next to it. A rerun after
+  an interruption fetches only the missing ranges, as long as the
+  object's ETag has not changed. Range GETs send If-Match, so an object
+  replaced mid-download fails rather than mixing two versions.
+- skips files already downloaded (same size and modification time)
+
+Finished files are renamed into place and stamped with the object's
+LastModified time.
+"""
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+from botocore.exceptions import BotoCoreError, ClientError
+
+from . import config, metrics
+from .s3_client import ObjectInfo, TransferResult, TransferSummary, _get_pooled_s3_client, iter_objects
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+READ_CHUNK = 1024 * 1024  # bytes written per pwrite
+
+
+@dataclass
+class Download:
+    """One object being downloaded: its ranges and which are done."""
+    obj: ObjectInfo
+    local_path: Path
+    part_size: int
+    done: set[int] = field(default_factory=set)
+    fetched: int = 0
+    error: Optional[str] = None
+    fd: int = -1
+    pending: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    @property
+    def part_path(self) -> Path:
+        return self.local_path.with_name(f'.{self.local_path.name}.part')
+
+    @property
+    def progress_path(self) -> Path:
+        return self.local_path.with_name(f'.{self.local_path.name}.progress')
+
+    @property
+    def num_parts(self) -> int:
+        return -(-self.obj.size // self.part_size)
+
+    @property
+    def missing(self) -> list[int]:
+        return [index for index in range(self.num_parts) if index not in self.done]
+
+    def byte_range(self, index: int) -> str:
+        start = index * self.part_size
+        return f'bytes={start}-{min(start + self.part_size, self.obj.size) - 1}'
+
+
+# ========================================
+# Local state
+# ========================================
+
+def is_up_to_date(obj: ObjectInfo, local_path: Path) -> bool:
+    """Same size and stamped with the object's LastModified by an earlier download."""
+    try:
+        stat = local_path.stat()
+    except FileNotFoundError:
+        return False
+    return stat.st_size == obj.size and int(stat.st_mtime) == int(obj.last_modified.timestamp())
+
+
+def _progress_header(download: Download) -> dict:
+    return {'etag': download.obj.etag, 'size': download.obj.size, 'part_size': download.part_size}
+
+
+def _load_progress(download: Download) -> set[int]:
+    """Finished ranges of an interrupted run of the same object version."""
+    if not download.part_path.exists():
+        return set()
+    try:
+        header, *lines = download.progress_path.read_text().splitlines()
+    except (FileNotFoundError, ValueError):
+        return set()
+    if json.loads(header) != _progress_header(download):
+        return set()
+    return {int(line) for line in lines if line.isdigit()}
+
+
+def _open(download: Download) -> None:
+    """Pre-allocate the .part file and (re)start its progress log."""
+    download.local_path.parent.mkdir(parents=True, exist_ok=True)
+    if not download.done:
+        download.progress_path.write_text(json.dumps(_progress_header(download)) + '\n')
+    download.fd = os.open(download.part_path, os.O_RDWR | os.O_CREAT, 0o644)
+    os.ftruncate(download.fd, download.obj.size)
+
+
+def _close(download: Download) -> None:
+    if download.fd >= 0:
+        os.close(download.fd)
+        download.fd = -1
+
+
+def _finish(download: Download, seconds: float) -> TransferResult:
+    """Close the file; rename it into place if every range arrived."""
+    complete = download.error is None and len(download.done) == download.num_parts
+    if complete and download.fd < 0:
+        _open(download)  # empty object, or every range done by an earlier run
+    _close(download)
+    if complete:
+        os.replace(download.part_path, download.local_path)
+        download.progress_path.unlink(missing_ok=True)
+        mtime = download.obj.last_modified.timestamp()
+        os.utime(download.local_path, (mtime, mtime))
+    metrics.inc('s3_download_files_total', status='ok' if complete else 'failed')
+    return TransferResult(download.local_path, download.obj.key, complete, download.fetched, seconds, download.error)
+
+
+# ========================================
+# Transfer
+# ========================================
+
+def _fetch_range(s3, bucket_name: str, download: Download, index: int) -> None:
+    """GET one byte range and write it at its offset (opening the file on its first range)."""
+    with download.lock:
+        if download.fd < 0:
+            _open(download)
+    response = s3.get_object(
+        Bucket=bucket_name, Key=download.obj.key,
+        Range=download.byte_range(index), IfMatch=f'"{download.obj.etag}"'
+    )
+    offset = index * download.part_size
+    for chunk in response['Body'].iter_chunks(READ_CHUNK):
+        os.pwrite(download.fd, chunk, offset)
+        offset += len(chunk)
+
+    with download.lock:
+        download.done.add(index)
+        download.fetched += offset - index * download.part_size
+        with open(download.progress_path, 'a') as progress:
+            progress.write(f'{index}\n')
+    metrics.inc('s3_download_bytes_total', offset - index * download.part_size)
+
+
+def _range_done(download: Download, future: Future, start: float) -> Optional[TransferResult]:
+    """Record one finished range; finish the download after its last one."""
+    try:
+        future.result()
+    except (BotoCoreError, ClientError, OSError) as e:
+        download.error = str(e)
+    finally:
+        download.pending -= 1
+    return _finish(download, time.perf_counter() - start) if not download.pending else None
+
+
+def _run_ranges(bucket_name: str, downloads: list[Download], max_workers: int, start: float) -> list[TransferResult]:
+    """Fetch every missing range of every download on one thread pool."""
+    s3 = _get_pooled_s3_client(max_workers)
+    results = [_finish(download, 0.0) for download in downloads if not download.missing]
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {}
+            for download in downloads:
+                download.pending = len(download.missing)
+                futures.update({
+                    pool.submit(_fetch_range, s3, bucket_name, download, index): download
+                    for index in download.missing
+                })
+            for future in as_completed(futures):
+                if result := _range_done(futures[future], future, start):
+                    results.append(result)
+    finally:
+        for download in downloads:
+            _close(download)
+    return results
+
+
+def download_objects(
+    bucket_name: str,
+    objects: list[tuple[ObjectInfo, Path]],
+    part_size: int = config.S3_MULTIPART_CHUNKSIZE,
+    max_workers: int = config.S3_MAX_CONCURRENCY * config.S3_MULTIPART_CONCURRENCY
+) -> TransferSummary:
+    """Download (object, local_path) pairs with concurrent range GETs, resuming partial files."""
+    skipped = [
+        TransferResult(path, obj.key, True, skipped=True) for obj, path in objects if is_up_to_date(obj, path)
+    ]
+    downloads = [Download(obj, path, part_size) for obj, path in objects if not is_up_to_date(obj, path)]
+    for download in downloads:
+        download.done = _load_progress(download)
+    resumed = sum(len(download.done) for download in downloads)
+
+    start = time.perf_counter()
+    results = _run_ranges(bucket_name, downloads, max_workers, start)
+    seconds = time.perf_counter() - start
+
+    summary = TransferSummary(skipped + results, seconds)
+    metrics.observe('s3_bulk_download_seconds', seconds)
+    logger.info(
+        f"📥 Downloaded {summary.succeeded - len(skipped)}/{len(downloads)} files "
+        f"({len(skipped)} up to date, {resumed} ranges resumed), "
+        f"{summary.total_bytes:,} B in {seconds:.1f}s ({summary.throughput_mbps:.1f} MB/s)"
+    )
+    return summary
+
+
+def download_prefix(bucket_name: str, prefix: str, local_dir: Path, **kwargs) -> TransferSummary:
+    """Download every object under prefix into local_dir, keeping the relative layout."""
+    objects = [
+        (obj, local_dir / obj.key[len(prefix):].lstrip('/'))
+        for obj in iter_objects(bucket_name, prefix)
+        if not obj.key.endswith('/')  # folder markers
+    ]
+    return download_objects(bucket_name, objects, **kwargs)
+
+
+def _head(s3, bucket_name: str, key: str) -> Optional[ObjectInfo]:
+    try:
+        response = s3.head_object(Bucket=bucket_name, Key=key)
+    except ClientError as e:
+        logger.error(f"❌ Head failed: {key}: {e}")
+        return None
+    return ObjectInfo(key, response['ContentLength'], response['ETag'].strip('"'), response['LastModified'])
+
+
+def download_keys(bucket_name: str, keys: list[str], local_dir: Path, **kwargs) -> TransferSummary:
+    """Download the given keys into local_dir/{key}; missing keys are logged and skipped."""
+    s3 = _get_pooled_s3_client(config.S3_MAX_CONCURRENCY)
+    with ThreadPoolExecutor(max_workers=config.S3_MAX_CONCURRENCY) as pool:
+        heads = list(pool.map(lambda key: _head(s3, bucket_name, key), keys))
+    objects = [(obj, local_dir / obj.key) for obj in heads if obj is not None]
+    return download_objects(bucket_name, objects, **kwargs)
@@ -0,0 +1,118 @@
+"""Shared fixtures: a clean client cache, an in-process S3 (moto) and a fake Glue."""
+import pytest
+from botocore.exceptions import ClientError
+
+from src import aws_async, aws_clients, config, glue_client, retry
+
+BUCKET = 'datalake-test-bucket'
+
+
+@pytest.fixture(autouse=True)
+def fresh_clients(monkeypatch):
+    """Fake credentials, and every test builds its own clients (moto patches them at creation)."""
+    monkeypatch.setattr(config, 'AWS_ACCESS_KEY_ID', 'testing')
+    monkeypatch.setattr(config, 'AWS_SECRET_ACCESS_KEY', 'testing')
+    monkeypatch.setattr(config, 'AWS_REGION', 'us-east-1')
+    aws_clients.clear_client_cache()
+    yield
+    aws_clients.clear_client_cache()
+
+
+@pytest.fixture
+def s3():
+    """Mocked S3 with an empty bucket; yields the shared client."""
+    moto = pytest.importorskip('moto')
+    with moto.mock_aws():
+        client = aws_clients.get_client('s3')
+        client.create_bucket(Bucket=BUCKET)
+        yield client
+
+
+@pytest.fixture
+def no_backoff(monkeypatch):
+    """Fresh per-operation budgets and no sleeping between attempts."""
+    monkeypatch.setattr(retry, '_budgets', {})
+    monkeypatch.setattr(retry, 'backoff_delay', lambda attempt: 0)
+
+
+def client_error(code: str, status: int = 400) -> ClientError:
+    return ClientError({'Error': {'Code': code, 'Message': code}, 'ResponseMetadata': {'HTTPStatusCode': status}}, 'Op')
+
+
+class Flaky:
+    """Raises the given errors in turn, then returns 'ok'."""
+
+    def __init__(self, *errors: Exception):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def __call__(self, *args, **kwargs) -> str:
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return 'ok'
+
+
+class FakeGlue:
+    """
+    In-memory Glue (moto's Glue backend needs extras we don't install).
+
+    Catalog tables and partitions are stored per database. Each crawler
+    walks through its scripted descriptions, one per batch_get_crawlers.
+    """
+
+    def __init__(self, crawlers: dict[str, list[dict]] = None, crawler_metrics: dict[str, dict] = None):
+        self.tables: dict[tuple[str, str], dict] = {}
+        self.partitions: dict[tuple[str, str], dict[tuple, dict]] = {}
+        self.scripts = {name: iter(states) for name, states in (crawlers or {}).items()}
+        self.current: dict[str, dict] = {}
+        self.crawler_metrics = crawler_metrics or {}
+        self.requests: list[tuple[str, int]] = []
+
+    def create_table(self, DatabaseName: str, TableInput: dict) -> dict:
+        if (DatabaseName, TableInput['Name']) in self.tables:
+            raise client_error('AlreadyExistsException')
+        self.tables[DatabaseName, TableInput['Name']] = TableInput
+        return {}
+
+    def update_table(self, DatabaseName: str, TableInput: dict) -> dict:
+        self.tables[DatabaseName, TableInput['Name']] = TableInput
+        return {}
+
+    def batch_create_partition(self, DatabaseName: str, TableName: str, PartitionInputList: list[dict]) -> dict:
+        existing, errors = self.partitions.setdefault((DatabaseName, TableName), {}), []
+        for partition in PartitionInputList:
+            values = tuple(partition['Values'])
+            if values in existing:
+                errors.append({
+                    'PartitionValues': partition['Values'],
+                    'ErrorDetail': {'ErrorCode': 'AlreadyExistsException', 'ErrorMessage': 'exists'},
+                })
+            existing[values] = partition
+        return {'Errors': errors}
+
+    def batch_get_crawlers(self, CrawlerNames: list[str]) -> dict:
+        self.requests.append(('batch_get_crawlers', len(CrawlerNames)))
+        for name in CrawlerNames:
+            if name in self.scripts:
+                self.current[name] = next(self.scripts[name], self.current.get(name))
+        found = [{'Name': name, **self.current[name]} for name in CrawlerNames if name in self.current]
+        return {'Crawlers': found, 'CrawlersNotFound': [name for name in CrawlerNames if name not in self.current]}
+
+    def get_crawler_metrics(self, CrawlerNameList: list[str]) -> dict:
+        self.requests.append(('get_crawler_metrics', len(CrawlerNameList)))
+        return {'CrawlerMetricsList': [
+            {'CrawlerName': name, **self.crawler_metrics.get(name, {})} for name in CrawlerNameList
+        ]}
+
+
+@pytest.fixture
+def glue(monkeypatch):
+    """Route glue_client and aws_async Glue calls to a FakeGlue; yields a factory taking its scripts."""
+    def install(**kwargs) -> FakeGlue:
+        fake = FakeGlue(**kwargs)
+        monkeypatch.setattr(glue_client, '_get_glue_client', lambda: fake)
+        monkeypatch.setattr(aws_async, 'get_client', lambda service, **options: fake)
+        return fake
+
+    return install
@@ -0,0 +1,81 @@
+"""Analytics rollups: dictionary columns, full-row digests and month-scoped reads."""
+from datetime import datetime
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from src import analytics
+
+ROLLUP = analytics.ROLLUPS['daily_transactions']
+
+
+def transactions(month: int, statuses: list[str], first_id: int = 0) -> pa.Table:
+    return pa.table({
+        'transaction_id': list(range(first_id, first_id + len(statuses))),
+        'transaction_date': pa.array([datetime(2024, month, 1 + i % 28) for i in range(len(statuses))], pa.timestamp('ms')),
+        'transaction_type': pa.array(['deposit'] * len(statuses)).dictionary_encode(),
+        'channel': pa.array(['online'] * len(statuses)).dictionary_encode(),
+        'status': pa.array(statuses).dictionary_encode(),
+        'amount': [10.0] * len(statuses),
+    })
+
+
+def write_month(root, month: int, *tables: pa.Table) -> None:
+    """One Hive partition file, one row group (and dictionary) per table."""
+    path = root / 'transactions' / 'year=2024' / f'month={month}' / 'transactions-0.parquet'
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with pq.ParquetWriter(path, tables[0].schema) as writer:
+        for table in tables:
+            writer.write_table(table)
+
+
+@pytest.fixture
+def loaded(monkeypatch):
+    """Months each load() call was asked for (None = everything)."""
+    calls, load = [], analytics.load
+
+    def recording(rollup, root, partitions=None):
+        calls.append(None if partitions is None else sorted(partitions))
+        return load(rollup, root, partitions)
+
+    monkeypatch.setattr(analytics, 'load', recording)
+    return calls
+
+
+def test_dictionary_columns_are_grouped_across_row_groups(tmp_path):
+    write_month(tmp_path, 1, transactions(1, ['completed'] * 30), transactions(1, ['failed'] * 20 + ['completed'], 30))
+
+    result = analytics.materialise(ROLLUP, {}, tmp_path, tmp_path / 'reports')
+
+    rows = pq.read_table(result.written[0]).group_by('status').aggregate([('transactions', 'sum')]).to_pylist()
+    assert {row['status']: row['transactions_sum'] for row in rows} == {'completed': 31, 'failed': 20}
+
+
+def test_only_months_of_changed_files_are_read_and_rewritten(tmp_path, loaded):
+    for month in (1, 2, 3):
+        write_month(tmp_path, month, transactions(month, ['completed'] * 10))
+    state = {}
+    analytics.materialise(ROLLUP, state, tmp_path, tmp_path / 'reports')
+
+    # Same ids and amounts: only the status moved
+    write_month(tmp_path, 2, transactions(2, ['completed'] * 9 + ['failed']))
+    result = analytics.materialise(ROLLUP, state, tmp_path, tmp_path / 'reports')
+
+    assert loaded == [[(2024, 1), (2024, 2), (2024, 3)], [(2024, 2)]]
+    assert [path.parent.name for path in result.written] == ['month=2']
+    assert analytics.materialise(ROLLUP, state, tmp_path, tmp_path / 'reports').written == []
+    assert len(loaded) == 2
+
+
+def test_removed_month_files_drop_their_partitions(tmp_path):
+    for month in (1, 2):
+        write_month(tmp_path, month, transactions(month, ['completed'] * 5))
+    state = {}
+    analytics.materialise(ROLLUP, state, tmp_path, tmp_path / 'reports')
+
+    (tmp_path / 'transactions' / 'year=2024' / 'month=2' / 'transactions-0.parquet').unlink()
+    result = analytics.materialise(ROLLUP, state, tmp_path, tmp_path / 'reports')
+
+    assert (result.written, result.removed) == ([], ['year=2024/month=2'])
+    assert not (tmp_path / 'reports' / 'daily_transactions' / 'year=2024' / 'month=2').exists()
@@ -0,0 +1,105 @@
+"""Athena submission, polling and timeout handling against a fake client."""
+import itertools
+
+import pytest
+
+from src import athena_client
+
+
+class FakeAthena:
+    """Scripted Athena: each query walks through its list of states, one per poll."""
+
+    def __init__(self, states: dict[str, list[str]]):
+        self.states = {sql: iter(sequence) for sql, sequence in states.items()}
+        self.current: dict[str, str] = {}
+        self.sql: dict[str, str] = {}
+        self.ids = itertools.count()
+        self.stopped: list[str] = []
+
+    def start_query_execution(self, QueryString: str, **kwargs) -> dict:
+        query_id = f'q{next(self.ids)}'
+        self.sql[query_id] = QueryString
+        return {'QueryExecutionId': query_id}
+
+    def batch_get_query_execution(self, QueryExecutionIds: list[str]) -> dict:
+        executions = []
+        for query_id in QueryExecutionIds:
+            state = self.current.get(query_id)
+            if state not in athena_client.TERMINAL_STATES:
+                state = next(self.states[self.sql[query_id]], state)
+            self.current[query_id] = state
+            status = {'State': state}
+            if state == 'FAILED':
+                status['StateChangeReason'] = 'SYNTAX_ERROR'
+            executions.append({
+                'QueryExecutionId': query_id,
+                'Status': status,
+                'Statistics': {'EngineExecutionTimeInMillis': 12, 'DataScannedInBytes': 2048},
+            })
+        return {'QueryExecutions': executions}
+
+    def stop_query_execution(self, QueryExecutionId: str) -> dict:
+        self.stopped.append(QueryExecutionId)
+        self.current[QueryExecutionId] = 'CANCELLED'
+        return {}
+
+    def get_paginator(self, operation: str) -> 'FakeAthena':
+        return self
+
+    def paginate(self, QueryExecutionId: str, **kwargs):
+        columns = [{'Name': 'n', 'Type': 'bigint'}]
+        rows = [{'Data': [{'VarCharValue': 'n'}]}, {'Data': [{'VarCharValue': '42'}]}]
+        yield {'ResultSet': {'ResultSetMetadata': {'ColumnInfo': columns}, 'Rows': rows}}
+
+
+@pytest.fixture
+def history(monkeypatch) -> list:
+    recorded = []
+    monkeypatch.setattr(athena_client, 'record_query', recorded.append)
+    return recorded
+
+
+def use_fake(monkeypatch, states: dict[str, list[str]]) -> FakeAthena:
+    fake = FakeAthena(states)
+    monkeypatch.setattr(athena_client, '_get_athena_client', lambda: fake)
+    return fake
+
+
+def test_run_queries_returns_results_of_succeeded_queries(monkeypatch, history):
+    use_fake(monkeypatch, {'select 1': ['QUEUED', 'RUNNING', 'SUCCEEDED']})
+
+    [result] = athena_client.run_queries(['select 1'], use_cache=False, timeout=10)
+
+    assert result.to_pylist() == [{'n': 42}]
+    assert [(stats.state, stats.bytes_scanned) for stats in history] == [('SUCCEEDED', 2048)]
+
+
+def test_run_queries_returns_none_for_failed_queries(monkeypatch, history):
+    use_fake(monkeypatch, {'select 1': ['SUCCEEDED'], 'selec 2': ['RUNNING', 'FAILED']})
+
+    results = athena_client.run_queries(['select 1', 'selec 2'], use_cache=False, timeout=10)
+
+    assert results[0] is not None and results[1] is None
+    assert [(stats.state, stats.error) for stats in history] == [('SUCCEEDED', None), ('FAILED', 'SYNTAX_ERROR')]
+
+
+def test_queries_running_at_timeout_are_stopped_and_cancelled(monkeypatch, history):
+    fake = use_fake(monkeypatch, {'select 1': ['SUCCEEDED'], 'select 2': itertools.repeat('RUNNING')})
+
+    results = athena_client.run_queries(['select 1', 'select 2'], use_cache=False, timeout=0.3)
+
+    assert results[0] is not None and results[1] is None
+    assert fake.stopped == ['q1']
+    assert [stats.state for stats in history] == ['SUCCEEDED', 'CANCELLED']
+    assert history[1].error == 'timed out after 0.3s'
+
+
+def test_wait_for_queries_polls_once_more_at_the_deadline(monkeypatch):
+    # Finishes on the 3rd poll: after 0.2 s and 0.4 s of backoff, past a 0.5 s timeout
+    fake = use_fake(monkeypatch, {'select 1': ['RUNNING', 'RUNNING', 'SUCCEEDED']})
+    query_id = fake.start_query_execution(QueryString='select 1')['QueryExecutionId']
+
+    executions = athena_client.wait_for_queries([query_id], timeout=0.5)
+
+    assert executions[query_id]['Status']['State'] == 'SUCCEEDED'
+    assert fake.stopped == []
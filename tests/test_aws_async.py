@@ -0,0 +1,82 @@
+"""AsyncBridge: retries and bounded concurrency for blocking boto3 calls."""
+import asyncio
+import threading
+import time
+
+import pytest
+from botocore.exceptions import ClientError
+
+from src import aws_async, retry
+
+from .conftest import Flaky, client_error
+
+pytestmark = pytest.mark.usefixtures('no_backoff')
+
+
+def bridge_call(bridge: aws_async.AsyncBridge, fn: Flaky) -> str:
+    async def call_once(service: str, operation: str, kwargs: dict) -> str:
+        return fn()
+
+    async def run() -> str:
+        async with bridge:
+            bridge._call_once = call_once
+            return await bridge.call('s3', 'put_object', Bucket='b', Key='k')
+
+    return asyncio.run(run())
+
+
+def test_bridge_retries_throttles():
+    fn = Flaky(client_error('SlowDown', 503), client_error('SlowDown', 503))
+
+    assert bridge_call(aws_async.AsyncBridge(max_attempts=5, retry_budget=10), fn) == 'ok'
+    assert fn.calls == 3
+
+
+def test_bridge_batch_budget_is_untouched_by_errors_it_does_not_retry():
+    bridge = aws_async.AsyncBridge(max_attempts=5, retry_budget=3)
+
+    with pytest.raises(ClientError):
+        bridge_call(bridge, Flaky(client_error('AccessDenied', 403)))
+    assert bridge.budget.tokens == 3
+
+
+def test_bridge_stops_when_the_batch_budget_is_spent():
+    bridge = aws_async.AsyncBridge(max_attempts=10, retry_budget=2)
+    fn = Flaky(*[client_error('SlowDown', 503)] * 5)
+
+    with pytest.raises(ClientError):
+        bridge_call(bridge, fn)
+    assert fn.calls == 3
+    assert bridge.budget.tokens == 0
+    # The refused third retry did not cost the operation budget either
+    assert retry.budget('s3:put_object').tokens == retry.budget('s3:put_object').capacity - 2
+
+
+class SlowClient:
+    """Blocking client method that records how many calls overlap."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.in_flight = self.peak = 0
+
+    def head_object(self, **kwargs) -> dict:
+        with self.lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(0.05)
+        with self.lock:
+            self.in_flight -= 1
+        return kwargs
+
+
+def test_bridge_runs_blocking_calls_concurrently_up_to_its_limit(monkeypatch):
+    client = SlowClient()
+    monkeypatch.setattr(aws_async, 'get_client', lambda service, **kwargs: client)
+
+    async def run() -> list[dict]:
+        async with aws_async.AsyncBridge(concurrency=4) as bridge:
+            return await asyncio.gather(*(bridge.call('s3', 'head_object', Key=str(i)) for i in range(12)))
+
+    assert [response['Key'] for response in asyncio.run(run())] == [str(i) for i in range(12)]
+    assert client.peak == 4
+
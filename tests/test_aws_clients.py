@@ -0,0 +1,45 @@
+"""The process-wide boto3 client cache."""
+from concurrent.futures import ThreadPoolExecutor
+
+from src import aws_clients, config
+
+
+def test_same_service_and_settings_share_one_client():
+    assert aws_clients.get_client('s3') is aws_clients.get_client('s3')
+
+
+def test_region_pool_size_and_service_get_their_own_clients():
+    s3 = aws_clients.get_client('s3')
+
+    assert aws_clients.get_client('s3', region='eu-west-1') is not s3
+    assert aws_clients.get_client('s3', max_pool_connections=64) is not s3
+    assert aws_clients.get_client('glue') is not s3
+    assert aws_clients.get_client('s3', max_pool_connections=64).meta.config.max_pool_connections == 64
+
+
+def test_rotated_credentials_get_a_fresh_client(monkeypatch):
+    before = aws_clients.get_client('s3')
+    monkeypatch.setattr(config, 'AWS_ACCESS_KEY_ID', 'rotated-key')
+
+    assert aws_clients.get_client('s3') is not before
+
+
+def test_concurrent_first_use_creates_one_client():
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        clients = list(pool.map(lambda _: aws_clients.get_client('s3'), range(64)))
+
+    assert len({id(client) for client in clients}) == 1
+
+
+def test_clear_client_cache_drops_clients():
+    before = aws_clients.get_client('s3')
+    aws_clients.clear_client_cache()
+
+    assert aws_clients.get_client('s3') is not before
+
+
+def test_clients_use_the_shared_retry_policy():
+    retries = aws_clients.get_client('s3').meta.config.retries
+
+    assert retries['mode'] == config.AWS_RETRY_MODE
+    assert retries['total_max_attempts'] == config.AWS_MAX_ATTEMPTS
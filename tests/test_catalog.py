@@ -0,0 +1,81 @@
+"""Crawler-free catalog registration from uploaded Parquet files, against a fake Glue."""
+import os
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from src import catalog, config
+
+from .conftest import BUCKET
+
+PREFIX = 'processed/finanzas/'
+
+pytestmark = pytest.mark.usefixtures('no_backoff')
+
+
+def upload(root, relative: str, table: pa.Table, mtime: float = None) -> tuple:
+    path = root / relative
+    path.parent.mkdir(parents=True, exist_ok=True)
+    pq.write_table(table, path)
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+    return path, f'{PREFIX}{relative}'
+
+
+def things(year: int, month: int) -> pa.Table:
+    return pa.table({'id': [1], 'amount': pa.array([1.5], pa.float64()), 'year': [year], 'month': [month]})
+
+
+def test_tables_and_partitions_are_registered_from_the_hive_layout(glue, tmp_path):
+    fake = glue()
+    uploads = [
+        upload(tmp_path, 'things/year=2024/month=1/things-0.parquet', things(2024, 1)),
+        upload(tmp_path, 'things/year=2024/month=2/things-0.parquet', things(2024, 2)),
+    ]
+
+    assert catalog.register_uploads(uploads, BUCKET)
+
+    table = fake.tables[config.GLUE_DATABASE_NAME, 'parquet_things']
+    assert table['PartitionKeys'] == [{'Name': 'year', 'Type': 'int'}, {'Name': 'month', 'Type': 'int'}]
+    assert table['StorageDescriptor']['Columns'] == [{'Name': 'id', 'Type': 'bigint'}, {'Name': 'amount', 'Type': 'double'}]
+    partitions = fake.partitions[config.GLUE_DATABASE_NAME, 'parquet_things']
+    assert sorted(partitions) == [('2024', '1'), ('2024', '2')]
+    assert partitions['2024', '2']['StorageDescriptor']['Location'] == \
+        f's3://{BUCKET}/{PREFIX}things/year=2024/month=2/'
+
+
+def test_registering_again_updates_the_table_and_skips_existing_partitions(glue, tmp_path):
+    fake = glue()
+    uploads = [upload(tmp_path, 'things/year=2024/month=1/things-0.parquet', things(2024, 1))]
+    catalog.register_uploads(uploads, BUCKET)
+
+    uploads.append(upload(tmp_path, 'things/year=2024/month=3/things-0.parquet', things(2024, 3)))
+
+    assert catalog.register_uploads(uploads, BUCKET)
+    assert sorted(fake.partitions[config.GLUE_DATABASE_NAME, 'parquet_things']) == [('2024', '1'), ('2024', '3')]
+
+
+def test_only_the_newest_layout_is_registered(glue, tmp_path):
+    fake = glue()
+    uploads = [
+        upload(tmp_path, 'things/date=2024-01-01/things.parquet', pa.table({'id': [1]}), mtime=1_000_000),
+        upload(tmp_path, 'things/year=2024/month=1/things-0.parquet', things(2024, 1)),
+    ]
+
+    assert catalog.register_uploads(uploads, BUCKET)
+
+    assert [key['Name'] for key in fake.tables[config.GLUE_DATABASE_NAME, 'parquet_things']['PartitionKeys']] == \
+        ['year', 'month']
+    assert list(fake.partitions[config.GLUE_DATABASE_NAME, 'parquet_things']) == [('2024', '1')]
+
+
+def test_partition_errors_other_than_already_exists_fail_the_registration(glue, tmp_path, monkeypatch):
+    fake = glue()
+    monkeypatch.setattr(fake, 'batch_create_partition', lambda **kwargs: {'Errors': [{
+        'PartitionValues': ['2024', '1'],
+        'ErrorDetail': {'ErrorCode': 'InternalServiceException', 'ErrorMessage': 'boom'},
+    }]})
+    uploads = [upload(tmp_path, 'things/year=2024/month=1/things-0.parquet', things(2024, 1))]
+
+    assert not catalog.register_uploads(uploads, BUCKET)
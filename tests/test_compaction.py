@@ -0,0 +1,59 @@
+"""Compaction: the local tree is compacted before upload, so uploads keep the merged layout."""
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from src import checksums
+from src.compaction import compact_local, delete_superseded, merge_parquet_files
+from src.parquet_profiles import DEFAULT_PROFILE, DEFAULT_ROW_GROUP_SIZE
+from src.s3_client import iter_objects, upload_files
+
+from .conftest import BUCKET
+
+
+def write_small_files(partition, count: int, rows: int = 10) -> None:
+    partition.mkdir(parents=True, exist_ok=True)
+    for i in range(count):
+        pq.write_table(pa.table({'id': list(range(i * rows, (i + 1) * rows))}), partition / f'things-{i}.parquet')
+
+
+def upload(root, bucket):
+    files = [(path, f'processed/finanzas/{path.relative_to(root).as_posix()}') for path in sorted(root.rglob('*.parquet'))]
+    assert upload_files(bucket, files).failed == 0
+    delete_superseded(bucket, files)
+    return sorted(obj.key for obj in iter_objects(bucket, 'processed/finanzas/'))
+
+
+def test_local_partitions_are_merged_and_their_inputs_removed(tmp_path):
+    partition = tmp_path / 'things' / 'year=2024' / 'month=1'
+    write_small_files(partition, 3)
+    write_small_files(tmp_path / 'things' / 'year=2024' / 'month=2', 1)
+
+    report = compact_local(tmp_path, 'things', target_size=1024 * 1024)
+
+    assert (report.files_before, report.files_after) == (3, 1)
+    assert [path.name for path in partition.iterdir()] == ['things-3.parquet']
+    assert sorted(pq.read_table(partition / 'things-3.parquet')['id'].to_pylist()) == list(range(30))
+
+
+def test_uploads_after_local_compaction_keep_the_merged_files(s3, tmp_path, monkeypatch):
+    monkeypatch.setattr(checksums.load_cache, '__defaults__', (tmp_path / 'etags.json',))
+    monkeypatch.setattr(checksums.save_cache, '__defaults__', (tmp_path / 'etags.json',))
+    root = tmp_path / 'finanzas'
+    write_small_files(root / 'things' / 'year=2024' / 'month=1', 3)
+    upload(root, BUCKET)
+
+    compact_local(root, target_size=1024 * 1024)
+    first = upload(root, BUCKET)
+    compact_local(root, target_size=1024 * 1024)
+
+    assert first == upload(root, BUCKET) == ['processed/finanzas/things/year=2024/month=1/things-3.parquet']
+
+
+def test_merged_row_groups_default_to_the_profile_size(tmp_path):
+    write_small_files(tmp_path, 2, rows=40_000)
+
+    merge_parquet_files(sorted(tmp_path.glob('*.parquet')), tmp_path / 'out.parquet', DEFAULT_PROFILE)
+
+    metadata = pq.read_metadata(tmp_path / 'out.parquet')
+    assert DEFAULT_PROFILE.rows_per_group == DEFAULT_ROW_GROUP_SIZE
+    assert (metadata.num_row_groups, metadata.num_rows) == (1, 80_000)
@@ -0,0 +1,35 @@
+"""Finance data generator: row-count overrides, including empty entities."""
+import pyarrow.csv as pv
+import pyarrow.parquet as pq
+import pytest
+
+from src import data_generator
+
+
+def generate(tmp_path, entity: str, fmt: str, **overrides: int):
+    counts = data_generator.row_counts(0.01, overrides)
+    return data_generator.generate_entity(entity, tmp_path, counts, seed=1, fmt=fmt, chunk_rows=1000)
+
+
+def test_zero_rows_write_an_empty_parquet_file_with_the_schema(tmp_path):
+    path = generate(tmp_path, 'transactions', 'parquet', transactions=0)
+
+    table = pq.read_table(path)
+    assert table.num_rows == 0
+    assert table.schema.names == data_generator.SCHEMAS['transactions'].names
+
+
+def test_zero_rows_write_a_csv_header(tmp_path):
+    path = generate(tmp_path, 'loans', 'csv', loans=0)
+
+    assert pv.read_csv(path).column_names == data_generator.SCHEMAS['loans'].names
+
+
+def test_rows_referencing_an_empty_entity_are_rejected(tmp_path):
+    with pytest.raises(ValueError, match="'accounts'"):
+        generate(tmp_path, 'transactions', 'csv', accounts=0)
+
+
+def test_negative_overrides_are_rejected():
+    with pytest.raises(ValueError, match='0 or more'):
+        data_generator.row_counts(1, {'transactions': -1})
@@ -0,0 +1,60 @@
+"""Crawler waiting and metrics against a fake Glue."""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src import config, glue_client
+
+STARTED = datetime(2024, 5, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def crawler(state: str, status: str = 'SUCCEEDED', started: datetime = STARTED) -> dict:
+    return {'State': state, 'LastCrawl': {'Status': status, 'StartTime': started}}
+
+
+@pytest.fixture(autouse=True)
+def fast_polls(monkeypatch):
+    monkeypatch.setattr(config, 'CRAWLER_POLL_MIN_DELAY', 0.01)
+    monkeypatch.setattr(config, 'CRAWLER_POLL_MAX_DELAY', 0.02)
+
+
+def test_finished_crawlers_report_their_crawl_and_metrics(glue):
+    glue(
+        crawlers={'a': [crawler('RUNNING'), crawler('STOPPING'), crawler('READY')]},
+        crawler_metrics={'a': {'TablesCreated': 2, 'TablesUpdated': 1, 'LastRuntimeSeconds': 42.0}},
+    )
+
+    result = glue_client.wait_for_crawler('a', timeout=5)
+
+    assert result.succeeded
+    assert (result.tables_created, result.tables_updated, result.duration_seconds) == (2, 1, 42.0)
+
+
+def test_ready_from_the_previous_run_is_not_taken_as_finished(glue):
+    previous = STARTED - timedelta(hours=1)
+    glue(crawlers={'a': [crawler('READY', started=previous), crawler('RUNNING'), crawler('READY', 'FAILED')]})
+
+    result = glue_client.wait_for_crawler('a', timeout=5, started_after=STARTED)
+
+    assert (result.status, result.succeeded) == ('FAILED', False)
+
+
+def test_crawlers_running_at_the_deadline_time_out_instead_of_reporting_the_last_crawl(glue):
+    fake = glue(crawlers={'a': [crawler('RUNNING')], 'b': [crawler('READY')]})
+
+    results = glue_client.wait_for_crawlers(['a', 'b', 'missing'], timeout=0.05)
+
+    assert (results['a'].status, results['a'].state, results['a'].timed_out) == ('TIMEOUT', 'RUNNING', True)
+    assert results['b'].succeeded and 'missing' not in results
+    # Metrics only for the finished crawler, and no poll after the loop
+    assert fake.requests[-1] == ('get_crawler_metrics', 1)
+    assert fake.requests[-2][0] == 'batch_get_crawlers'
+
+
+def test_crawler_requests_carry_at_most_100_names(glue):
+    fake = glue(crawlers={f'c{i}': [crawler('READY')] for i in range(250)})
+    names = [f'c{i}' for i in range(250)]
+
+    assert len(glue_client.get_crawlers(names)) == len(glue_client.get_crawler_metrics(names)) == 250
+    assert fake.requests == [('batch_get_crawlers', n) for n in (100, 100, 50)] + \
+        [('get_crawler_metrics', n) for n in (100, 100, 50)]
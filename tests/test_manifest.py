@@ -0,0 +1,62 @@
+"""Incremental-run manifest: change detection and recorded uploads."""
+import os
+
+from botocore.client import BaseClient
+
+from src import checksums, manifest
+from src.s3_client import upload_files
+
+from .conftest import BUCKET
+
+
+def touch_later(path) -> None:
+    stat = path.stat()
+    os.utime(path, (stat.st_atime, stat.st_mtime + 60))
+
+
+def test_touched_file_is_unchanged_but_its_entry_is_only_refreshed_when_recorded(tmp_path):
+    path = tmp_path / 'a.csv'
+    path.write_text('id\n1\n')
+    entry = manifest.fingerprint(path)
+    touch_later(path)
+
+    assert manifest.is_unchanged(path, entry)
+    assert entry['mtime'] != path.stat().st_mtime
+    assert manifest.refresh_entry(path, entry) == {**entry, 'mtime': path.stat().st_mtime}
+
+
+def test_modified_file_is_changed(tmp_path):
+    path = tmp_path / 'a.csv'
+    path.write_text('id\n1\n')
+    entry = manifest.fingerprint(path)
+    path.write_text('id\n2\n')
+    touch_later(path)
+
+    assert not manifest.is_unchanged(path, entry)
+
+
+def test_recorded_etags_come_from_the_upload_without_head_requests(s3, tmp_path, monkeypatch):
+    cache_path = tmp_path / 'etag_cache.json'
+    monkeypatch.setattr(checksums.load_cache, '__defaults__', (cache_path,))
+    monkeypatch.setattr(checksums.save_cache, '__defaults__', (cache_path,))
+    files = []
+    for i in range(3):
+        path = tmp_path / f'f{i}.parquet'
+        path.write_bytes(os.urandom(1000 + i))
+        files.append((path, f'processed/finanzas/e/f{i}.parquet'))
+    upload_files(BUCKET, files[:1])
+
+    calls, make_api_call = [], BaseClient._make_api_call
+
+    def counting(client, operation, params):
+        calls.append(operation)
+        return make_api_call(client, operation, params)
+
+    state = {'transforms': {}, 'uploads': {}}
+    with monkeypatch.context() as patch:
+        patch.setattr(BaseClient, '_make_api_call', counting)
+        manifest.record_uploads(upload_files(BUCKET, files).results, state)
+
+    assert 'HeadObject' not in calls and calls.count('PutObject') == 2
+    for _, key in files:
+        assert state['uploads'][key]['etag'] == s3.head_object(Bucket=BUCKET, Key=key)['ETag'].strip('"')
@@ -0,0 +1,46 @@
+"""CSV → Parquet conversion: every mode writes the same types and row groups."""
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from src import parquet_transformer
+from src.parquet_profiles import WriterProfile
+
+CSV = """id,amount,status,created_at,day,note
+1,10.5,pending,2024-01-01 10:00:00,2024-01-01,
+2,,completed,2024-01-02 11:30:00,2024-01-02,
+"""
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / 'finanzas_things.csv'
+    path.write_text(CSV + ''.join(f'{i},1.0,pending,2024-02-01 00:00:00,2024-02-01,\n' for i in range(3, 2000)))
+    return path
+
+
+def convert(csv_path, tmp_path, streaming: bool, **kwargs) -> pq.ParquetFile:
+    out = tmp_path / f'streaming={streaming}.parquet'
+    parquet_transformer.csv_to_parquet(csv_path, out, streaming=streaming, block_size=4096, **kwargs)
+    return pq.ParquetFile(out)
+
+
+def test_inferred_types_follow_pandas_in_every_mode(csv_path, tmp_path):
+    whole, streamed = convert(csv_path, tmp_path, False), convert(csv_path, tmp_path, True)
+
+    assert whole.schema_arrow == streamed.schema_arrow
+    assert whole.schema_arrow.types == [
+        pa.int64(), pa.float64(), pa.large_string(), pa.large_string(), pa.large_string(), pa.float64(),
+    ]
+
+
+def test_streamed_blocks_are_regrouped_like_the_single_pass(csv_path, tmp_path):
+    whole, streamed = convert(csv_path, tmp_path, False), convert(csv_path, tmp_path, True)
+    assert streamed.metadata.num_row_groups == whole.metadata.num_row_groups == 1
+
+    profile = WriterProfile('small-groups', row_group_size=500)
+    whole = convert(csv_path, tmp_path, False, profile=profile)
+    streamed = convert(csv_path, tmp_path, True, profile=profile)
+    sizes = [streamed.metadata.row_group(i).num_rows for i in range(streamed.metadata.num_row_groups)]
+    assert sizes == [whole.metadata.row_group(i).num_rows for i in range(whole.metadata.num_row_groups)]
+    assert sizes == [500, 500, 500, 499]
@@ -0,0 +1,57 @@
+"""Hive-partitioned writes: each publish replaces the entity's whole snapshot."""
+from datetime import datetime
+from pathlib import Path
+
+import pyarrow as pa
+import pytest
+
+from src import partitioning
+from src.parquet_profiles import DEFAULT_PROFILE
+from src.partitioning import PartitionField
+
+SPEC = [PartitionField('year', 'day', 'year'), PartitionField('month', 'day', 'month')]
+
+
+@pytest.fixture(autouse=True)
+def staging(monkeypatch, tmp_path):
+    monkeypatch.setattr(partitioning, 'STAGING_ROOT', tmp_path / '.staging')
+
+
+def write(output_dir: Path, days: list[datetime]) -> list[Path]:
+    table = pa.table({'id': list(range(len(days))), 'day': pa.array(days, pa.timestamp('s'))})
+    table = partitioning.add_partition_columns(table, SPEC)
+    written = partitioning.write_partitioned(table, table.schema, output_dir, SPEC, 'things', {}, DEFAULT_PROFILE)
+    return [Path(path) for path in written]
+
+
+def layout(output_dir: Path) -> list[str]:
+    return sorted(path.relative_to(output_dir).as_posix() for path in output_dir.rglob('*') if path.is_file())
+
+
+def test_partitions_missing_from_the_new_snapshot_are_removed(tmp_path):
+    output_dir = tmp_path / 'things'
+    write(output_dir, [datetime(2023, 12, 5), datetime(2024, 1, 5), datetime(2024, 2, 5)])
+
+    write(output_dir, [datetime(2024, 1, 6)])
+
+    assert layout(output_dir) == ['year=2024/month=1/things-0.parquet']
+
+
+def test_switching_layout_clears_the_run_date_folders(tmp_path):
+    output_dir = tmp_path / 'things'
+    (output_dir / 'date=2024-01-01').mkdir(parents=True)
+    (output_dir / 'date=2024-01-01' / 'things.parquet').write_bytes(b'old snapshot')
+
+    write(output_dir, [datetime(2024, 3, 1)])
+
+    assert layout(output_dir) == ['year=2024/month=3/things-0.parquet']
+
+
+def test_falling_back_to_a_single_file_drops_the_partitions(tmp_path):
+    output_dir = tmp_path / 'things'
+    write(output_dir, [datetime(2024, 3, 1)])
+    (output_dir / 'date=2024-04-01').mkdir()
+
+    partitioning.remove_partition_dirs(output_dir, SPEC)
+
+    assert [path.name for path in output_dir.iterdir()] == ['date=2024-04-01']
@@ -0,0 +1,56 @@
+"""Local query engine: grouping dictionary columns and choosing an entity's layout."""
+import os
+from datetime import datetime
+
+import pyarrow as pa
+import pyarrow.fs as pafs
+import pyarrow.parquet as pq
+
+from src import query_engine
+
+
+def write(path, table: pa.Table, **kwargs) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    pq.write_table(table, path, **kwargs)
+
+
+def status_table(statuses: list[str]) -> pa.Table:
+    return pa.table({'status': pa.array(statuses).dictionary_encode(), 'amount': [1] * len(statuses)})
+
+
+def test_aggregate_groups_dictionary_columns_across_row_groups(tmp_path):
+    # Written batch by batch like the streaming writer: one dictionary per row group
+    path = tmp_path / 'loans' / 'loans.parquet'
+    path.parent.mkdir()
+    batches = [['active'] * 70, ['late'] * 60 + ['active'], ['paid'] * 70]
+    with pq.ParquetWriter(path, status_table(['active']).schema) as writer:
+        for statuses in batches:
+            writer.write_table(status_table(statuses))
+
+    result = query_engine.aggregate('loans', ['status'], [('amount', 'sum')], root=tmp_path)
+
+    assert dict(zip(result['status'].to_pylist(), result['amount_sum'].to_pylist())) == {
+        'active': 71, 'late': 60, 'paid': 70,
+    }
+
+
+def test_newer_snapshot_wins_over_stale_hive_partitions(tmp_path):
+    entity_dir = tmp_path / 'things'
+    write(entity_dir / 'year=2024' / 'things-0.parquet', pa.table({'id': [1]}))
+    os.utime(entity_dir / 'year=2024' / 'things-0.parquet', (0, 0))
+    write(entity_dir / 'date=2024-05-01' / 'things.parquet', pa.table({'id': [2]}))
+
+    files = query_engine.list_entity_files(pafs.LocalFileSystem(), str(entity_dir))
+
+    assert [os.path.relpath(path, entity_dir) for path in files] == ['date=2024-05-01/things.parquet']
+
+
+def test_date_range_filter_matches_text_dates(tmp_path):
+    write(tmp_path / 'transactions' / 'transactions.parquet',
+          pa.table({'transaction_date': ['2023-12-31 23:00:00', '2024-01-01 00:00:00', '2024-02-01 10:00:00']}))
+    dataset = query_engine.open_dataset('transactions', tmp_path)
+
+    since = query_engine.date_range_filter('transactions', dataset, 'transaction_date', start=datetime(2024, 1, 1))
+
+    assert dataset.count_rows(filter=since) == 2
+    assert query_engine.estimate_scan('transactions', ['transaction_date'], since, tmp_path).row_groups_scanned == 1
@@ -0,0 +1,152 @@
+"""Shared retry policy: classification, backoff, budgets and throttle metrics."""
+import pytest
+from boto3.exceptions import S3UploadFailedError
+from botocore.exceptions import ClientError
+
+from src import aws_clients, metrics, retry
+
+from .conftest import Flaky, client_error
+
+real_backoff_delay = retry.backoff_delay
+pytestmark = pytest.mark.usefixtures('no_backoff')
+
+
+# ========================================
+# Classification
+# ========================================
+
+@pytest.mark.parametrize('error, retryable', [
+    (client_error('SlowDown', 503), True),
+    (client_error('ThrottlingException'), True),
+    (client_error('InternalError', 500), True),
+    (client_error('SomethingNew', 502), True),
+    (client_error('AccessDenied', 403), False),
+    (client_error('NoSuchKey', 404), False),
+    (ValueError('not an AWS error'), False),
+])
+def test_is_retryable(error, retryable):
+    assert retry.is_retryable(error) is retryable
+
+
+def test_wrapped_transfer_errors_are_classified_by_their_cause():
+    try:
+        try:
+            raise client_error('SlowDown', 503)
+        except ClientError as e:
+            raise S3UploadFailedError('upload failed') from e
+    except S3UploadFailedError as wrapped:
+        assert retry.is_retryable(wrapped)
+
+
+def test_backoff_delay_is_full_jitter_capped():
+    for attempt in range(16):
+        delays = [real_backoff_delay(attempt) for _ in range(50)]
+        assert all(0 <= delay <= min(retry.BACKOFF_CAP, retry.BACKOFF_BASE * 2 ** attempt) for delay in delays)
+    assert len(set(delays)) > 1
+
+
+# ========================================
+# Budgets and operation retries
+# ========================================
+
+def test_retry_budget_spends_and_refills_up_to_capacity():
+    budget = retry.RetryBudget(capacity=2, refill=0.5)
+
+    assert budget.spend() and budget.spend() and not budget.spend()
+    budget.refund()
+    budget.refund()
+    assert budget.spend()
+    budget.give_back()
+    budget.give_back()
+    budget.give_back()
+    assert budget.tokens == 2
+
+
+def test_call_retries_retryable_errors_then_returns():
+    fn = Flaky(client_error('SlowDown', 503), client_error('InternalError', 500))
+
+    assert retry.call('s3:upload', fn) == 'ok'
+    assert fn.calls == 3
+
+
+def test_call_raises_non_retryable_errors_at_once():
+    fn = Flaky(client_error('AccessDenied', 403))
+
+    with pytest.raises(ClientError):
+        retry.call('s3:upload', fn)
+    assert fn.calls == 1
+    assert retry.budget('s3:upload').tokens == retry.budget('s3:upload').capacity
+
+
+def test_call_gives_up_after_the_configured_attempts(monkeypatch):
+    monkeypatch.setattr(retry.config, 'AWS_OPERATION_ATTEMPTS', 3)
+    fn = Flaky(*[client_error('SlowDown', 503)] * 5)
+
+    with pytest.raises(ClientError):
+        retry.call('s3:upload', fn)
+    assert fn.calls == 3
+
+
+def test_an_exhausted_budget_stops_retries(monkeypatch):
+    monkeypatch.setattr(retry.config, 'AWS_RETRY_BUDGET', 1)
+    monkeypatch.setattr(retry.config, 'AWS_RETRY_BUDGET_REFILL', 0)
+
+    assert retry.call('glue:update_table', Flaky(client_error('Throttling'))) == 'ok'
+    fn = Flaky(client_error('Throttling'))
+    with pytest.raises(ClientError):
+        retry.call('glue:update_table', fn)
+    assert fn.calls == 1
+
+
+def test_should_retry_takes_a_token_from_every_budget_or_none():
+    empty, full = retry.RetryBudget(0), retry.RetryBudget(5)
+
+    assert not retry.should_retry('s3:put_object', client_error('SlowDown', 503), 0, 5, full, empty)
+    assert full.tokens == 5
+    assert retry.budget('s3:put_object').tokens == retry.budget('s3:put_object').capacity
+
+
+def counter(name: str, **labels: str) -> float:
+    return sum(
+        record['value'] for record in metrics.snapshot()
+        if record['name'] == name and labels.items() <= record['labels'].items()
+    )
+
+
+def test_retries_are_counted():
+    before = counter('aws_retries_total', operation='s3:copy')
+    retry.call('s3:copy', Flaky(client_error('SlowDown', 503)))
+
+    assert counter('aws_retries_total', operation='s3:copy') == before + 1
+
+
+# ========================================
+# Throttle metrics
+# ========================================
+
+def test_throttled_responses_are_counted_per_operation():
+    from botocore.awsrequest import AWSResponse
+
+    s3 = aws_clients.get_client('s3')
+    slow_down = b'<Error><Code>SlowDown</Code><Message>Reduce your request rate.</Message></Error>'
+    responses = iter([(503, slow_down), (200, b'')])
+
+    def respond(request, **kwargs) -> AWSResponse:
+        status, body = next(responses)
+        return AWSResponse(request.url, status, {}, RawBody(body))
+
+    s3.meta.events.register('before-send.s3.HeadBucket', respond)
+    before = counter('aws_throttles_total', operation='HeadBucket')
+    s3.head_bucket(Bucket='throttled-bucket')
+
+    assert counter('aws_throttles_total', operation='HeadBucket') == before + 1
+
+
+class RawBody:
+    """Minimal urllib3-style body for a canned AWSResponse."""
+
+    def __init__(self, body: bytes):
+        self.body = body
+
+    def stream(self, **kwargs):
+        yield self.body
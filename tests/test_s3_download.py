@@ -0,0 +1,111 @@
+"""Parallel, resumable range downloads against moto S3."""
+import os
+
+import pytest
+from botocore.exceptions import EndpointConnectionError
+
+from src import s3_download
+
+from .conftest import BUCKET
+
+
+@pytest.fixture
+def remote_objects(s3) -> dict[str, bytes]:
+    """A multi-range object, a small one, an empty one and a folder marker under data/."""
+    objects = {'data/a/big.bin': os.urandom(3 * 1000 * 1000 + 3), 'data/small.txt': b'hello', 'data/empty': b''}
+    for key, body in objects.items():
+        s3.put_object(Bucket=BUCKET, Key=key, Body=body)
+    s3.put_object(Bucket=BUCKET, Key='data/folder/', Body=b'')
+    return objects
+
+
+def assert_downloaded(local_dir, objects: dict[str, bytes]) -> None:
+    for key, body in objects.items():
+        assert (local_dir / key.removeprefix('data/')).read_bytes() == body
+    assert not [path for path in local_dir.rglob('.*')], 'no .part/.progress files left behind'
+
+
+def test_download_prefix_fetches_every_object_in_ranges(remote_objects, tmp_path):
+    summary = s3_download.download_prefix(BUCKET, 'data/', tmp_path, part_size=1000 * 1000, max_workers=4)
+
+    assert (summary.succeeded, summary.failed) == (3, 0)
+    assert summary.total_bytes == sum(len(body) for body in remote_objects.values())
+    assert_downloaded(tmp_path, remote_objects)
+
+
+def test_interrupted_download_resumes_missing_ranges_only(remote_objects, tmp_path, monkeypatch):
+    fetch_range = s3_download._fetch_range
+    fetched = []
+
+    def dropped_connection(s3, bucket_name, download, index):
+        if download.obj.key.endswith('big.bin') and index in (1, 2):
+            raise EndpointConnectionError(endpoint_url='https://s3.amazonaws.com')
+        fetched.append((download.obj.key, index))
+        return fetch_range(s3, bucket_name, download, index)
+
+    monkeypatch.setattr(s3_download, '_fetch_range', dropped_connection)
+    first = s3_download.download_prefix(BUCKET, 'data/', tmp_path, part_size=1000 * 1000, max_workers=4)
+    assert (first.succeeded, first.failed) == (2, 1)
+    assert (tmp_path / 'a' / '.big.bin.part').exists() and not (tmp_path / 'a' / 'big.bin').exists()
+
+    fetched.clear()
+    monkeypatch.setattr(s3_download, '_fetch_range', lambda *args: (fetched.append(args[2:]), fetch_range(*args)))
+    second = s3_download.download_prefix(BUCKET, 'data/', tmp_path, part_size=1000 * 1000, max_workers=4)
+
+    assert (second.succeeded, second.failed) == (3, 0)
+    assert sorted(index for _, index in fetched) == [1, 2]
+    assert_downloaded(tmp_path, remote_objects)
+
+
+def test_up_to_date_files_are_skipped(remote_objects, tmp_path):
+    s3_download.download_prefix(BUCKET, 'data/', tmp_path)
+    summary = s3_download.download_prefix(BUCKET, 'data/', tmp_path)
+
+    assert [result.skipped for result in summary.results] == [True, True, True]
+
+
+def test_replaced_object_restarts_its_download(s3, remote_objects, tmp_path, monkeypatch):
+    fetch_range = s3_download._fetch_range
+
+    def fail_last_range(s3_client, bucket_name, download, index):
+        if index == download.num_parts - 1:
+            raise OSError('disk full')
+        return fetch_range(s3_client, bucket_name, download, index)
+
+    monkeypatch.setattr(s3_download, '_fetch_range', fail_last_range)
+    s3_download.download_prefix(BUCKET, 'data/a/', tmp_path, part_size=1000 * 1000)
+    monkeypatch.setattr(s3_download, '_fetch_range', fetch_range)
+
+    replacement = os.urandom(2 * 1000 * 1000)
+    s3.put_object(Bucket=BUCKET, Key='data/a/big.bin', Body=replacement)
+    summary = s3_download.download_prefix(BUCKET, 'data/a/', tmp_path, part_size=1000 * 1000)
+
+    assert summary.succeeded == 1
+    assert (tmp_path / 'big.bin').read_bytes() == replacement
+
+
+def test_files_are_opened_lazily_not_all_up_front(s3, tmp_path, monkeypatch):
+    for i in range(40):
+        s3.put_object(Bucket=BUCKET, Key=f'many/{i}.bin', Body=b'x' * 100)
+    opened, open_ = [], s3_download._open
+
+    def counting_open(download):
+        opened.append(sum(1 for d in counting_open.live if d.fd >= 0))
+        counting_open.live.append(download)
+        open_(download)
+
+    counting_open.live = []
+    monkeypatch.setattr(s3_download, '_open', counting_open)
+    summary = s3_download.download_prefix(BUCKET, 'many/', tmp_path, max_workers=2)
+
+    assert summary.succeeded == 40
+    # In-flight ranges plus finished ones the main thread has not closed yet; never the whole batch
+    assert max(opened) < 10
+    assert all(download.fd == -1 for download in counting_open.live)
+
+
+def test_download_keys_skips_missing_keys(remote_objects, tmp_path):
+    summary = s3_download.download_keys(BUCKET, ['data/small.txt', 'data/missing'], tmp_path)
+
+    assert [result.s3_key for result in summary.results] == ['data/small.txt']
+    assert (tmp_path / 'data' / 'small.txt').read_bytes() == b'hello'
@@ -0,0 +1,82 @@
+"""Uploads that skip objects whose ETag already matches, against moto S3."""
+import os
+
+import pytest
+
+from src import checksums
+from src.s3_client import upload_files
+
+from .conftest import BUCKET
+
+PART_SIZE = 5 * 1024 * 1024  # S3's minimum multipart part size
+
+
+@pytest.fixture(autouse=True)
+def etag_cache(monkeypatch, tmp_path):
+    """Keep the ETag cache out of data/."""
+    cache_path = tmp_path / 'etag_cache.json'
+    monkeypatch.setattr(checksums.load_cache, '__defaults__', (cache_path,))
+    monkeypatch.setattr(checksums.save_cache, '__defaults__', (cache_path,))
+
+
+@pytest.fixture
+def local_files(tmp_path) -> list:
+    """Empty, small, exactly one part, and multipart files with their keys."""
+    files = []
+    for i, size in enumerate([0, 1000, PART_SIZE, 2 * PART_SIZE + 7]):
+        path = tmp_path / 'local' / f'f{i}.bin'
+        path.parent.mkdir(exist_ok=True)
+        path.write_bytes(os.urandom(size))
+        files.append((path, f'raw/finanzas/entity{i % 2}/date=2024-01-01/f{i}.bin'))
+    return files
+
+
+def skipped(summary) -> int:
+    return sum(result.skipped for result in summary.results)
+
+
+def test_file_etag_matches_the_etag_s3_assigns(s3, local_files):
+    upload_files(BUCKET, local_files, multipart_chunksize=PART_SIZE, skip_unchanged=False)
+
+    for path, key in local_files:
+        remote = s3.head_object(Bucket=BUCKET, Key=key)['ETag'].strip('"')
+        assert checksums.file_etag(path, PART_SIZE) == remote
+
+
+def test_unchanged_files_are_not_uploaded_again(s3, local_files):
+    first = upload_files(BUCKET, local_files, multipart_chunksize=PART_SIZE)
+    second = upload_files(BUCKET, local_files, multipart_chunksize=PART_SIZE)
+
+    assert (first.succeeded, skipped(first)) == (4, 0)
+    assert (second.succeeded, skipped(second), second.total_bytes) == (4, 4, 0)
+
+
+def test_changed_files_are_uploaded(s3, local_files):
+    upload_files(BUCKET, local_files, multipart_chunksize=PART_SIZE)
+    changed_path, changed_key = local_files[1]
+    changed_path.write_bytes(os.urandom(1000))
+
+    summary = upload_files(BUCKET, local_files, multipart_chunksize=PART_SIZE)
+
+    assert skipped(summary) == 3
+    assert [result.s3_key for result in summary.results if not result.skipped] == [changed_key]
+    assert s3.get_object(Bucket=BUCKET, Key=changed_key)['Body'].read() == changed_path.read_bytes()
+
+
+def test_etags_are_cached_between_runs(s3, local_files, monkeypatch):
+    upload_files(BUCKET, local_files, multipart_chunksize=PART_SIZE)
+    upload_files(BUCKET, local_files, multipart_chunksize=PART_SIZE)
+    assert len(checksums.load_cache()) == len(local_files)
+
+    def no_hashing(*args):
+        raise AssertionError('unchanged files must not be re-hashed')
+
+    monkeypatch.setattr(checksums, 'file_etag', no_hashing)
+    assert skipped(upload_files(BUCKET, local_files, multipart_chunksize=PART_SIZE)) == 4
+
+
+def test_skip_unchanged_can_be_turned_off(s3, local_files):
+    upload_files(BUCKET, local_files, multipart_chunksize=PART_SIZE)
+
+    assert skipped(upload_files(BUCKET, local_files, multipart_chunksize=PART_SIZE, skip_unchanged=False)) == 0
+